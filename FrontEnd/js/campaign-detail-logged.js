@@ -46,13 +46,15 @@ function calculateDaysLeft(expirationDate) {
 }
 
 let currentCampaign = null;
+let currentRewards = [];
 let isFavorite = false;
 let userTotalDonated = 0;
 let userClaimedRewards = [];
 
-async function loadCampaignDetail() {
+// Una sola petición trae campaña, recompensas, mejores donantes y el estado del usuario
+async function loadCampaignPage() {
   const campaignId = getCampaignId();
-  const token = localStorage.getItem('token');
+  const token = getToken();
 
   if (!campaignId) {
     window.location.href = './index-logged.html';
@@ -60,25 +62,33 @@ async function loadCampaignDetail() {
   }
 
   try {
-    let response;
-    if (token) {
-      response = await fetch(`${API_URL}/campaigns/${campaignId}`, {
-        headers: { 'Authorization': `Bearer ${token}` }
-      });
-    }
-
-    if (!response || !response.ok) {
-      response = await fetch(`${API_URL}/campaigns/public/${campaignId}`);
-    }
+    const response = await fetch(`${API_URL}/campaigns/${campaignId}/page?donors_limit=5`, {
+      headers: token ? { 'Authorization': `Bearer ${token}` } : {}
+    });
 
     if (!response.ok) {
       throw new Error('Campaña no encontrada');
     }
 
-    currentCampaign = await response.json();
+    const page = await response.json();
+    const firstLoad = currentCampaign === null;
+
+    currentCampaign = page.campaign;
+    currentRewards = page.rewards;
+    if (page.viewer) {
+      isFavorite = page.viewer.is_favorite;
+      userTotalDonated = page.viewer.total_donated || 0;
+      userClaimedRewards = page.viewer.claimed_reward_ids || [];
+    }
+
     renderCampaignDetail(currentCampaign);
+    renderFavoriteStatus();
+    renderRewards(currentRewards);
+    renderTopDonors(page.top_donors);
 
-    await checkFavoriteStatus();
+    if (firstLoad && currentCampaign.workflow_state_id === 5) {
+      watchCampaignProgress(currentCampaign.id);
+    }
 
   } catch (error) {
     console.error('Error cargando campaña:', error);
@@ -86,29 +96,35 @@ async function loadCampaignDetail() {
   }
 }
 
-async function checkFavoriteStatus() {
-  const campaignId = getCampaignId();
-  const token = getToken();
+function renderFavoriteStatus() {
   const favoriteBtn = document.querySelector('.add_favorite');
 
-  if (!token || !favoriteBtn) return;
+  if (!favoriteBtn || !isFavorite) return;
 
-  try {
-    const response = await fetch(`${API_URL}/favorites/check/${campaignId}`, {
-      headers: { 'Authorization': `Bearer ${token}` }
-    });
+  favoriteBtn.style.color = '#FF7A59';
+  favoriteBtn.innerHTML = '<i class="fa-solid fa-bookmark"></i> En favoritos';
+}
 
-    if (response.ok) {
-      const data = await response.json();
-      if (data.is_favorite) {
-        isFavorite = true;
-        favoriteBtn.style.color = '#FF7A59';
-        favoriteBtn.innerHTML = '<i class="fa-solid fa-bookmark"></i> En favoritos';
-      }
-    }
-  } catch (error) {
-    console.error('Error verificando favoritos:', error);
-  }
+function renderProgress(currentAmount, goalAmount) {
+  const progress = goalAmount > 0
+    ? (currentAmount / goalAmount * 100)
+    : 0;
+
+  document.querySelector('.detail_progress_fill').style.width = `${Math.min(progress, 100)}%`;
+  document.querySelector('.funding_text').textContent =
+    `${formatCurrency(currentAmount)} de ${formatCurrency(goalAmount)} | ${progress.toFixed(0)}% financiado`;
+}
+
+// Actualiza la barra de progreso en vivo cuando se confirman nuevas donaciones
+function watchCampaignProgress(campaignId) {
+  if (!window.EventSource) return;
+
+  const source = new EventSource(`${API_URL}/campaigns/${campaignId}/progress/stream`);
+
+  source.addEventListener('progress', (event) => {
+    const data = JSON.parse(event.data);
+    renderProgress(data.current_amount, data.goal_amount);
+  });
 }
 
 function renderCampaignDetail(campaign) {
@@ -130,13 +146,7 @@ function renderCampaignDetail(campaign) {
 
   document.querySelector('.campaign_short_description').textContent = campaign.description || 'Sin descripción disponible';
 
-  const progress = campaign.goal_amount > 0
-    ? (campaign.current_amount / campaign.goal_amount * 100)
-    : 0;
-
-  document.querySelector('.detail_progress_fill').style.width = `${Math.min(progress, 100)}%`;
-  document.querySelector('.funding_text').textContent =
-    `${formatCurrency(campaign.current_amount)} de ${formatCurrency(campaign.goal_amount)} | ${progress.toFixed(0)}% financiado`;
+  renderProgress(campaign.current_amount, campaign.goal_amount);
 
   const daysLeft = calculateDaysLeft(campaign.expiration_date);
   const daysElement = document.querySelector('.days_count');
@@ -157,46 +167,6 @@ function renderCampaignDetail(campaign) {
   document.title = `${campaign.tittle} - RiseUp`;
 }
 
-async function loadRewards() {
-  const campaignId = getCampaignId();
-  const token = getToken();
-  if (!campaignId) return;
-
-  try {
-    const rewardsResponse = await fetch(`${API_URL}/rewards/campaign/${campaignId}`);
-    const rewards = await rewardsResponse.json();
-
-    if (token) {
-      try {
-        const totalResponse = await fetch(`${API_URL}/rewards/campaign/${campaignId}/my-total`, {
-          headers: { 'Authorization': `Bearer ${token}` }
-        });
-        if (totalResponse.ok) {
-          const totalData = await totalResponse.json();
-          userTotalDonated = totalData.total_donated || 0;
-        }
-      } catch (e) {
-        console.error('Error cargando total donado:', e);
-      }
-
-      try {
-        const claimsResponse = await fetch(`${API_URL}/rewards/campaign/${campaignId}/my-claims`, {
-          headers: { 'Authorization': `Bearer ${token}` }
-        });
-        if (claimsResponse.ok) {
-          userClaimedRewards = await claimsResponse.json();
-        }
-      } catch (e) {
-        console.error('Error cargando claims:', e);
-      }
-    }
-
-    renderRewards(rewards);
-  } catch (error) {
-    console.error('Error cargando recompensas:', error);
-  }
-}
-
 function renderRewards(rewards) {
   const rewardsGrid = document.querySelector('.rewards_grid');
 
@@ -267,7 +237,7 @@ async function claimReward(rewardId) {
       const claim = await response.json();
       showMessage(`¡Has reclamado la recompensa "${claim.reward_title}" exitosamente!`);
       userClaimedRewards.push(rewardId);
-      loadRewards();
+      renderRewards(currentRewards);
     } else {
       const error = await response.json();
       showMessage(error.detail || 'Error al reclamar la recompensa', true);
@@ -278,19 +248,6 @@ async function claimReward(rewardId) {
   }
 }
 
-async function loadTopDonors() {
-  const campaignId = getCampaignId();
-  if (!campaignId) return;
-
-  try {
-    const response = await fetch(`${API_URL}/donations/campaign/${campaignId}/top-donors?limit=5`);
-    const donors = await response.json();
-    renderTopDonors(donors);
-  } catch (error) {
-    console.error('Error cargando donadores:', error);
-  }
-}
-
 function renderTopDonors(donors) {
   const donatorsList = document.querySelector('.donators_list');
 
@@ -393,11 +350,7 @@ async function confirmDonation() {
       window.location.href = donation.payment_url;
     } else {
       showSuccess('¡Donación realizada con éxito! Gracias por tu apoyo.');
-      setTimeout(() => {
-        loadCampaignDetail();
-        loadTopDonors();
-        loadRewards();
-      }, 500);
+      setTimeout(loadCampaignPage, 500);
     }
 
   } catch (error) {
@@ -459,9 +412,7 @@ async function handleFavorite(e) {
 }
 
 window.onload = function() {
-  loadCampaignDetail();
-  loadRewards();
-  loadTopDonors();
+  loadCampaignPage();
 
   const donateBtn = document.querySelector('.btn_donate');
   donateBtn.addEventListener('click', handleDonate);
@@ -40,12 +40,38 @@ async function loadCampaignDetail() {
     const campaign = await response.json();
     renderCampaignDetail(campaign);
 
+    if (campaign.workflow_state_id === 5) {
+      watchCampaignProgress(campaign.id);
+    }
+
   } catch (error) {
     console.error('Error cargando campaña:', error);
     window.location.href = './index.html';
   }
 }
 
+function renderProgress(currentAmount, goalAmount) {
+  const progress = goalAmount > 0
+    ? (currentAmount / goalAmount * 100)
+    : 0;
+
+  document.querySelector('.detail_progress_fill').style.width = `${Math.min(progress, 100)}%`;
+  document.querySelector('.funding_text').textContent =
+    `${formatCurrency(currentAmount)} de ${formatCurrency(goalAmount)} | ${progress.toFixed(0)}% financiado`;
+}
+
+// Actualiza la barra de progreso en vivo cuando se confirman nuevas donaciones
+function watchCampaignProgress(campaignId) {
+  if (!window.EventSource) return;
+
+  const source = new EventSource(`${API_URL}/campaigns/${campaignId}/progress/stream`);
+
+  source.addEventListener('progress', (event) => {
+    const data = JSON.parse(event.data);
+    renderProgress(data.current_amount, data.goal_amount);
+  });
+}
+
 function renderCampaignDetail(campaign) {
   const heroImage = document.querySelector('.campaign_hero_left img');
   heroImage.src = campaign.main_image_url || 'https://placehold.co/800x500/FF7A59/FFFFFF?text=Sin+Imagen';
@@ -59,13 +85,7 @@ function renderCampaignDetail(campaign) {
 
   document.querySelector('.campaign_short_description').textContent = campaign.description || 'Sin descripción disponible';
 
-  const progress = campaign.goal_amount > 0
-    ? (campaign.current_amount / campaign.goal_amount * 100)
-    : 0;
-
-  document.querySelector('.detail_progress_fill').style.width = `${Math.min(progress, 100)}%`;
-  document.querySelector('.funding_text').textContent =
-    `${formatCurrency(campaign.current_amount)} de ${formatCurrency(campaign.goal_amount)} | ${progress.toFixed(0)}% financiado`;
+  renderProgress(campaign.current_amount, campaign.goal_amount);
 
   const daysLeft = calculateDaysLeft(campaign.expiration_date);
   const daysElement = document.querySelector('.days_count');
@@ -87,34 +87,9 @@ function createCarouselCard(campaign) {
   `;
 }
 
-async function loadFeaturedCampaigns() {
+// Destacadas, populares y categorías llegan en una sola petición a /home
+async function loadHome() {
   const carouselTrack = document.querySelector('.carousel_track');
-  const indicatorsContainer = document.querySelector('.carousel_indicators');
-
-  try {
-    const response = await fetch(`${API_URL}/campaigns/featured?limit=5`);
-    const campaigns = await response.json();
-
-    if (campaigns.length === 0) {
-      carouselTrack.innerHTML = '<p style="text-align:center; padding: 2rem;">No hay campañas destacadas.</p>';
-      return;
-    }
-
-    carouselTrack.innerHTML = campaigns.map(campaign => createCarouselCard(campaign)).join('');
-
-    indicatorsContainer.innerHTML = campaigns.map((_, index) =>
-      `<button class="indicator ${index === 0 ? 'active' : ''}" data-slide="${index}"></button>`
-    ).join('');
-
-    initCarousel(campaigns.length);
-
-  } catch (error) {
-    console.error('Error cargando campañas destacadas:', error);
-    carouselTrack.innerHTML = '<p style="text-align:center; padding: 2rem; color: red;">Error al cargar campañas.</p>';
-  }
-}
-
-async function loadPopularCampaigns() {
   const campaignsGrid = document.querySelector('.campaigns_grid');
 
   campaignsGrid.innerHTML = `
@@ -125,23 +100,16 @@ async function loadPopularCampaigns() {
   `;
 
   try {
-    const response = await fetch(`${API_URL}/campaigns/popular?limit=9`);
-    const campaigns = await response.json();
-
-    if (campaigns.length === 0) {
-      campaignsGrid.innerHTML = `
-        <div class="no_campaigns">
-          <i class="fa-solid fa-folder-open"></i>
-          <p>No hay campañas disponibles.</p>
-        </div>
-      `;
-      return;
-    }
+    const response = await fetch(`${API_URL}/home?featured_limit=5&popular_limit=9`);
+    if (!response.ok) throw new Error('Error al cargar el inicio');
+    const home = await response.json();
 
-    campaignsGrid.innerHTML = campaigns.map(campaign => createCampaignCard(campaign)).join('');
+    renderFeaturedCampaigns(home.featured);
+    renderPopularCampaigns(home.popular);
 
   } catch (error) {
     console.error('Error cargando campañas:', error);
+    carouselTrack.innerHTML = '<p style="text-align:center; padding: 2rem; color: red;">Error al cargar campañas.</p>';
     campaignsGrid.innerHTML = `
       <div class="error_campaigns">
         <i class="fa-solid fa-exclamation-triangle"></i>
@@ -151,6 +119,40 @@ async function loadPopularCampaigns() {
   }
 }
 
+function renderFeaturedCampaigns(campaigns) {
+  const carouselTrack = document.querySelector('.carousel_track');
+  const indicatorsContainer = document.querySelector('.carousel_indicators');
+
+  if (campaigns.length === 0) {
+    carouselTrack.innerHTML = '<p style="text-align:center; padding: 2rem;">No hay campañas destacadas.</p>';
+    return;
+  }
+
+  carouselTrack.innerHTML = campaigns.map(campaign => createCarouselCard(campaign)).join('');
+
+  indicatorsContainer.innerHTML = campaigns.map((_, index) =>
+    `<button class="indicator ${index === 0 ? 'active' : ''}" data-slide="${index}"></button>`
+  ).join('');
+
+  initCarousel(campaigns.length);
+}
+
+function renderPopularCampaigns(campaigns) {
+  const campaignsGrid = document.querySelector('.campaigns_grid');
+
+  if (campaigns.length === 0) {
+    campaignsGrid.innerHTML = `
+      <div class="no_campaigns">
+        <i class="fa-solid fa-folder-open"></i>
+        <p>No hay campañas disponibles.</p>
+      </div>
+    `;
+    return;
+  }
+
+  campaignsGrid.innerHTML = campaigns.map(campaign => createCampaignCard(campaign)).join('');
+}
+
 function initCarousel(totalSlides) {
   let currentSlide = 0;
   const cards = document.querySelectorAll('.carousel_track .campaign_card');
@@ -199,6 +201,5 @@ function initCarousel(totalSlides) {
 }
 
 window.onload = function() {
-  loadFeaturedCampaigns();
-  loadPopularCampaigns();
+  loadHome();
 };
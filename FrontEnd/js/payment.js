@@ -4,6 +4,27 @@ const donationId = params.get('donation_id');
 const gatewayId = params.get('gateway_id');
 const campaignId = params.get('campaign_id');
 
+let pollingInterval = null;
+
+function applyPaymentStatus(data) {
+  document.getElementById('paymentAmount').textContent = `$${data.amount.toFixed(2)}`;
+
+  if (data.state_id === 2) {
+    showSuccess('Pago completado exitosamente');
+    setTimeout(() => {
+      window.location.href = './donations.html';
+    }, 2000);
+  } else if (data.state_id === 3) {
+    showError('Pago cancelado');
+    setTimeout(() => {
+      window.location.href = `./campaign-detail-logged.html?id=${campaignId}`;
+    }, 2000);
+  } else {
+    showPending('Pago pendiente. Escanea el QR o simula el pago.');
+    loadQR();
+  }
+}
+
 async function checkPaymentStatus() {
   const token = localStorage.getItem('token');
 
@@ -21,22 +42,9 @@ async function checkPaymentStatus() {
 
     if (response.ok) {
       const data = await response.json();
-
-      document.getElementById('paymentAmount').textContent = `$${data.amount.toFixed(2)}`;
-
-      if (data.state_id === 2) {
-        showSuccess('Pago completado exitosamente');
-        setTimeout(() => {
-          window.location.href = './donations.html';
-        }, 2000);
-      } else if (data.state_id === 3) {
-        showError('Pago cancelado');
-        setTimeout(() => {
-          window.location.href = `./campaign-detail-logged.html?id=${campaignId}`;
-        }, 2000);
-      } else {
-        showPending('Pago pendiente. Escanea el QR o simula el pago.');
-        loadQR();
+      applyPaymentStatus(data);
+      if (data.state_id !== 1 && pollingInterval) {
+        clearInterval(pollingInterval);
       }
     } else {
       showError('Error al verificar el estado del pago');
@@ -47,6 +55,67 @@ async function checkPaymentStatus() {
   }
 }
 
+function startPolling() {
+  checkPaymentStatus();
+  pollingInterval = setInterval(checkPaymentStatus, 5000);
+}
+
+// Recibe el cambio de estado por Server-Sent Events; si el stream falla vuelve al sondeo
+async function watchPaymentStatus() {
+  const token = localStorage.getItem('token');
+
+  if (!donationId) {
+    showError('ID de donación no válido');
+    return;
+  }
+
+  let lastState = null;
+  let streamFailed = false;
+
+  try {
+    const response = await fetch(`${API_URL}/donations/status/${donationId}/stream`, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    });
+
+    if (!response.ok || !response.body) {
+      throw new Error(`Stream no disponible (${response.status})`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const events = buffer.split('\n\n');
+      buffer = events.pop();
+
+      for (const event of events) {
+        const dataLine = event.split('\n').find(line => line.startsWith('data: '));
+        if (!dataLine) continue;
+
+        const data = JSON.parse(dataLine.slice(6));
+        lastState = data.state_id;
+        applyPaymentStatus(data);
+      }
+    }
+  } catch (error) {
+    console.error('Error:', error);
+    streamFailed = true;
+  }
+
+  if (streamFailed || lastState === null) {
+    startPolling();
+  } else if (lastState === 1) {
+    watchPaymentStatus();
+  }
+}
+
 async function loadQR() {
   if (!gatewayId) return;
 
@@ -157,6 +226,5 @@ function showError(message) {
 }
 
 document.addEventListener('DOMContentLoaded', function() {
-  checkPaymentStatus();
-  setInterval(checkPaymentStatus, 5000);
+  watchPaymentStatus();
 });
@@ -21,6 +21,7 @@
       grid.innerHTML = categories.map(cat => `
         <a href="${categoryPage}?category=${cat.id}" class="search_category_card">
           ${cat.name}
+          <span class="search_category_count">${cat.campaigns_count || 0}</span>
         </a>
       `).join('');
     } catch (error) {
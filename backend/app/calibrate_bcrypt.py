@@ -0,0 +1,29 @@
+import sys
+import time
+import bcrypt
+
+def measure(rounds: int, samples: int) -> float:
+
+    salt = bcrypt.gensalt(rounds=rounds)
+    started = time.perf_counter()
+    for _ in range(samples):
+        bcrypt.hashpw(b"calibracion-riseup", salt)
+    return (time.perf_counter() - started) * 1000 / samples
+
+def calibrate(target_ms: float, samples: int = 3):
+
+    chosen = 10
+    print(f"Objetivo: {target_ms:.0f} ms por hash\n")
+
+    for rounds in range(10, 16):
+        elapsed = measure(rounds, samples)
+        print(f"  rounds={rounds}: {elapsed:.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = rounds
+
+    print(f"\nBCRYPT_ROUNDS recomendado: {chosen}")
+    return chosen
+
+if __name__ == "__main__":
+    calibrate(float(sys.argv[1]) if len(sys.argv) > 1 else 250)
@@ -0,0 +1,65 @@
+import hashlib
+import json
+from typing import Any, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+def make_etag(body: bytes, weak: bool = False) -> str:
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return "W/" + etag if weak else etag
+
+def version_etag(*parts: Any, weak: bool = False) -> str:
+    return make_etag("|".join(str(part) for part in parts).encode("utf-8"), weak=weak)
+
+def etag_matches(request: Request, etag: str) -> bool:
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match usa comparación débil: se ignora el prefijo W/ en ambos lados
+    opaque = etag.removeprefix("W/")
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return opaque in candidates
+
+def json_body(payload: Any) -> bytes:
+
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+def json_snapshot(payload: Any) -> Tuple[bytes, str]:
+
+    body = json_body(payload)
+    return body, make_etag(body)
+
+def cache_headers(etag: str, cache_control: str, vary: str = None) -> dict:
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if vary:
+        headers["Vary"] = vary
+    return headers
+
+def not_modified(request: Request, etag: str, cache_control: str = "no-cache", vary: str = None) -> Optional[Response]:
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag, cache_control, vary))
+    return None
+
+def etag_response(request: Request, payload: Any, cache_control: str = "no-cache", vary: str = None, etag: str = None) -> Response:
+
+    body = json_body(payload)
+    return snapshot_response(request, body, etag or make_etag(body), cache_control, vary)
+
+def snapshot_response(request: Request, body: bytes, etag: str, cache_control: str = "no-cache", vary: str = None) -> Response:
+
+    response = not_modified(request, etag, cache_control, vary)
+    if response is not None:
+        return response
+
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag, cache_control, vary))
@@ -0,0 +1,38 @@
+from collections import deque
+from typing import Callable, Deque, Dict
+
+_sources: Dict[str, Callable[[], dict]] = {}
+
+def register(name: str, source: Callable[[], dict]):
+    _sources[name] = source
+
+def snapshot() -> dict:
+    return {name: source() for name, source in sorted(_sources.items())}
+
+class LatencyStats:
+
+    def __init__(self, window: int = 512):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    def stats(self) -> dict:
+
+        recent = sorted(self._recent)
+        p50 = recent[len(recent) // 2] if recent else 0.0
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            "p50_ms": round(p50 * 1000, 2),
+            "p95_ms": round(p95 * 1000, 2),
+            "max_ms": round(self.max * 1000, 2)
+        }
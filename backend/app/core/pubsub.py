@@ -0,0 +1,73 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Hashable, Set
+
+from app.core import metrics
+
+class SubscriptionLimitError(Exception):
+    pass
+
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+class PubSub:
+
+    def __init__(self, name: str, max_subscribers: int, queue_size: int = 16):
+        self.name = name
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self.subscribers = 0
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.rejected = 0
+        self._topics: Dict[Hashable, Set[asyncio.Queue]] = {}
+        metrics.register(f"pubsub.{name}", self.stats)
+
+    @asynccontextmanager
+    async def subscribe(self, topic: Hashable):
+
+        if self.subscribers >= self.max_subscribers:
+            self.rejected += 1
+            raise SubscriptionLimitError(f"Límite de suscriptores alcanzado en {self.name}")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._topics.setdefault(topic, set()).add(queue)
+        self.subscribers += 1
+
+        try:
+            yield queue
+        finally:
+            self.subscribers -= 1
+            queues = self._topics.get(topic)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._topics[topic]
+
+    def has_subscribers(self, topic: Hashable) -> bool:
+        return topic in self._topics
+
+    def publish(self, topic: Hashable, message: Any):
+
+        self.published += 1
+        for queue in self._topics.get(topic, ()):
+            if queue.full():
+                # Un suscriptor lento pierde el mensaje más antiguo, nunca bloquea al publicador
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+            self.delivered += 1
+
+    def stats(self) -> dict:
+
+        return {
+            "subscribers": self.subscribers,
+            "max_subscribers": self.max_subscribers,
+            "topics": len(self._topics),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "rejected": self.rejected
+        }
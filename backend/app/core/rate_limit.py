@@ -0,0 +1,172 @@
+import math
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import HTTPException, Request, status
+from sqlalchemy import delete, text
+from sqlmodel import select, func
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.rate_limit_event import RateLimitEvent
+
+class MemoryBackend:
+
+    name = "memory"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self.evictions = 0
+        self._windows: "OrderedDict[str, deque]" = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> float:
+
+        now = time.monotonic()
+        events = self._windows.get(key)
+        if events is None:
+            events = deque()
+            self._windows[key] = events
+        self._windows.move_to_end(key)
+
+        while events and events[0] <= now - window:
+            events.popleft()
+
+        if len(events) >= limit:
+            return events[0] + window - now
+
+        events.append(now)
+
+        while len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+            self.evictions += 1
+
+        return 0.0
+
+    async def purge(self, window: float):
+
+        now = time.monotonic()
+        for key in [k for k, events in self._windows.items() if not events or events[-1] <= now - window]:
+            del self._windows[key]
+
+    def stats(self) -> dict:
+        return {"keys": len(self._windows), "max_keys": self.max_keys, "evictions": self.evictions}
+
+class PostgresBackend:
+
+    name = "postgres"
+
+    async def hit(self, key: str, limit: int, window: float) -> float:
+
+        now = datetime.utcnow()
+        since = now - timedelta(seconds=window)
+
+        async with async_session() as session:
+            # Serializa los intentos de una misma clave entre workers
+            await session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": key})
+            await session.execute(
+                delete(RateLimitEvent).where(RateLimitEvent.key == key, RateLimitEvent.created_at <= since)
+            )
+
+            count, oldest = (await session.exec(
+                select(func.count(RateLimitEvent.id), func.min(RateLimitEvent.created_at))
+                .where(RateLimitEvent.key == key)
+            )).one()
+
+            if count >= limit:
+                await session.commit()
+                return max((oldest - since).total_seconds(), 0.0)
+
+            session.add(RateLimitEvent(key=key, created_at=now))
+            await session.commit()
+
+        return 0.0
+
+    async def purge(self, window: float):
+
+        since = datetime.utcnow() - timedelta(seconds=window)
+        async with async_session() as session:
+            await session.execute(delete(RateLimitEvent).where(RateLimitEvent.created_at <= since))
+            await session.commit()
+
+    def stats(self) -> dict:
+        return {}
+
+if settings.RATE_LIMIT_BACKEND == "postgres":
+    backend = PostgresBackend()
+else:
+    backend = MemoryBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+def client_ip(request: Request) -> str:
+
+    if settings.RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+
+    return request.client.host if request.client else "unknown"
+
+class RateLimiter:
+
+    def __init__(self, name: str, per_ip: int, per_email: int, window: float):
+        self.name = name
+        self.per_ip = per_ip
+        self.per_email = per_email
+        self.window = window
+        self.allowed = 0
+        self.blocked = 0
+        metrics.register(f"rate_limit.{name}", self.stats)
+
+    async def check(self, request: Request, email: Optional[str] = None):
+
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        retry_after = await backend.hit(f"{self.name}:ip:{client_ip(request)}", self.per_ip, self.window)
+        if not retry_after and email:
+            retry_after = await backend.hit(f"{self.name}:email:{email.lower()}", self.per_email, self.window)
+
+        if retry_after:
+            self.blocked += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Demasiados intentos. Por favor espera antes de volver a intentarlo.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+
+        self.allowed += 1
+
+    def stats(self) -> dict:
+
+        return {
+            "backend": backend.name,
+            "per_ip": self.per_ip,
+            "per_email": self.per_email,
+            "window_seconds": self.window,
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            **backend.stats()
+        }
+
+async def purge_rate_limits():
+    await backend.purge(settings.RATE_LIMIT_WINDOW_SECONDS)
+
+login_limiter = RateLimiter(
+    "login",
+    settings.LOGIN_LIMIT_PER_IP,
+    settings.LOGIN_LIMIT_PER_EMAIL,
+    settings.RATE_LIMIT_WINDOW_SECONDS
+)
+register_limiter = RateLimiter(
+    "register",
+    settings.REGISTER_LIMIT_PER_IP,
+    settings.REGISTER_LIMIT_PER_EMAIL,
+    settings.RATE_LIMIT_WINDOW_SECONDS
+)
+verification_limiter = RateLimiter(
+    "resend_verification",
+    settings.VERIFICATION_LIMIT_PER_IP,
+    settings.VERIFICATION_LIMIT_PER_EMAIL,
+    settings.RATE_LIMIT_WINDOW_SECONDS
+)
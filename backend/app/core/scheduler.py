@@ -0,0 +1,155 @@
+import asyncio
+import random
+import time
+import zlib
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+from sqlmodel import select, func
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import async_engine
+
+LEADER_LOCK_KEY = zlib.crc32(b"riseup:scheduler-leader")
+
+class Job:
+
+    def __init__(self, name: str, func: Callable[[], Awaitable], interval: float, jitter: float, leader_only: bool):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.leader_only = leader_only
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.duration = metrics.LatencyStats()
+
+    def next_delay(self) -> float:
+        return max(0.0, self.interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def stats(self) -> dict:
+
+        return {
+            "interval_seconds": self.interval,
+            "leader_only": self.leader_only,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_not_leader": self.skipped,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_error": self.last_error,
+            "duration": self.duration.stats()
+        }
+
+class Scheduler:
+
+    def __init__(self):
+        self._jobs: List[Job] = []
+        self._tasks: List[asyncio.Task] = []
+        self.is_leader = False
+        self.leader_changes = 0
+        metrics.register("scheduler", self.stats)
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        interval: float,
+        jitter: float = 0.1,
+        leader_only: bool = True
+    ):
+        self._jobs.append(Job(name, func, interval, jitter, leader_only))
+
+    def start(self):
+        if self._tasks:
+            return
+
+        if async_engine.dialect.name == "postgresql":
+            self._tasks.append(asyncio.create_task(self._elect()))
+        else:
+            # Sin Postgres no hay bloqueos consultivos: se asume un único proceso
+            self.is_leader = True
+
+        self._tasks += [asyncio.create_task(self._loop(job)) for job in self._jobs]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.is_leader = False
+
+    async def _elect(self):
+        while True:
+            try:
+                await self._hold_leadership()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error en la elección de líder del planificador: {e}")
+            await asyncio.sleep(settings.SCHEDULER_LEADER_CHECK_SECONDS)
+
+    async def _hold_leadership(self):
+
+        # El bloqueo consultivo de sesión vive mientras viva esta conexión dedicada
+        async with async_engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = (await conn.execute(select(func.pg_try_advisory_lock(LEADER_LOCK_KEY)))).scalar()
+            if not acquired:
+                return
+
+            self.is_leader = True
+            self.leader_changes += 1
+            try:
+                while True:
+                    await asyncio.sleep(settings.SCHEDULER_LEADER_CHECK_SECONDS)
+                    await conn.execute(select(1))
+            finally:
+                self.is_leader = False
+                # Se descarta la conexión en vez de devolverla al pool, así el bloqueo se libera siempre
+                await conn.invalidate()
+
+    async def _loop(self, job: Job):
+        while True:
+            await asyncio.sleep(job.next_delay())
+            try:
+                await self.run_job(job)
+            except Exception as e:
+                job.failures += 1
+                job.last_error = str(e)
+                print(f"Error en la tarea programada {job.name}: {e}")
+
+    async def run_job(self, job: Job):
+
+        if job.leader_only and not self.is_leader:
+            job.skipped += 1
+            return
+
+        await self._execute(job)
+
+    async def _execute(self, job: Job):
+
+        started = time.perf_counter()
+        job.last_run_at = datetime.utcnow()
+        try:
+            await job.func()
+            job.last_error = None
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            print(f"Error en la tarea programada {job.name}: {e}")
+        finally:
+            job.runs += 1
+            job.duration.record(time.perf_counter() - started)
+
+    def stats(self) -> dict:
+
+        return {
+            "is_leader": self.is_leader,
+            "leader_changes": self.leader_changes,
+            "jobs": {job.name: job.stats() for job in self._jobs}
+        }
+
+scheduler = Scheduler()
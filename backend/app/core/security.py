@@ -1,20 +1,101 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core import metrics
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.database import get_session
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+user_cache = TTLCache(
+    "auth_users",
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES
+)
+
+def invalidate_cached_user(email: str):
+    user_cache.pop(email)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode('utf-8')
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return False
+
+class PasswordHasher:
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.in_flight = 0
+        self.rejected = 0
+        self.queue_time = metrics.LatencyStats()
+        self.hash_time = metrics.LatencyStats()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        metrics.register("password_hashing", self.stats)
+
+    async def run(self, func, *args):
+
+        if self.in_flight >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="El servidor está ocupado, intenta nuevamente en unos segundos",
+                headers={"Retry-After": "1"},
+            )
+
+        def task():
+            started = time.perf_counter()
+            return func(*args), started, time.perf_counter()
+
+        self.in_flight += 1
+        submitted = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started, finished = await loop.run_in_executor(self._executor, task)
+        finally:
+            self.in_flight -= 1
+
+        self.queue_time.record(started - submitted)
+        self.hash_time.record(finished - started)
+        return result
+
+    def stats(self) -> dict:
+
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "queue_time": self.queue_time.stats(),
+            "hash_time": self.hash_time.stats()
+        }
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.run(get_password_hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -40,7 +121,7 @@ def verify_token(token: str) -> Optional[dict]:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     from app.models.person import Person
 
@@ -62,8 +143,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = user_cache.get(email)
+    if cached is not None:
+        user = Person(**cached)
+        make_transient_to_detached(user)
+        return user
+
     statement = select(Person).where(Person.email == email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
 
     if user is None:
         raise HTTPException(
@@ -72,8 +159,26 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # El hash de la contraseña no se guarda en la caché: quien lo necesite consulta la BD
+    user_cache.set(email, user.model_dump(exclude={"password"}))
+
     return user
 
+async def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    session: AsyncSession = Depends(get_session)
+):
+
+    if credentials is None:
+        return None
+
+    try:
+        user = await get_current_user(credentials, session)
+    except HTTPException:
+        return None
+
+    return user if user.is_active else None
+
 async def get_current_active_user(current_user = Depends(get_current_user)):
     if not current_user.is_active:
         raise HTTPException(
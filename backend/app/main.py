@@ -2,13 +2,66 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from app.core.database import create_db_and_tables
-from app.routers import auth, campaigns, donations, favorites, categories, rewards, countries, payment_methods, admin, users, requirements
+from app.core.config import settings
+from app.core.database import async_engine, create_db_and_tables
+from app.core.rate_limit import purge_rate_limits
+from app.core.scheduler import scheduler
+from app.services.campaign_expiry import run_expiry_job
+from app.services.email_outbox import email_outbox, run_outbox_job
+from app.services.email_templates import email_templates
+from app.services.payment_gateway import payment_gateway
+from app.services.reference_data import reference_data
+from app.services.view_counter import view_counter
+from app.routers import auth, campaigns, donations, favorites, categories, rewards, countries, payment_methods, admin, users, requirements, home
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
+    await create_db_and_tables()
+    await reference_data.load()
+    email_templates.load()
+    await payment_gateway.start()
+    scheduler.start()
     yield
+    await scheduler.stop()
+    await view_counter.flush()
+    await email_outbox.close()
+    await payment_gateway.close()
+    await async_engine.dispose()
+
+scheduler.add_job(
+    "view_counter_flush",
+    view_counter.flush,
+    settings.VIEW_COUNTER_FLUSH_SECONDS,
+    jitter=settings.SCHEDULER_JITTER,
+    leader_only=False
+)
+scheduler.add_job(
+    "reference_data_refresh",
+    reference_data.load,
+    settings.REFERENCE_DATA_REFRESH_SECONDS,
+    jitter=settings.SCHEDULER_JITTER,
+    leader_only=False
+)
+scheduler.add_job(
+    "email_outbox",
+    run_outbox_job,
+    settings.EMAIL_OUTBOX_INTERVAL_SECONDS,
+    jitter=settings.SCHEDULER_JITTER
+)
+scheduler.add_job(
+    "rate_limit_purge",
+    purge_rate_limits,
+    settings.RATE_LIMIT_PURGE_SECONDS,
+    jitter=settings.SCHEDULER_JITTER,
+    leader_only=settings.RATE_LIMIT_BACKEND == "postgres"
+)
+if settings.EXPIRY_JOB_ENABLED:
+    scheduler.add_job(
+        "campaign_expiry",
+        run_expiry_job,
+        settings.EXPIRY_JOB_INTERVAL_SECONDS,
+        jitter=settings.SCHEDULER_JITTER
+    )
 
 app = FastAPI(
     title="RiseUp API",
@@ -36,6 +89,7 @@ app.include_router(payment_methods.router)
 app.include_router(admin.router)
 app.include_router(users.router)
 app.include_router(requirements.router)
+app.include_router(home.router)
 
 @app.get("/")
 async def root():
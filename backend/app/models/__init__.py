@@ -15,6 +15,8 @@ from app.models.payment_method import PaymentMethod
 from app.models.donation import Donation, DonationCreate, DonationResponse
 from app.models.reward import Reward, RewardCreate, RewardUpdate, RewardResponse
 from app.models.reward_claim import RewardClaim, RewardClaimCreate, RewardClaimResponse
+from app.models.rate_limit_event import RateLimitEvent
+from app.models.email_outbox import EmailOutbox
 
 __all__ = [
     "Role",
@@ -34,4 +36,6 @@ __all__ = [
     "Donation", "DonationCreate", "DonationResponse",
     "Reward", "RewardCreate", "RewardUpdate", "RewardResponse",
     "RewardClaim", "RewardClaimCreate", "RewardClaimResponse",
+    "RateLimitEvent",
+    "EmailOutbox",
 ]
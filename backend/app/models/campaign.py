@@ -1,7 +1,9 @@
 from typing import Optional, List, TYPE_CHECKING
 from datetime import date, datetime
 from decimal import Decimal
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index, text
+
+from app.models.reward import RewardResponse
 
 if TYPE_CHECKING:
     from app.models.person import Person
@@ -24,6 +26,14 @@ class CampaignBase(SQLModel):
 
 class Campaign(CampaignBase, table=True):
     __tablename__ = "campaign"
+    __table_args__ = (
+        Index("idx_campaign_published_favorites", "favorites_counting", "id", postgresql_where=text("workflow_state_id = 5 AND campaign_state_id = 2")),
+        Index("idx_campaign_published_views", "view_counting", "id", postgresql_where=text("workflow_state_id = 5 AND campaign_state_id = 2")),
+        Index("idx_campaign_published_recent", "created_at", "id", postgresql_where=text("workflow_state_id = 5 AND campaign_state_id = 2")),
+        Index("idx_campaign_published_category", "category_id", "id", postgresql_where=text("workflow_state_id = 5 AND campaign_state_id = 2")),
+        Index("idx_campaign_user", "user_id"),
+        Index("idx_campaign_expiring", "expiration_date", postgresql_where=text("campaign_state_id = 2")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     current_amount: Decimal = Field(default=0, decimal_places=2)
@@ -87,6 +97,25 @@ class CampaignResponse(SQLModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+class CampaignSummaryResponse(SQLModel):
+    id: int
+    tittle: str
+    description: str
+    goal_amount: Decimal
+    current_amount: Decimal
+    expiration_date: Optional[date] = None
+    main_image_url: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    view_counting: int
+    favorites_counting: int
+    workflow_state_id: int
+    campaign_state_id: int
+    user_id: int
+    category_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
 class CampaignPublic(SQLModel):
 
     id: int
@@ -103,6 +132,7 @@ class CampaignPublic(SQLModel):
     user_profile_image_url: Optional[str] = None
     category_name: Optional[str] = None
     progress_percentage: float = 0.0
+    is_favorite: Optional[bool] = None
 
 class CampaignDetailPublic(SQLModel):
 
@@ -131,7 +161,28 @@ class CampaignDetailPublic(SQLModel):
 class CampaignPaginatedResponse(SQLModel):
 
     items: List[CampaignPublic]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+class TopDonor(SQLModel):
+
+    user_name: str
+    user_image: Optional[str] = None
+    amount: float
+    created_at: Optional[datetime] = None
+
+class CampaignViewerState(SQLModel):
+
+    is_favorite: bool = False
+    total_donated: float = 0
+    claimed_reward_ids: List[int] = []
+
+class CampaignPageResponse(SQLModel):
+
+    campaign: CampaignDetailPublic
+    rewards: List[RewardResponse]
+    top_donors: List[TopDonor]
+    viewer: Optional[CampaignViewerState] = None
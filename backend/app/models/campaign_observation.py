@@ -1,6 +1,6 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index
 
 if TYPE_CHECKING:
     from app.models.person import Person
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 class CampaignObservation(SQLModel, table=True):
     __tablename__ = "campaign_observations"
+    __table_args__ = (
+        Index("idx_campaign_observations_campaign", "campaign_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     observation_text: Optional[str] = None
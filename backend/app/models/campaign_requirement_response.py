@@ -1,6 +1,6 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index
 
 if TYPE_CHECKING:
     from app.models.campaign import Campaign
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 class CampaignRequirementResponse(SQLModel, table=True):
     __tablename__ = "campaign_requirement_response"
+    __table_args__ = (
+        Index("idx_campaign_requirement_response_campaign", "campaign_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     campaign_id: Optional[int] = Field(default=None, foreign_key="campaign.id")
@@ -14,6 +14,13 @@ class Category(SQLModel, table=True):
 
     campaigns: List["Campaign"] = Relationship(back_populates="category")
 
+class CategorySummary(SQLModel):
+    id: int
+    name: str
+    image_url: Optional[str] = None
+    requirements_count: int = 0
+    campaigns_count: int = 0
+
 class CategoryResponse(SQLModel):
     id: int
     name: str
@@ -1,5 +1,5 @@
 from typing import Optional, List, TYPE_CHECKING
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index
 
 if TYPE_CHECKING:
     from app.models.requirement_type import RequirementType
@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 class CategoryRequirement(SQLModel, table=True):
     __tablename__ = "category_requirements"
+    __table_args__ = (
+        Index("idx_category_requirements_category", "category_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     requirement_name: str = Field(max_length=255)
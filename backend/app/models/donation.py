@@ -1,7 +1,7 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 from decimal import Decimal
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index, text
 
 if TYPE_CHECKING:
     from app.models.person import Person
@@ -11,6 +11,11 @@ if TYPE_CHECKING:
 
 class Donation(SQLModel, table=True):
     __tablename__ = "donation"
+    __table_args__ = (
+        Index("idx_donation_campaign_state_amount", "campaign_id", "donation_state_id", "amount"),
+        Index("idx_donation_gateway_payment", "gateway_payment_id", postgresql_where=text("gateway_payment_id IS NOT NULL")),
+        Index("idx_donation_user_created", "user_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     amount: Decimal = Field(decimal_places=2)
@@ -0,0 +1,20 @@
+from typing import Optional
+from datetime import datetime
+from sqlmodel import Field, SQLModel, Index
+
+class EmailOutbox(SQLModel, table=True):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("idx_email_outbox_pending", "status", "next_attempt_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    to_email: str = Field(max_length=255)
+    subject: str = Field(max_length=255)
+    html_content: str
+    status: str = Field(default="pending", max_length=20)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None, max_length=500)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = None
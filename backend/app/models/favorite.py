@@ -1,6 +1,6 @@
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index
 
 if TYPE_CHECKING:
     from app.models.person import Person
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 class Favorite(SQLModel, table=True):
     __tablename__ = "favorite"
+    __table_args__ = (
+        Index("idx_favorite_user_campaign", "user_id", "campaign_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, foreign_key="person.id")
@@ -20,6 +23,12 @@ class Favorite(SQLModel, table=True):
 class FavoriteCreate(SQLModel):
     campaign_id: int
 
+class FavoriteCheckRequest(SQLModel):
+    campaign_ids: List[int] = Field(max_length=100)
+
+class FavoriteCheckResponse(SQLModel):
+    favorite_ids: List[int]
+
 class FavoriteResponse(SQLModel):
     id: int
     user_id: int
@@ -0,0 +1,13 @@
+from typing import Optional
+from datetime import datetime
+from sqlmodel import Field, SQLModel, Index
+
+class RateLimitEvent(SQLModel, table=True):
+    __tablename__ = "rate_limit_event"
+    __table_args__ = (
+        Index("idx_rate_limit_event_key_created", "key", "created_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    key: str = Field(max_length=255)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -1,13 +1,16 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 from decimal import Decimal
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index
 
 if TYPE_CHECKING:
     from app.models.campaign import Campaign
 
 class Reward(SQLModel, table=True):
     __tablename__ = "reward"
+    __table_args__ = (
+        Index("idx_reward_campaign_amount", "campaign_id", "amount"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     tittle: str = Field(max_length=100)
@@ -17,6 +20,7 @@ class Reward(SQLModel, table=True):
     campaign_id: Optional[int] = Field(default=None, foreign_key="campaign.id")
     image_url: Optional[str] = Field(default=None, max_length=500)
     created_ad: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
 
     campaign: Optional["Campaign"] = Relationship(back_populates="rewards")
 
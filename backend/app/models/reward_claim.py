@@ -1,6 +1,6 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, SQLModel, Relationship, Index
 
 if TYPE_CHECKING:
     from app.models.person import Person
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 
 class RewardClaim(SQLModel, table=True):
     __tablename__ = "reward_claim"
+    __table_args__ = (
+        Index("idx_reward_claim_campaign_user", "campaign_id", "user_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="person.id")
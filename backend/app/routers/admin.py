@@ -1,13 +1,18 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import BaseModel
 
 from app.core.database import get_session
-from app.core.security import get_current_admin_user
+from app.core import metrics
+from app.core.security import get_current_admin_user, invalidate_cached_user
 from app.models.person import Person
 from app.models.campaign import Campaign
 from app.models.category import Category
+from app.services.campaign_rails import invalidate_rails
+from app.services.category_catalog import invalidate_category_catalog
+from app.services.reference_data import reference_data
 from app.models.campaign_observation import CampaignObservation, CampaignObservationCreate, CampaignObservationResponse
 from datetime import datetime
 
@@ -37,12 +42,12 @@ class ApprovalAction(BaseModel):
 
 @router.get("/users", response_model=List[dict])
 async def get_admin_users(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
     statement = select(Person).where(Person.role_id == 1)
-    admins = session.exec(statement).all()
+    admins = (await session.exec(statement)).all()
 
     return [
         {
@@ -59,14 +64,14 @@ async def get_admin_users(
 @router.post("/users")
 async def create_admin_user(
     user_data: AdminUserCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    from app.core.security import get_password_hash
+    from app.core.security import get_password_hash_async
 
     statement = select(Person).where(Person.email == user_data.email)
-    existing_user = session.exec(statement).first()
+    existing_user = (await session.exec(statement)).first()
 
     if existing_user:
         raise HTTPException(
@@ -78,7 +83,7 @@ async def create_admin_user(
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         email=user_data.email,
-        password=get_password_hash(user_data.password),
+        password=await get_password_hash_async(user_data.password),
         is_active=True,
         role_id=1,
         created_at=datetime.utcnow(),
@@ -86,8 +91,9 @@ async def create_admin_user(
     )
 
     session.add(new_admin)
-    session.commit()
-    session.refresh(new_admin)
+    await session.commit()
+    await session.refresh(new_admin)
+    invalidate_cached_user(new_admin.email)
 
     return {
         "message": "Administrador creado exitosamente",
@@ -97,7 +103,7 @@ async def create_admin_user(
 @router.delete("/users/{user_id}")
 async def delete_admin_user(
     user_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
@@ -107,7 +113,7 @@ async def delete_admin_user(
             detail="No puedes eliminarte a ti mismo"
         )
 
-    user = session.get(Person, user_id)
+    user = await session.get(Person, user_id)
 
     if not user:
         raise HTTPException(
@@ -121,50 +127,54 @@ async def delete_admin_user(
             detail="El usuario no es administrador"
         )
 
-    session.delete(user)
-    session.commit()
+    await session.delete(user)
+    await session.commit()
+    invalidate_cached_user(user.email)
 
     return {"message": "Administrador eliminado exitosamente"}
 
 @router.get("/campaigns", response_model=List[CampaignAdminResponse])
 async def get_all_campaigns(
     workflow_state_id: int = None,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    statement = select(Campaign)
+    statement = select(
+        Campaign.id,
+        Campaign.tittle,
+        Campaign.description,
+        Campaign.goal_amount,
+        Campaign.current_amount,
+        Campaign.workflow_state_id,
+        Campaign.campaign_state_id,
+        Campaign.created_at,
+        Person.first_name,
+        Person.last_name,
+        Person.email
+    ).outerjoin(Person, Person.id == Campaign.user_id)
 
     if workflow_state_id:
         statement = statement.where(Campaign.workflow_state_id == workflow_state_id)
     else:
         statement = statement.where(Campaign.workflow_state_id != 1)
 
-    campaigns = session.exec(statement).all()
-
-    workflow_states = {
-        1: "Borrador",
-        2: "En Revisión",
-        3: "Observado",
-        4: "Rechazado",
-        5: "Publicado"
-    }
+    rows = (await session.exec(statement)).all()
 
     result = []
-    for campaign in campaigns:
-        user = session.get(Person, campaign.user_id)
+    for row in rows:
         result.append(CampaignAdminResponse(
-            id=campaign.id,
-            tittle=campaign.tittle,
-            description=campaign.description,
-            goal_amount=float(campaign.goal_amount),
-            current_amount=float(campaign.current_amount),
-            workflow_state_id=campaign.workflow_state_id,
-            workflow_state_name=workflow_states.get(campaign.workflow_state_id, "Desconocido"),
-            campaign_state_id=campaign.campaign_state_id,
-            user_name=f"{user.first_name} {user.last_name}" if user else "Usuario desconocido",
-            user_email=user.email if user else "",
-            created_at=campaign.created_at
+            id=row.id,
+            tittle=row.tittle,
+            description=row.description,
+            goal_amount=float(row.goal_amount),
+            current_amount=float(row.current_amount),
+            workflow_state_id=row.workflow_state_id,
+            workflow_state_name=reference_data.workflow_states.get(row.workflow_state_id, "Desconocido"),
+            campaign_state_id=row.campaign_state_id,
+            user_name=f"{row.first_name} {row.last_name}" if row.email is not None else "Usuario desconocido",
+            user_email=row.email or "",
+            created_at=row.created_at
         ))
 
     return result
@@ -172,11 +182,11 @@ async def get_all_campaigns(
 @router.get("/campaigns/{campaign_id}")
 async def get_campaign_detail(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -184,16 +194,8 @@ async def get_campaign_detail(
             detail="Campaña no encontrada"
         )
 
-    user = session.get(Person, campaign.user_id)
-    category = session.get(Category, campaign.category_id) if campaign.category_id else None
-
-    workflow_states = {
-        1: "Borrador",
-        2: "En Revisión",
-        3: "Observado",
-        4: "Rechazado",
-        5: "Publicado"
-    }
+    user = await session.get(Person, campaign.user_id)
+    category = await session.get(Category, campaign.category_id) if campaign.category_id else None
 
     return {
         "id": campaign.id,
@@ -205,7 +207,7 @@ async def get_campaign_detail(
         "main_image_url": campaign.main_image_url,
         "rich_text": campaign.rich_text,
         "workflow_state_id": campaign.workflow_state_id,
-        "workflow_state_name": workflow_states.get(campaign.workflow_state_id, "Desconocido"),
+        "workflow_state_name": reference_data.workflow_states.get(campaign.workflow_state_id, "Desconocido"),
         "campaign_state_id": campaign.campaign_state_id,
         "category_id": campaign.category_id,
         "category_name": category.name if category else None,
@@ -219,11 +221,11 @@ async def get_campaign_detail(
 async def approve_campaign(
     campaign_id: int,
     action_data: ApprovalAction = ApprovalAction(),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -249,7 +251,9 @@ async def approve_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
+    invalidate_category_catalog()
 
     return {"message": "Campaña aprobada exitosamente"}
 
@@ -257,11 +261,11 @@ async def approve_campaign(
 async def observe_campaign(
     campaign_id: int,
     action_data: ApprovalAction,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -293,18 +297,19 @@ async def observe_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
 
     return {"message": "Campaña observada exitosamente"}
 
 @router.post("/campaigns/{campaign_id}/reject")
 async def reject_campaign(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -322,14 +327,15 @@ async def reject_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
 
     return {"message": "Campaña rechazada"}
 
 @router.get("/campaigns/{campaign_id}/observations", response_model=List[CampaignObservationResponse])
 async def get_campaign_observations(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
@@ -337,11 +343,11 @@ async def get_campaign_observations(
         CampaignObservation.campaign_id == campaign_id
     ).order_by(CampaignObservation.created_at.desc())
 
-    observations = session.exec(statement).all()
+    observations = (await session.exec(statement)).all()
 
     result = []
     for obs in observations:
-        admin = session.get(Person, obs.user_id) if obs.user_id else None
+        admin = await session.get(Person, obs.user_id) if obs.user_id else None
         result.append(CampaignObservationResponse(
             id=obs.id,
             observation_text=obs.observation_text,
@@ -352,3 +358,19 @@ async def get_campaign_observations(
         ))
 
     return result
+
+@router.get("/metrics")
+async def get_metrics(
+    current_user: Person = Depends(get_current_admin_user)
+):
+
+    return metrics.snapshot()
+
+@router.post("/reference-data/refresh")
+async def refresh_reference_data(
+    current_user: Person = Depends(get_current_admin_user)
+):
+
+    await reference_data.load()
+
+    return reference_data.stats()
@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 from pydantic import BaseModel, EmailStr
 
 from app.core.database import get_session
+from app.core.rate_limit import login_limiter, register_limiter, verification_limiter
 from app.core.security import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
     create_verification_token,
     verify_token,
     get_current_user,
-    get_current_active_user
+    get_current_active_user,
+    invalidate_cached_user
 )
 from app.models.person import Person, PersonCreate, PersonResponse, PersonUpdate
 from app.services.email_service import send_verification_email, send_welcome_email
@@ -37,12 +41,14 @@ class MessageResponse(BaseModel):
 @router.post("/register", response_model=RegisterResponse)
 async def register(
     user_data: PersonCreate,
-    background_tasks: BackgroundTasks,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session)
 ):
 
+    await register_limiter.check(request, user_data.email)
+
     statement = select(Person).where(Person.email == user_data.email)
-    existing_user = session.exec(statement).first()
+    existing_user = (await session.exec(statement)).first()
 
     if existing_user:
         raise HTTPException(
@@ -56,7 +62,7 @@ async def register(
             detail="La contraseña debe tener al menos 6 caracteres"
         )
 
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = Person(
         first_name=user_data.first_name,
         last_name=user_data.last_name,
@@ -70,16 +76,11 @@ async def register(
     )
 
     session.add(new_user)
-    session.commit()
-    session.refresh(new_user)
+    await session.commit()
+    await session.refresh(new_user)
 
     verification_token = create_verification_token(new_user.email)
-    background_tasks.add_task(
-        send_verification_email,
-        new_user.email,
-        new_user.first_name,
-        verification_token
-    )
+    await send_verification_email(new_user.email, new_user.first_name, verification_token)
 
     return RegisterResponse(
         message="Usuario registrado exitosamente. Por favor verifica tu correo electrónico.",
@@ -98,11 +99,14 @@ async def register(
 @router.post("/login", response_model=LoginResponse)
 async def login(
     login_data: LoginRequest,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session)
 ):
 
+    await login_limiter.check(request, login_data.email)
+
     statement = select(Person).where(Person.email == login_data.email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -110,7 +114,7 @@ async def login(
             detail="Credenciales incorrectas"
         )
 
-    if not verify_password(login_data.password, user.password):
+    if not await verify_password_async(login_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Credenciales incorrectas"
@@ -122,6 +126,12 @@ async def login(
             detail="Tu cuenta no está activada. Por favor verifica tu correo electrónico."
         )
 
+    # Solo se rehashea una cuenta que realmente puede iniciar sesión
+    if password_needs_rehash(user.password):
+        user.password = await get_password_hash_async(login_data.password)
+        session.add(user)
+        await session.commit()
+
     access_token = create_access_token(data={"sub": user.email, "role": user.role_id})
 
     return LoginResponse(
@@ -144,8 +154,7 @@ async def login(
 @router.get("/verify/{token}", response_model=MessageResponse)
 async def verify_email(
     token: str,
-    background_tasks: BackgroundTasks,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
     payload = verify_token(token)
@@ -159,7 +168,7 @@ async def verify_email(
     email = payload.get("sub")
 
     statement = select(Person).where(Person.email == email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -173,9 +182,10 @@ async def verify_email(
     user.is_active = True
     user.updated_at = datetime.utcnow()
     session.add(user)
-    session.commit()
+    await session.commit()
+    invalidate_cached_user(user.email)
 
-    background_tasks.add_task(send_welcome_email, user.email, user.first_name)
+    await send_welcome_email(user.email, user.first_name)
 
     return MessageResponse(message="¡Cuenta verificada exitosamente! Ya puedes iniciar sesión.")
 
@@ -201,7 +211,7 @@ async def get_profile(
 @router.put("/profile", response_model=PersonResponse)
 async def update_profile(
     profile_data: PersonUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -221,8 +231,9 @@ async def update_profile(
     current_user.updated_at = datetime.utcnow()
 
     session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
+    await session.commit()
+    await session.refresh(current_user)
+    invalidate_cached_user(current_user.email)
 
     return PersonResponse(
         id=current_user.id,
@@ -241,12 +252,14 @@ async def update_profile(
 @router.post("/resend-verification", response_model=MessageResponse)
 async def resend_verification(
     email: EmailStr,
-    background_tasks: BackgroundTasks,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session)
 ):
 
+    await verification_limiter.check(request, email)
+
     statement = select(Person).where(Person.email == email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
 
     if not user:
         return MessageResponse(message="Si el correo existe, recibirás un email de verificación.")
@@ -255,11 +268,6 @@ async def resend_verification(
         return MessageResponse(message="Tu cuenta ya está verificada. Puedes iniciar sesión.")
 
     verification_token = create_verification_token(user.email)
-    background_tasks.add_task(
-        send_verification_email,
-        user.email,
-        user.first_name,
-        verification_token
-    )
+    await send_verification_email(user.email, user.first_name, verification_token)
 
     return MessageResponse(message="Si el correo existe, recibirás un email de verificación.")
@@ -1,84 +1,98 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select, func
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import defer
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime, date
 import math
 
+from app.core.config import settings
 from app.core.database import get_session
-from app.core.security import get_current_active_user, get_current_admin_user
+from app.core.http_cache import etag_response, not_modified, version_etag
+from app.core.security import get_current_active_user, get_current_admin_user, get_optional_user
 from app.models.person import Person
-from app.models.donation import Donation
 from app.models.campaign import (
     Campaign,
     CampaignCreate,
     CampaignUpdate,
     CampaignResponse,
+    CampaignSummaryResponse,
     CampaignPublic,
     CampaignDetailPublic,
-    CampaignPaginatedResponse
+    CampaignPaginatedResponse,
+    CampaignPageResponse
 )
 from app.models.category import Category
 from app.models.campaign_observation import CampaignObservation, CampaignObservationResponse
+from app.services.campaign_cards import PUBLISHED_IN_PROGRESS, card_statement, fetch_cards, fetch_card_page, with_favorite_state
+from app.services.campaign_expiry import expire_campaigns
+from app.services.campaign_progress import campaign_progress
+from app.services.campaign_page import fetch_campaign_detail, fetch_rewards, fetch_top_donors, fetch_viewer_state
+from app.services.campaign_rails import get_rail, invalidate_rails
+from app.services.category_catalog import invalidate_category_catalog
+from app.services.campaign_search import search_condition, search_rank
+from app.services.view_counter import view_counter
 
 router = APIRouter(prefix="/campaigns", tags=["Campañas"])
 
 @router.get("/public", response_model=CampaignPaginatedResponse)
 async def get_public_campaigns(
     category_id: Optional[int] = None,
-    search: Optional[str] = None,
+    search: Optional[str] = Query(
+        default=None,
+        description="Texto completo. Con pagination=page se ordena por relevancia; con pagination=cursor solo filtra y se mantiene el orden de sort"
+    ),
     page: int = Query(default=1, ge=1),
-    page_size: int = Query(default=9, le=100),
-    session: Session = Depends(get_session)
+    page_size: int = Query(default=9, ge=1, le=100),
+    pagination: str = Query(default="page", pattern="^(page|cursor)$"),
+    sort: str = Query(default="recent", pattern="^(recent|favorites)$"),
+    cursor: Optional[str] = None,
+    include_favorite_state: bool = False,
+    session: AsyncSession = Depends(get_session),
+    viewer: Optional[Person] = Depends(get_optional_user)
 ):
 
-    base_where = [
-        Campaign.workflow_state_id == 5,
-        Campaign.campaign_state_id == 2
-    ]
+    base_where = list(PUBLISHED_IN_PROGRESS)
 
     if category_id:
         base_where.append(Campaign.category_id == category_id)
 
     if search:
-        base_where.append(
-            Campaign.tittle.ilike(f"%{search}%") |
-            Campaign.description.ilike(f"%{search}%")
+        base_where.append(search_condition(search))
+
+    if pagination == "cursor":
+        # El cursor se arma sobre (sort, id); la relevancia de la búsqueda no es estable para paginar por cursor
+        try:
+            items, next_cursor = await fetch_card_page(session, base_where, sort, cursor, page_size)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor inválido"
+            )
+
+        if include_favorite_state:
+            items = await with_favorite_state(session, viewer, items)
+
+        return CampaignPaginatedResponse(
+            items=items,
+            page_size=page_size,
+            next_cursor=next_cursor
         )
 
     count_statement = select(func.count(Campaign.id)).where(*base_where)
-    total = session.exec(count_statement).one()
+    total = (await session.exec(count_statement)).one()
 
     offset = (page - 1) * page_size
     total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-    statement = select(Campaign).where(*base_where).offset(offset).limit(page_size)
-    campaigns = session.exec(statement).all()
+    statement = card_statement(*base_where).offset(offset).limit(page_size)
+    if search:
+        statement = statement.order_by(search_rank(search).desc(), Campaign.id.desc())
+    result = await fetch_cards(session, statement)
 
-    result = []
-    for campaign in campaigns:
-        progress = 0.0
-        if campaign.goal_amount and campaign.goal_amount > 0:
-            progress = float(campaign.current_amount / campaign.goal_amount * 100)
-
-        user = session.get(Person, campaign.user_id)
-        category = session.get(Category, campaign.category_id) if campaign.category_id else None
-
-        result.append(CampaignPublic(
-            id=campaign.id,
-            tittle=campaign.tittle,
-            description=campaign.description,
-            goal_amount=campaign.goal_amount,
-            current_amount=campaign.current_amount,
-            expiration_date=campaign.expiration_date,
-            main_image_url=campaign.main_image_url,
-            view_counting=campaign.view_counting,
-            favorites_counting=campaign.favorites_counting,
-            user_first_name=user.first_name if user else None,
-            user_last_name=user.last_name if user else None,
-            user_profile_image_url=user.profile_image_url if user else None,
-            category_name=category.name if category else None,
-            progress_percentage=round(progress, 2)
-        ))
+    if include_favorite_state:
+        result = await with_favorite_state(session, viewer, result)
 
     return CampaignPaginatedResponse(
         items=result,
@@ -90,157 +104,98 @@ async def get_public_campaigns(
 
 @router.get("/featured", response_model=List[CampaignPublic])
 async def get_featured_campaigns(
-    limit: int = Query(default=6, le=20),
-    session: Session = Depends(get_session)
+    limit: int = Query(default=6, ge=1, le=20),
+    include_favorite_state: bool = False,
+    session: AsyncSession = Depends(get_session),
+    viewer: Optional[Person] = Depends(get_optional_user)
 ):
 
-    statement = select(Campaign).where(
-        Campaign.workflow_state_id == 5,
-        Campaign.campaign_state_id == 2
-    ).order_by(Campaign.favorites_counting.desc()).limit(limit)
-
-    campaigns = session.exec(statement).all()
+    cards = await get_rail(session, "featured", limit)
 
-    result = []
-    for campaign in campaigns:
-        progress = 0.0
-        if campaign.goal_amount and campaign.goal_amount > 0:
-            progress = float(campaign.current_amount / campaign.goal_amount * 100)
-
-        user = session.get(Person, campaign.user_id)
-        category = session.get(Category, campaign.category_id) if campaign.category_id else None
-
-        result.append(CampaignPublic(
-            id=campaign.id,
-            tittle=campaign.tittle,
-            description=campaign.description,
-            goal_amount=campaign.goal_amount,
-            current_amount=campaign.current_amount,
-            expiration_date=campaign.expiration_date,
-            main_image_url=campaign.main_image_url,
-            view_counting=campaign.view_counting,
-            favorites_counting=campaign.favorites_counting,
-            user_first_name=user.first_name if user else None,
-            user_last_name=user.last_name if user else None,
-            user_profile_image_url=user.profile_image_url if user else None,
-            category_name=category.name if category else None,
-            progress_percentage=round(progress, 2)
-        ))
+    if include_favorite_state:
+        cards = await with_favorite_state(session, viewer, cards)
 
-    return result
+    return cards
 
 @router.get("/popular", response_model=List[CampaignPublic])
 async def get_popular_campaigns(
-    limit: int = Query(default=6, le=20),
-    session: Session = Depends(get_session)
+    limit: int = Query(default=6, ge=1, le=20),
+    include_favorite_state: bool = False,
+    session: AsyncSession = Depends(get_session),
+    viewer: Optional[Person] = Depends(get_optional_user)
 ):
 
-    statement = select(Campaign).where(
-        Campaign.workflow_state_id == 5,
-        Campaign.campaign_state_id == 2
-    ).order_by(Campaign.view_counting.desc()).limit(limit)
+    cards = await get_rail(session, "popular", limit)
 
-    campaigns = session.exec(statement).all()
-
-    result = []
-    for campaign in campaigns:
-        progress = 0.0
-        if campaign.goal_amount and campaign.goal_amount > 0:
-            progress = float(campaign.current_amount / campaign.goal_amount * 100)
-
-        user = session.get(Person, campaign.user_id)
-        category = session.get(Category, campaign.category_id) if campaign.category_id else None
-
-        result.append(CampaignPublic(
-            id=campaign.id,
-            tittle=campaign.tittle,
-            description=campaign.description,
-            goal_amount=campaign.goal_amount,
-            current_amount=campaign.current_amount,
-            expiration_date=campaign.expiration_date,
-            main_image_url=campaign.main_image_url,
-            view_counting=campaign.view_counting,
-            favorites_counting=campaign.favorites_counting,
-            user_first_name=user.first_name if user else None,
-            user_last_name=user.last_name if user else None,
-            user_profile_image_url=user.profile_image_url if user else None,
-            category_name=category.name if category else None,
-            progress_percentage=round(progress, 2)
-        ))
+    if include_favorite_state:
+        cards = await with_favorite_state(session, viewer, cards)
 
-    return result
+    return cards
 
 @router.get("/public/{campaign_id}", response_model=CampaignDetailPublic)
 async def get_public_campaign_detail(
     campaign_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
-
-    if not campaign:
+    statement = select(
+        Campaign.workflow_state_id,
+        Campaign.updated_at,
+        Campaign.favorites_counting,
+        Person.updated_at.label("user_updated_at"),
+        Category.name.label("category_name")
+    ).outerjoin(
+        Person, Person.id == Campaign.user_id
+    ).outerjoin(
+        Category, Category.id == Campaign.category_id
+    ).where(Campaign.id == campaign_id)
+
+    version = (await session.exec(statement)).first()
+
+    if not version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaña no encontrada"
         )
 
-    if campaign.workflow_state_id != 5:
+    if version.workflow_state_id != 5:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Esta campaña no está disponible públicamente"
         )
 
-    campaign.view_counting += 1
-    session.add(campaign)
-    session.commit()
-    session.refresh(campaign)
+    view_counter.increment(campaign_id)
 
-    user = session.get(Person, campaign.user_id)
-    category = session.get(Category, campaign.category_id) if campaign.category_id else None
+    # El contador de vistas cambia en cada visita, por eso queda fuera del validador (etag débil)
+    etag = version_etag(campaign_id, *version, weak=True)
+    response = not_modified(request, etag, "public, no-cache")
+    if response is not None:
+        return response
 
-    progress = 0.0
-    if campaign.goal_amount and campaign.goal_amount > 0:
-        progress = float(campaign.current_amount / campaign.goal_amount * 100)
+    detail = await fetch_campaign_detail(session, campaign_id)
+    detail.view_counting += view_counter.pending(campaign_id)
 
-    return CampaignDetailPublic(
-        id=campaign.id,
-        tittle=campaign.tittle,
-        description=campaign.description,
-        goal_amount=campaign.goal_amount,
-        current_amount=campaign.current_amount,
-        expiration_date=campaign.expiration_date,
-        main_image_url=campaign.main_image_url,
-        rich_text=campaign.rich_text,
-        start_date=campaign.start_date,
-        end_date=campaign.end_date,
-        view_counting=campaign.view_counting,
-        favorites_counting=campaign.favorites_counting,
-        workflow_state_id=campaign.workflow_state_id,
-        campaign_state_id=campaign.campaign_state_id,
-        category_id=campaign.category_id,
-        category_name=category.name if category else None,
-        user_id=campaign.user_id,
-        user_first_name=user.first_name if user else None,
-        user_last_name=user.last_name if user else None,
-        user_profile_image_url=user.profile_image_url if user else None,
-        progress_percentage=round(progress, 2)
-    )
+    return etag_response(request, detail, "public, no-cache", etag=etag)
 
-@router.get("/my-campaigns", response_model=List[CampaignResponse])
+@router.get("/my-campaigns", response_model=List[CampaignSummaryResponse])
 async def get_my_campaigns(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    statement = select(Campaign).where(Campaign.user_id == current_user.id)
-    campaigns = session.exec(statement).all()
+    # rich_text no se lista: se obtiene desde el detalle de cada campaña
+    statement = select(Campaign).options(
+        defer(Campaign.rich_text, raiseload=True)
+    ).where(Campaign.user_id == current_user.id)
+    campaigns = (await session.exec(statement)).all()
 
     return campaigns
 
 @router.post("/", response_model=CampaignResponse)
 async def create_campaign(
     campaign_data: CampaignCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -271,19 +226,19 @@ async def create_campaign(
     )
 
     session.add(new_campaign)
-    session.commit()
-    session.refresh(new_campaign)
+    await session.commit()
+    await session.refresh(new_campaign)
 
     return new_campaign
 
 @router.get("/{campaign_id}", response_model=CampaignDetailPublic)
 async def get_campaign(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -298,8 +253,8 @@ async def get_campaign(
                 detail="No tienes permiso para ver esta campaña"
             )
 
-    user = session.get(Person, campaign.user_id)
-    category = session.get(Category, campaign.category_id) if campaign.category_id else None
+    user = await session.get(Person, campaign.user_id)
+    category = await session.get(Category, campaign.category_id) if campaign.category_id else None
 
     progress = 0.0
     if campaign.goal_amount and campaign.goal_amount > 0:
@@ -333,11 +288,11 @@ async def get_campaign(
 async def update_campaign(
     campaign_id: int,
     campaign_data: CampaignUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -375,19 +330,19 @@ async def update_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
-    session.refresh(campaign)
+    await session.commit()
+    await session.refresh(campaign)
 
     return campaign
 
 @router.delete("/{campaign_id}")
 async def delete_campaign(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -407,8 +362,8 @@ async def delete_campaign(
             detail="Solo puedes eliminar campañas en estado borrador"
         )
 
-    session.delete(campaign)
-    session.commit()
+    await session.delete(campaign)
+    await session.commit()
 
     return {"message": "Campaña eliminada exitosamente"}
 
@@ -416,11 +371,11 @@ async def delete_campaign(
 async def change_campaign_state(
     campaign_id: int,
     state_data: dict,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -451,19 +406,21 @@ async def change_campaign_state(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
-    session.refresh(campaign)
+    await session.commit()
+    invalidate_rails()
+    invalidate_category_catalog()
+    await session.refresh(campaign)
 
     return campaign
 
 @router.post("/{campaign_id}/submit-for-review")
 async def submit_for_review(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -493,18 +450,78 @@ async def submit_for_review(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
 
     return {"message": "Campaña enviada para revisión exitosamente"}
 
+@router.get("/{campaign_id}/page", response_model=CampaignPageResponse)
+async def get_campaign_page(
+    campaign_id: int,
+    donors_limit: int = Query(default=5, ge=1, le=20),
+    session: AsyncSession = Depends(get_session),
+    viewer: Optional[Person] = Depends(get_optional_user)
+):
+
+    detail = await fetch_campaign_detail(session, campaign_id)
+
+    if not detail:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaña no encontrada"
+        )
+
+    if detail.workflow_state_id != 5:
+        if viewer is None or (detail.user_id != viewer.id and viewer.role_id != 1):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Esta campaña no está disponible públicamente"
+            )
+    else:
+        view_counter.increment(campaign_id)
+        detail.view_counting += view_counter.pending(campaign_id)
+
+    rewards = await fetch_rewards(session, campaign_id)
+    top_donors = await fetch_top_donors(session, campaign_id, donors_limit)
+    viewer_state = await fetch_viewer_state(session, campaign_id, viewer.id) if viewer else None
+
+    return CampaignPageResponse(
+        campaign=detail,
+        rewards=rewards,
+        top_donors=top_donors,
+        viewer=viewer_state
+    )
+
+@router.get("/{campaign_id}/progress/stream")
+async def stream_campaign_progress(campaign_id: int):
+
+    if await campaign_progress.snapshot(campaign_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaña no encontrada"
+        )
+
+    if campaign_progress.events.subscribers >= campaign_progress.events.max_subscribers:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Demasiadas conexiones abiertas, intenta nuevamente",
+            headers={"Retry-After": "5"}
+        )
+
+    return StreamingResponse(
+        campaign_progress.stream(campaign_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/{campaign_id}/observations", response_model=List[CampaignObservationResponse])
 async def get_my_campaign_observations(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -522,11 +539,11 @@ async def get_my_campaign_observations(
         CampaignObservation.campaign_id == campaign_id
     ).order_by(CampaignObservation.created_at.desc())
 
-    observations = session.exec(statement).all()
+    observations = (await session.exec(statement)).all()
 
     result = []
     for obs in observations:
-        admin = session.get(Person, obs.user_id) if obs.user_id else None
+        admin = await session.get(Person, obs.user_id) if obs.user_id else None
         result.append(CampaignObservationResponse(
             id=obs.id,
             observation_text=obs.observation_text,
@@ -541,11 +558,11 @@ async def get_my_campaign_observations(
 @router.post("/{campaign_id}/start")
 async def start_campaign(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -577,18 +594,20 @@ async def start_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
+    invalidate_category_catalog()
 
     return {"message": "Campaña de recaudación iniciada exitosamente"}
 
 @router.post("/{campaign_id}/pause")
 async def pause_campaign(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -612,18 +631,20 @@ async def pause_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
+    invalidate_category_catalog()
 
     return {"message": "Campaña pausada exitosamente"}
 
 @router.post("/{campaign_id}/finish")
 async def finish_campaign(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -648,57 +669,24 @@ async def finish_campaign(
     campaign.updated_at = datetime.utcnow()
 
     session.add(campaign)
-    session.commit()
+    await session.commit()
+    invalidate_rails()
+    invalidate_category_catalog()
 
     return {"message": "Campaña finalizada exitosamente"}
 
 @router.post("/process-expired")
 async def process_expired_campaigns(
-    session: Session = Depends(get_session)
+    batch_size: Optional[int] = Query(default=None, ge=1, le=1000),
+    session: AsyncSession = Depends(get_session),
+    current_user: Person = Depends(get_current_admin_user)
 ):
 
-    today = date.today()
+    processed = await expire_campaigns(session, batch_size or settings.EXPIRY_BATCH_SIZE)
 
-    statement = select(Campaign).where(
-        Campaign.campaign_state_id == 2,
-        Campaign.expiration_date < today
-    )
-    expired_campaigns = session.exec(statement).all()
-
-    processed = []
-
-    for campaign in expired_campaigns:
-        campaign.campaign_state_id = 4
-        campaign.end_date = today
-        campaign.updated_at = datetime.utcnow()
-
-        if campaign.current_amount < campaign.goal_amount:
-            donations_stmt = select(Donation).where(
-                Donation.campaign_id == campaign.id,
-                Donation.donation_state_id == 2
-            )
-            donations = session.exec(donations_stmt).all()
-
-            for donation in donations:
-                donation.donation_state_id = 4
-                session.add(donation)
-
-            processed.append({
-                "campaign_id": campaign.id,
-                "title": campaign.tittle,
-                "donations_refunded": len(donations)
-            })
-        else:
-            processed.append({
-                "campaign_id": campaign.id,
-                "title": campaign.tittle,
-                "donations_refunded": 0,
-                "goal_reached": True
-            })
-
-        session.add(campaign)
-
-    session.commit()
+    if processed:
+        invalidate_rails()
+        invalidate_category_catalog()
 
     return {
         "message": f"Procesadas {len(processed)} campañas expiradas",
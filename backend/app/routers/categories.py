@@ -1,13 +1,15 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select, func
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import BaseModel
 
 from app.core.database import get_session
+from app.core.http_cache import snapshot_response
 from app.core.security import get_current_admin_user
-from app.models.category import Category, CategoryResponse
-from app.models.category_requirement import CategoryRequirement
+from app.models.category import Category, CategoryResponse, CategorySummary
 from app.models.person import Person
+from app.services.category_catalog import get_category_catalog, invalidate_category_catalog
 
 router = APIRouter(prefix="/categories", tags=["Categorías"])
 
@@ -19,37 +21,23 @@ class CategoryUpdate(BaseModel):
     name: str = None
     image_url: str = None
 
-@router.get("/")
+@router.get("/", response_model=List[CategorySummary])
 async def get_categories(
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session)
 ):
 
-    statement = select(Category)
-    categories = session.exec(statement).all()
+    _, body, etag = await get_category_catalog(session)
 
-    result = []
-    for cat in categories:
-        count_stmt = select(func.count(CategoryRequirement.id)).where(
-            CategoryRequirement.category_id == cat.id
-        )
-        req_count = session.exec(count_stmt).one()
-
-        result.append({
-            "id": cat.id,
-            "name": cat.name,
-            "image_url": cat.image_url,
-            "requirements_count": req_count
-        })
-
-    return result
+    return snapshot_response(request, body, etag, "public, no-cache")
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get_category(
     category_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
 
     if not category:
         return None
@@ -63,12 +51,12 @@ async def get_category(
 @router.post("/", response_model=CategoryResponse)
 async def create_category(
     category_data: CategoryCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
     statement = select(Category).where(Category.name == category_data.name)
-    existing = session.exec(statement).first()
+    existing = (await session.exec(statement)).first()
 
     if existing:
         raise HTTPException(
@@ -82,8 +70,9 @@ async def create_category(
     )
 
     session.add(new_category)
-    session.commit()
-    session.refresh(new_category)
+    await session.commit()
+    invalidate_category_catalog()
+    await session.refresh(new_category)
 
     return CategoryResponse(
         id=new_category.id,
@@ -95,11 +84,11 @@ async def create_category(
 async def update_category(
     category_id: int,
     category_data: CategoryUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
 
     if not category:
         raise HTTPException(
@@ -113,8 +102,9 @@ async def update_category(
         category.image_url = category_data.image_url
 
     session.add(category)
-    session.commit()
-    session.refresh(category)
+    await session.commit()
+    invalidate_category_catalog()
+    await session.refresh(category)
 
     return CategoryResponse(
         id=category.id,
@@ -125,11 +115,11 @@ async def update_category(
 @router.delete("/{category_id}")
 async def delete_category(
     category_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
 
     if not category:
         raise HTTPException(
@@ -138,16 +128,17 @@ async def delete_category(
         )
 
     from app.models.campaign import Campaign
-    statement = select(Campaign).where(Campaign.category_id == category_id)
-    campaigns_using = session.exec(statement).first()
+    statement = select(Campaign.id).where(Campaign.category_id == category_id).limit(1)
+    campaigns_using = (await session.exec(statement)).first()
 
-    if campaigns_using:
+    if campaigns_using is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No se puede eliminar: hay campañas usando esta categoría"
         )
 
-    session.delete(category)
-    session.commit()
+    await session.delete(category)
+    await session.commit()
+    invalidate_category_catalog()
 
     return {"message": "Categoría eliminada exitosamente"}
@@ -1,25 +1,14 @@
 from typing import List
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Request
 
-from app.core.database import get_session
-from app.models.country import Country
+from app.core.http_cache import snapshot_response
+from app.services.reference_data import reference_data
 
 router = APIRouter(prefix="/countries", tags=["Países"])
 
 @router.get("/", response_model=List[dict])
-async def get_countries(
-    session: Session = Depends(get_session)
-):
+async def get_countries(request: Request):
 
-    statement = select(Country).order_by(Country.name)
-    countries = session.exec(statement).all()
+    body, etag = reference_data.snapshot("countries")
 
-    return [
-        {
-            "id": country.id,
-            "name": country.name,
-            "code": country.code
-        }
-        for country in countries
-    ]
+    return snapshot_response(request, body, etag, "public, max-age=3600")
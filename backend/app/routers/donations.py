@@ -1,8 +1,9 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
-import httpx
 import os
 
 from app.core.database import get_session
@@ -11,21 +12,31 @@ from app.models.person import Person
 from app.models.campaign import Campaign
 from app.models.category import Category
 from app.models.donation import Donation, DonationCreate, DonationResponse, MyDonationResponse
-from app.models.donation_state import DonationState
+from app.services.campaign_funding import add_confirmed_amount, confirm_gateway_donation
+from app.services.campaign_progress import campaign_progress
+from app.services.campaign_rails import invalidate_rails
+from app.services.category_catalog import invalidate_category_catalog
+from app.services.donation_events import (
+    donation_events,
+    donation_status_payload,
+    donation_status_stream,
+    publish_donation_status
+)
+from app.services.payment_gateway import GatewayError, payment_gateway
+from app.services.reference_data import reference_data
 
 router = APIRouter(prefix="/donations", tags=["Donaciones"])
 
-GATEWAY_URL = os.getenv("GATEWAY_URL", "http://gateway:3000/payments")
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:8080")
 
 @router.post("/", response_model=DonationResponse)
 async def create_donation(
     donation_data: DonationCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, donation_data.campaign_id)
+    campaign = await session.get(Campaign, donation_data.campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -51,23 +62,19 @@ async def create_donation(
             detail="El monto debe ser mayor a 0"
         )
 
-    gateway_payment_id = None
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                GATEWAY_URL,
-                json={"monto": float(donation_data.amount)},
-                timeout=10.0
-            )
-            if response.status_code == 201:
-                gateway_data = response.json()
-                gateway_payment_id = gateway_data.get("id")
-    except Exception as e:
+        gateway_payment_id = await payment_gateway.create_payment(donation_data.amount)
+    except GatewayError as e:
+        # Sin pago creado en el gateway no se registra la donación: nunca se confirma sin cobro
         print(f"Error llamando al gateway: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="El servicio de pagos no está disponible, intenta más tarde"
+        )
 
     new_donation = Donation(
         amount=donation_data.amount,
-        donation_state_id=1 if gateway_payment_id else 2,
+        donation_state_id=1,
         user_id=current_user.id,
         campaign_id=donation_data.campaign_id,
         payment_method_id=donation_data.payment_method_id,
@@ -76,21 +83,10 @@ async def create_donation(
     )
 
     session.add(new_donation)
+    await session.commit()
+    await session.refresh(new_donation)
 
-    if not gateway_payment_id:
-        campaign.current_amount += donation_data.amount
-        if campaign.current_amount >= campaign.goal_amount:
-            campaign.campaign_state_id = 4
-            campaign.end_date = datetime.utcnow().date()
-        campaign.updated_at = datetime.utcnow()
-        session.add(campaign)
-
-    session.commit()
-    session.refresh(new_donation)
-
-    payment_url = None
-    if gateway_payment_id:
-        payment_url = f"{FRONTEND_URL}/payment.html?donation_id={new_donation.id}&gateway_id={gateway_payment_id}&campaign_id={donation_data.campaign_id}"
+    payment_url = f"{FRONTEND_URL}/payment.html?donation_id={new_donation.id}&gateway_id={gateway_payment_id}&campaign_id={donation_data.campaign_id}"
 
     return DonationResponse(
         id=new_donation.id,
@@ -109,46 +105,49 @@ async def create_donation(
 @router.post("/confirm-payment")
 async def confirm_payment(
     payment_data: dict,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
     gateway_id = payment_data.get("id")
     if not gateway_id:
         raise HTTPException(status_code=400, detail="ID de pago requerido")
 
-    statement = select(Donation).where(Donation.gateway_payment_id == gateway_id)
-    donation = session.exec(statement).first()
+    confirmed = await confirm_gateway_donation(session, gateway_id)
 
-    if not donation:
-        raise HTTPException(status_code=404, detail="Donación no encontrada")
+    if not confirmed:
+        statement = select(Donation.donation_state_id).where(Donation.gateway_payment_id == gateway_id)
+        state_id = (await session.exec(statement)).first()
+        if state_id is None:
+            raise HTTPException(status_code=404, detail="Donación no encontrada")
 
-    if donation.donation_state_id == 2:
-        return {"message": "Pago ya confirmado"}
+        if state_id != 2:
+            # Una donación cancelada o reembolsada no se vuelve a sumar a la campaña
+            raise HTTPException(status_code=409, detail="La donación ya no está pendiente de pago")
 
-    donation.donation_state_id = 2
-    session.add(donation)
+        return {"message": "Pago ya confirmado"}
 
-    campaign = session.get(Campaign, donation.campaign_id)
-    if campaign:
-        campaign.current_amount += donation.amount
-        if campaign.current_amount >= campaign.goal_amount:
-            campaign.campaign_state_id = 4
-            campaign.end_date = datetime.utcnow().date()
-        campaign.updated_at = datetime.utcnow()
-        session.add(campaign)
+    progress = None
+    if confirmed.campaign_id:
+        progress = await add_confirmed_amount(session, confirmed.campaign_id, confirmed.amount)
 
-    session.commit()
+    await session.commit()
+    invalidate_rails()
+    if progress:
+        campaign_progress.notify(progress)
+        if progress.campaign_state_id == 4:
+            invalidate_category_catalog()
+    publish_donation_status(confirmed.id, confirmed.amount, 2, gateway_id)
 
-    return {"message": "Pago confirmado", "donation_id": donation.id}
+    return {"message": "Pago confirmado", "donation_id": confirmed.id}
 
 @router.get("/status/{donation_id}")
 async def get_donation_status(
     donation_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    donation = session.get(Donation, donation_id)
+    donation = await session.get(Donation, donation_id)
 
     if not donation:
         raise HTTPException(status_code=404, detail="Donación no encontrada")
@@ -156,17 +155,47 @@ async def get_donation_status(
     if donation.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="No autorizado")
 
-    return {
-        "id": donation.id,
-        "amount": float(donation.amount),
-        "state_id": donation.donation_state_id,
-        "state": "Completada" if donation.donation_state_id == 2 else "Pendiente",
-        "gateway_payment_id": donation.gateway_payment_id
-    }
+    return donation_status_payload(
+        donation.id,
+        donation.amount,
+        donation.donation_state_id,
+        donation.gateway_payment_id
+    )
+
+@router.get("/status/{donation_id}/stream")
+async def stream_donation_status(
+    donation_id: int,
+    session: AsyncSession = Depends(get_session),
+    current_user: Person = Depends(get_current_active_user)
+):
+
+    donation = await session.get(Donation, donation_id)
+
+    if not donation:
+        raise HTTPException(status_code=404, detail="Donación no encontrada")
+
+    if donation.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="No autorizado")
+
+    if donation_events.subscribers >= donation_events.max_subscribers:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Demasiadas conexiones abiertas, consulta el estado nuevamente",
+            headers={"Retry-After": "5"}
+        )
+
+    # Libera la conexión a la BD: el stream puede durar varios minutos
+    await session.close()
+
+    return StreamingResponse(
+        donation_status_stream(donation_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.get("/my-donations", response_model=List[MyDonationResponse])
 async def get_my_donations(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -174,25 +203,23 @@ async def get_my_donations(
         Donation.user_id == current_user.id,
         Donation.donation_state_id == 2
     ).order_by(Donation.created_at.desc())
-    donations = session.exec(statement).all()
+    donations = (await session.exec(statement)).all()
 
     result = []
     for donation in donations:
-        campaign = session.get(Campaign, donation.campaign_id)
+        campaign = await session.get(Campaign, donation.campaign_id)
         if not campaign:
             continue
 
-        donation_state = session.get(DonationState, donation.donation_state_id)
-
-        category = session.get(Category, campaign.category_id) if campaign.category_id else None
+        category = await session.get(Category, campaign.category_id) if campaign.category_id else None
 
-        creator = session.get(Person, campaign.user_id)
+        creator = await session.get(Person, campaign.user_id)
 
         result.append(MyDonationResponse(
             id=donation.id,
             amount=donation.amount,
             donation_state_id=donation.donation_state_id,
-            donation_state_name=donation_state.name if donation_state else None,
+            donation_state_name=reference_data.donation_states.get(donation.donation_state_id),
             created_at=donation.created_at,
             campaign_id=campaign.id,
             campaign_title=campaign.tittle,
@@ -209,11 +236,11 @@ async def get_my_donations(
 @router.put("/{donation_id}/cancel")
 async def cancel_donation(
     donation_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    donation = session.get(Donation, donation_id)
+    donation = await session.get(Donation, donation_id)
 
     if not donation:
         raise HTTPException(status_code=404, detail="Donación no encontrada")
@@ -226,18 +253,19 @@ async def cancel_donation(
 
     donation.donation_state_id = 3
     session.add(donation)
-    session.commit()
+    await session.commit()
+    publish_donation_status(donation.id, donation.amount, 3, donation.gateway_payment_id)
 
     return {"message": "Donación cancelada", "donation_id": donation.id}
 
 @router.get("/campaign/{campaign_id}", response_model=List[DonationResponse])
 async def get_campaign_donations(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -252,11 +280,11 @@ async def get_campaign_donations(
         )
 
     statement = select(Donation).where(Donation.campaign_id == campaign_id).order_by(Donation.amount.desc())
-    donations = session.exec(statement).all()
+    donations = (await session.exec(statement)).all()
 
     result = []
     for donation in donations:
-        user = session.get(Person, donation.user_id)
+        user = await session.get(Person, donation.user_id)
         result.append(DonationResponse(
             id=donation.id,
             amount=donation.amount,
@@ -274,10 +302,10 @@ async def get_campaign_donations(
 @router.get("/campaign/{campaign_id}/total")
 async def get_campaign_total(
     campaign_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -296,10 +324,10 @@ async def get_campaign_total(
 async def get_top_donors(
     campaign_id: int,
     limit: int = 10,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -312,11 +340,11 @@ async def get_top_donors(
         Donation.donation_state_id == 2
     ).order_by(Donation.amount.desc()).limit(limit)
 
-    donations = session.exec(statement).all()
+    donations = (await session.exec(statement)).all()
 
     result = []
     for donation in donations:
-        user = session.get(Person, donation.user_id)
+        user = await session.get(Person, donation.user_id)
         result.append({
             "user_name": f"{user.first_name} {user.last_name}" if user else "Anónimo",
             "user_image": user.profile_image_url if user else None,
@@ -329,10 +357,10 @@ async def get_top_donors(
 @router.get("/campaign/{campaign_id}/all")
 async def get_all_campaign_donations(
     campaign_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -346,18 +374,18 @@ async def get_all_campaign_donations(
             detail="Campaña no publicada"
         )
 
-    category = session.get(Category, campaign.category_id) if campaign.category_id else None
+    category = await session.get(Category, campaign.category_id) if campaign.category_id else None
 
     statement = select(Donation).where(
         Donation.campaign_id == campaign_id,
         Donation.donation_state_id == 2
     ).order_by(Donation.amount.desc())
 
-    donations = session.exec(statement).all()
+    donations = (await session.exec(statement)).all()
 
     donors = []
     for donation in donations:
-        user = session.get(Person, donation.user_id)
+        user = await session.get(Person, donation.user_id)
         donors.append({
             "id": donation.id,
             "user_name": f"{user.first_name} {user.last_name}" if user else "Anónimo",
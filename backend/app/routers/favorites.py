@@ -1,25 +1,27 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 
 from app.core.database import get_session
 from app.core.security import get_current_active_user
 from app.models.person import Person
 from app.models.campaign import Campaign, CampaignPublic
-from app.models.favorite import Favorite, FavoriteCreate, FavoriteResponse
-from app.models.category import Category
+from app.models.favorite import Favorite, FavoriteCreate, FavoriteResponse, FavoriteCheckRequest, FavoriteCheckResponse
+from app.services.campaign_rails import invalidate_rails
+from app.services.campaign_cards import card_statement, fetch_cards, favorite_campaign_ids
 
 router = APIRouter(prefix="/favorites", tags=["Favoritos"])
 
 @router.post("/", response_model=FavoriteResponse)
 async def add_favorite(
     favorite_data: FavoriteCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, favorite_data.campaign_id)
+    campaign = await session.get(Campaign, favorite_data.campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -31,7 +33,7 @@ async def add_favorite(
         Favorite.user_id == current_user.id,
         Favorite.campaign_id == favorite_data.campaign_id
     )
-    existing = session.exec(statement).first()
+    existing = (await session.exec(statement)).first()
 
     if existing:
         raise HTTPException(
@@ -50,8 +52,9 @@ async def add_favorite(
     campaign.favorites_counting += 1
     session.add(campaign)
 
-    session.commit()
-    session.refresh(new_favorite)
+    await session.commit()
+    invalidate_rails()
+    await session.refresh(new_favorite)
 
     return FavoriteResponse(
         id=new_favorite.id,
@@ -63,7 +66,7 @@ async def add_favorite(
 @router.delete("/{campaign_id}")
 async def remove_favorite(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -71,7 +74,7 @@ async def remove_favorite(
         Favorite.user_id == current_user.id,
         Favorite.campaign_id == campaign_id
     )
-    favorite = session.exec(statement).first()
+    favorite = (await session.exec(statement)).first()
 
     if not favorite:
         raise HTTPException(
@@ -79,58 +82,46 @@ async def remove_favorite(
             detail="La campaña no está en tus favoritos"
         )
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
     if campaign and campaign.favorites_counting > 0:
         campaign.favorites_counting -= 1
         session.add(campaign)
 
-    session.delete(favorite)
-    session.commit()
+    await session.delete(favorite)
+    await session.commit()
+    invalidate_rails()
 
     return {"message": "Campaña eliminada de favoritos"}
 
 @router.get("/", response_model=List[CampaignPublic])
 async def get_my_favorites(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    statement = select(Favorite).where(Favorite.user_id == current_user.id)
-    favorites = session.exec(statement).all()
-
-    result = []
-    for favorite in favorites:
-        campaign = session.get(Campaign, favorite.campaign_id)
-        if campaign:
-            progress = 0.0
-            if campaign.goal_amount and campaign.goal_amount > 0:
-                progress = float(campaign.current_amount / campaign.goal_amount * 100)
-
-            user = session.get(Person, campaign.user_id)
-            category = session.get(Category, campaign.category_id) if campaign.category_id else None
-
-            result.append(CampaignPublic(
-                id=campaign.id,
-                tittle=campaign.tittle,
-                description=campaign.description,
-                goal_amount=campaign.goal_amount,
-                current_amount=campaign.current_amount,
-                expiration_date=campaign.expiration_date,
-                main_image_url=campaign.main_image_url,
-                view_counting=campaign.view_counting,
-                favorites_counting=campaign.favorites_counting,
-                user_first_name=user.first_name if user else None,
-                user_last_name=user.last_name if user else None,
-                category_name=category.name if category else None,
-                progress_percentage=round(progress, 2)
-            ))
-
-    return result
+    statement = card_statement(Favorite.user_id == current_user.id).join(
+        Favorite, Favorite.campaign_id == Campaign.id
+    )
+
+    return await fetch_cards(session, statement)
+
+@router.post("/check", response_model=FavoriteCheckResponse)
+async def check_favorites(
+    check_data: FavoriteCheckRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: Person = Depends(get_current_active_user)
+):
+
+    favorite_ids = await favorite_campaign_ids(session, current_user.id, check_data.campaign_ids)
+
+    return FavoriteCheckResponse(
+        favorite_ids=[campaign_id for campaign_id in dict.fromkeys(check_data.campaign_ids) if campaign_id in favorite_ids]
+    )
 
 @router.get("/check/{campaign_id}")
 async def check_favorite(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -138,6 +129,6 @@ async def check_favorite(
         Favorite.user_id == current_user.id,
         Favorite.campaign_id == campaign_id
     )
-    favorite = session.exec(statement).first()
+    favorite = (await session.exec(statement)).first()
 
     return {"is_favorite": favorite is not None}
@@ -0,0 +1,60 @@
+import asyncio
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.database import async_session, get_session
+from app.core.http_cache import etag_response
+from app.core.security import get_optional_user
+from app.models.person import Person
+from app.models.campaign import CampaignPublic
+from app.models.category import CategorySummary
+from app.services.campaign_cards import favorite_campaign_ids, mark_favorites
+from app.services.campaign_rails import get_rail
+from app.services.category_catalog import get_category_summaries
+
+router = APIRouter(prefix="/home", tags=["Inicio"])
+
+class HomeResponse(BaseModel):
+    categories: List[CategorySummary]
+    featured: List[CampaignPublic]
+    popular: List[CampaignPublic]
+
+async def load_categories() -> List[CategorySummary]:
+    async with async_session() as session:
+        return await get_category_summaries(session)
+
+async def load_rail(rail: str, limit: int) -> List[CampaignPublic]:
+    async with async_session() as session:
+        return await get_rail(session, rail, limit)
+
+@router.get("", response_model=HomeResponse)
+async def get_home(
+    request: Request,
+    featured_limit: int = Query(default=5, ge=1, le=20),
+    popular_limit: int = Query(default=9, ge=1, le=20),
+    include_favorite_state: bool = False,
+    session: AsyncSession = Depends(get_session),
+    viewer: Optional[Person] = Depends(get_optional_user)
+):
+
+    categories, featured, popular = await asyncio.gather(
+        load_categories(),
+        load_rail("featured", featured_limit),
+        load_rail("popular", popular_limit)
+    )
+
+    personalized = include_favorite_state and viewer is not None
+    if personalized:
+        campaign_ids = list({card.id for card in featured + popular})
+        favorite_ids = await favorite_campaign_ids(session, viewer.id, campaign_ids)
+        featured = mark_favorites(featured, favorite_ids)
+        popular = mark_favorites(popular, favorite_ids)
+
+    return etag_response(
+        request,
+        HomeResponse(categories=categories, featured=featured, popular=popular),
+        cache_control="private, no-cache" if personalized else "public, no-cache",
+        vary="Authorization"
+    )
@@ -1,24 +1,14 @@
 from typing import List
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Request
 
-from app.core.database import get_session
-from app.models.payment_method import PaymentMethod
+from app.core.http_cache import snapshot_response
+from app.services.reference_data import reference_data
 
 router = APIRouter(prefix="/payment-methods", tags=["Métodos de Pago"])
 
 @router.get("/", response_model=List[dict])
-async def get_payment_methods(
-    session: Session = Depends(get_session)
-):
+async def get_payment_methods(request: Request):
 
-    statement = select(PaymentMethod)
-    methods = session.exec(statement).all()
+    body, etag = reference_data.snapshot("payment_methods")
 
-    return [
-        {
-            "id": method.id,
-            "name": method.name
-        }
-        for method in methods
-    ]
+    return snapshot_response(request, body, etag, "public, max-age=3600")
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -13,7 +14,8 @@ from app.models.campaign_requirement_response import (
     CampaignRequirementResponse,
     RequirementResponseCreate
 )
-from app.models.requirement_type import RequirementType
+from app.services.category_catalog import invalidate_category_catalog
+from app.services.reference_data import reference_data
 
 router = APIRouter(prefix="/requirements", tags=["Requisitos"])
 
@@ -38,20 +40,17 @@ class RequirementWithType:
 @router.get("/category/{category_id}")
 async def get_requirements_by_category(
     category_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
     statement = select(CategoryRequirement).where(
         CategoryRequirement.category_id == category_id
     ).order_by(CategoryRequirement.order_index)
 
-    requirements = session.exec(statement).all()
+    requirements = (await session.exec(statement)).all()
 
     result = []
     for req in requirements:
-        req_type = session.get(RequirementType, req.requirements_type_id)
-        type_name = req_type.name if req_type else "Texto"
-
         result.append({
             "id": req.id,
             "name": req.requirement_name,
@@ -60,7 +59,7 @@ async def get_requirements_by_category(
             "order_index": req.order_index,
             "category_id": req.category_id,
             "requirement_type_id": req.requirements_type_id,
-            "type_name": type_name
+            "type_name": reference_data.requirement_types.get(req.requirements_type_id, "Texto")
         })
 
     return result
@@ -68,14 +67,14 @@ async def get_requirements_by_category(
 @router.post("")
 async def create_requirement(
     data: RequirementCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
     statement = select(CategoryRequirement).where(
         CategoryRequirement.category_id == data.category_id
     ).order_by(CategoryRequirement.order_index.desc())
-    last_req = session.exec(statement).first()
+    last_req = (await session.exec(statement)).first()
     next_order = (last_req.order_index + 1) if last_req else 1
 
     new_req = CategoryRequirement(
@@ -88,8 +87,9 @@ async def create_requirement(
     )
 
     session.add(new_req)
-    session.commit()
-    session.refresh(new_req)
+    await session.commit()
+    invalidate_category_catalog()
+    await session.refresh(new_req)
 
     return {"message": "Requisito creado", "id": new_req.id}
 
@@ -97,11 +97,11 @@ async def create_requirement(
 async def update_requirement(
     requirement_id: int,
     data: RequirementCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    req = session.get(CategoryRequirement, requirement_id)
+    req = await session.get(CategoryRequirement, requirement_id)
 
     if not req:
         raise HTTPException(
@@ -115,18 +115,19 @@ async def update_requirement(
     req.is_required = data.is_required
 
     session.add(req)
-    session.commit()
+    await session.commit()
+    invalidate_category_catalog()
 
     return {"message": "Requisito actualizado"}
 
 @router.delete("/{requirement_id}")
 async def delete_requirement(
     requirement_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_admin_user)
 ):
 
-    req = session.get(CategoryRequirement, requirement_id)
+    req = await session.get(CategoryRequirement, requirement_id)
 
     if not req:
         raise HTTPException(
@@ -134,19 +135,20 @@ async def delete_requirement(
             detail="Requisito no encontrado"
         )
 
-    session.delete(req)
-    session.commit()
+    await session.delete(req)
+    await session.commit()
+    invalidate_category_catalog()
 
     return {"message": "Requisito eliminado"}
 
 @router.get("/campaign/{campaign_id}")
 async def get_campaign_requirement_responses(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -164,11 +166,11 @@ async def get_campaign_requirement_responses(
         CampaignRequirementResponse.campaign_id == campaign_id
     )
 
-    responses = session.exec(statement).all()
+    responses = (await session.exec(statement)).all()
 
     result = []
     for resp in responses:
-        req = session.get(CategoryRequirement, resp.requirement_id)
+        req = await session.get(CategoryRequirement, resp.requirement_id)
         result.append({
             "id": resp.id,
             "campaign_id": resp.campaign_id,
@@ -184,11 +186,11 @@ async def get_campaign_requirement_responses(
 async def save_campaign_requirement_responses(
     campaign_id: int,
     responses: List[RequirementResponseCreate],
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -211,13 +213,13 @@ async def save_campaign_requirement_responses(
     statement = select(CampaignRequirementResponse).where(
         CampaignRequirementResponse.campaign_id == campaign_id
     )
-    existing = session.exec(statement).all()
+    existing = (await session.exec(statement)).all()
     for r in existing:
-        session.delete(r)
+        await session.delete(r)
 
     saved = []
     for resp in responses:
-        req = session.get(CategoryRequirement, resp.requirement_id)
+        req = await session.get(CategoryRequirement, resp.requirement_id)
         if not req:
             continue
 
@@ -232,18 +234,18 @@ async def save_campaign_requirement_responses(
         session.add(new_response)
         saved.append(new_response)
 
-    session.commit()
+    await session.commit()
 
     return {"message": f"Se guardaron {len(saved)} respuestas de requisitos"}
 
 @router.post("/campaign/{campaign_id}/validate")
 async def validate_campaign_requirements(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, campaign_id)
+    campaign = await session.get(Campaign, campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -267,12 +269,12 @@ async def validate_campaign_requirements(
         CategoryRequirement.category_id == campaign.category_id,
         CategoryRequirement.is_required == True
     )
-    required_reqs = session.exec(statement).all()
+    required_reqs = (await session.exec(statement)).all()
 
     statement = select(CampaignRequirementResponse).where(
         CampaignRequirementResponse.campaign_id == campaign_id
     )
-    responses = session.exec(statement).all()
+    responses = (await session.exec(statement)).all()
 
     response_map = {r.requirement_id: r for r in responses}
 
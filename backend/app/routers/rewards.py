@@ -1,37 +1,50 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select, func
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 from decimal import Decimal
+from datetime import datetime
 
 from app.core.database import get_session
+from app.core.http_cache import etag_response, not_modified, version_etag
 from app.core.security import get_current_active_user
 from app.models.person import Person
 from app.models.campaign import Campaign
 from app.models.reward import Reward, RewardCreate, RewardUpdate, RewardResponse
 from app.models.reward_claim import RewardClaim, RewardClaimCreate, RewardClaimResponse
 from app.models.donation import Donation
+from app.services.campaign_page import fetch_rewards
 
 router = APIRouter(prefix="/rewards", tags=["Recompensas"])
 
 @router.get("/campaign/{campaign_id}", response_model=List[RewardResponse])
 async def get_campaign_rewards(
     campaign_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session)
 ):
 
-    statement = select(Reward).where(Reward.campaign_id == campaign_id).order_by(Reward.amount)
-    rewards = session.exec(statement).all()
+    # Toda escritura sobre una recompensa mueve updated_at y un borrado cambia el conteo
+    statement = select(func.count(Reward.id), func.max(Reward.updated_at)).where(Reward.campaign_id == campaign_id)
+    version = (await session.exec(statement)).one()
 
-    return rewards
+    etag = version_etag("rewards", campaign_id, *version)
+    response = not_modified(request, etag, "public, no-cache")
+    if response is not None:
+        return response
+
+    rewards = await fetch_rewards(session, campaign_id)
+
+    return etag_response(request, rewards, "public, no-cache", etag=etag)
 
 @router.post("/", response_model=RewardResponse)
 async def create_reward(
     reward_data: RewardCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    campaign = session.get(Campaign, reward_data.campaign_id)
+    campaign = await session.get(Campaign, reward_data.campaign_id)
 
     if not campaign:
         raise HTTPException(
@@ -55,8 +68,8 @@ async def create_reward(
     )
 
     session.add(new_reward)
-    session.commit()
-    session.refresh(new_reward)
+    await session.commit()
+    await session.refresh(new_reward)
 
     return new_reward
 
@@ -64,11 +77,11 @@ async def create_reward(
 async def update_reward(
     reward_id: int,
     reward_data: RewardUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    reward = session.get(Reward, reward_id)
+    reward = await session.get(Reward, reward_id)
 
     if not reward:
         raise HTTPException(
@@ -76,7 +89,7 @@ async def update_reward(
             detail="Recompensa no encontrada"
         )
 
-    campaign = session.get(Campaign, reward.campaign_id)
+    campaign = await session.get(Campaign, reward.campaign_id)
     if campaign.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -93,21 +106,22 @@ async def update_reward(
         reward.stock = reward_data.stock
     if reward_data.image_url is not None:
         reward.image_url = reward_data.image_url
+    reward.updated_at = datetime.utcnow()
 
     session.add(reward)
-    session.commit()
-    session.refresh(reward)
+    await session.commit()
+    await session.refresh(reward)
 
     return reward
 
 @router.delete("/{reward_id}")
 async def delete_reward(
     reward_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    reward = session.get(Reward, reward_id)
+    reward = await session.get(Reward, reward_id)
 
     if not reward:
         raise HTTPException(
@@ -115,22 +129,22 @@ async def delete_reward(
             detail="Recompensa no encontrada"
         )
 
-    campaign = session.get(Campaign, reward.campaign_id)
+    campaign = await session.get(Campaign, reward.campaign_id)
     if campaign.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No tienes permiso para eliminar esta recompensa"
         )
 
-    session.delete(reward)
-    session.commit()
+    await session.delete(reward)
+    await session.commit()
 
     return {"message": "Recompensa eliminada exitosamente"}
 
 @router.get("/campaign/{campaign_id}/my-total")
 async def get_my_campaign_total(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -139,7 +153,7 @@ async def get_my_campaign_total(
         Donation.user_id == current_user.id,
         Donation.donation_state_id == 2
     )
-    total = session.exec(statement).first()
+    total = (await session.exec(statement)).first()
 
     return {
         "campaign_id": campaign_id,
@@ -150,7 +164,7 @@ async def get_my_campaign_total(
 @router.get("/campaign/{campaign_id}/my-claims")
 async def get_my_claims(
     campaign_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
@@ -158,18 +172,18 @@ async def get_my_claims(
         RewardClaim.campaign_id == campaign_id,
         RewardClaim.user_id == current_user.id
     )
-    claims = session.exec(statement).all()
+    claims = (await session.exec(statement)).all()
 
     return [claim.reward_id for claim in claims]
 
 @router.post("/claim", response_model=RewardClaimResponse)
 async def claim_reward(
     claim_data: RewardClaimCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: Person = Depends(get_current_active_user)
 ):
 
-    reward = session.get(Reward, claim_data.reward_id)
+    reward = await session.get(Reward, claim_data.reward_id)
     if not reward:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -182,12 +196,12 @@ async def claim_reward(
             detail="La recompensa no pertenece a esta campaña"
         )
 
-    existing_claim = session.exec(
+    existing_claim = (await session.exec(
         select(RewardClaim).where(
             RewardClaim.user_id == current_user.id,
             RewardClaim.reward_id == claim_data.reward_id
         )
-    ).first()
+    )).first()
 
     if existing_claim:
         raise HTTPException(
@@ -195,13 +209,13 @@ async def claim_reward(
             detail="Ya has reclamado esta recompensa"
         )
 
-    total_donated = session.exec(
+    total_donated = (await session.exec(
         select(func.sum(Donation.amount)).where(
             Donation.campaign_id == claim_data.campaign_id,
             Donation.user_id == current_user.id,
             Donation.donation_state_id == 2
         )
-    ).first() or Decimal(0)
+    )).first() or Decimal(0)
 
     if total_donated < reward.amount:
         raise HTTPException(
@@ -225,12 +239,13 @@ async def claim_reward(
 
     if reward.stock is not None:
         reward.stock -= 1
+        reward.updated_at = datetime.utcnow()
         session.add(reward)
 
-    session.commit()
-    session.refresh(new_claim)
+    await session.commit()
+    await session.refresh(new_claim)
 
-    campaign = session.get(Campaign, claim_data.campaign_id)
+    campaign = await session.get(Campaign, claim_data.campaign_id)
 
     return RewardClaimResponse(
         id=new_claim.id,
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.database import get_session
 from app.models.person import Person, PersonPublic
@@ -9,10 +10,10 @@ router = APIRouter(prefix="/users", tags=["Usuarios"])
 @router.get("/{user_id}", response_model=PersonPublic)
 async def get_user_public(
     user_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
 
-    user = session.get(Person, user_id)
+    user = await session.get(Person, user_id)
 
     if not user:
         raise HTTPException(
@@ -0,0 +1,149 @@
+from typing import List, Optional, Set, Tuple
+from datetime import datetime
+import base64
+import json
+from sqlalchemy import case, cast, tuple_, Numeric
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.person import Person
+from app.models.campaign import Campaign, CampaignPublic
+from app.models.category import Category
+from app.models.favorite import Favorite
+
+PUBLISHED_IN_PROGRESS = (
+    Campaign.workflow_state_id == 5,
+    Campaign.campaign_state_id == 2
+)
+
+progress_percentage = case(
+    (
+        Campaign.goal_amount > 0,
+        func.round(cast(Campaign.current_amount * 100 / Campaign.goal_amount, Numeric), 2)
+    ),
+    else_=0
+)
+
+CURSOR_SORTS = {
+    "recent": Campaign.created_at,
+    "favorites": Campaign.favorites_counting
+}
+
+def card_statement(*where):
+
+    return select(
+        Campaign.id,
+        Campaign.tittle,
+        Campaign.description,
+        Campaign.goal_amount,
+        Campaign.current_amount,
+        Campaign.expiration_date,
+        Campaign.main_image_url,
+        Campaign.view_counting,
+        Campaign.favorites_counting,
+        Person.first_name.label("user_first_name"),
+        Person.last_name.label("user_last_name"),
+        Person.profile_image_url.label("user_profile_image_url"),
+        Category.name.label("category_name"),
+        progress_percentage.label("progress_percentage")
+    ).outerjoin(
+        Person, Person.id == Campaign.user_id
+    ).outerjoin(
+        Category, Category.id == Campaign.category_id
+    ).where(*where)
+
+async def fetch_cards(session: AsyncSession, statement) -> List[CampaignPublic]:
+
+    rows = (await session.exec(statement)).all()
+
+    return [CampaignPublic(**row._mapping) for row in rows]
+
+async def favorite_campaign_ids(session: AsyncSession, user_id: int, campaign_ids: List[int]) -> Set[int]:
+
+    if not campaign_ids:
+        return set()
+
+    statement = select(Favorite.campaign_id).where(
+        Favorite.user_id == user_id,
+        Favorite.campaign_id.in_(campaign_ids)
+    )
+
+    return set((await session.exec(statement)).all())
+
+async def with_favorite_state(
+    session: AsyncSession,
+    viewer: Optional[Person],
+    cards: List[CampaignPublic]
+) -> List[CampaignPublic]:
+
+    if viewer is None:
+        return cards
+
+    favorite_ids = await favorite_campaign_ids(session, viewer.id, [card.id for card in cards])
+
+    return mark_favorites(cards, favorite_ids)
+
+def mark_favorites(cards: List[CampaignPublic], favorite_ids: Set[int]) -> List[CampaignPublic]:
+
+    # Copias: las tarjetas de los rieles están compartidas en caché
+    return [card.model_copy(update={"is_favorite": card.id in favorite_ids}) for card in cards]
+
+def encode_cursor(sort: str, value, campaign_id: int) -> str:
+
+    if isinstance(value, datetime):
+        value = value.isoformat()
+
+    raw = json.dumps({"s": sort, "v": value, "id": campaign_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(sort: str, cursor: str) -> Tuple:
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if data["s"] != sort:
+            raise ValueError("El cursor pertenece a otro orden")
+        value = data["v"]
+        if sort == "recent":
+            value = datetime.fromisoformat(value)
+        else:
+            value = int(value)
+        return value, int(data["id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
+
+async def fetch_card_page(
+    session: AsyncSession,
+    where: list,
+    sort: str,
+    cursor: Optional[str],
+    page_size: int
+) -> Tuple[List[CampaignPublic], Optional[str]]:
+
+    sort_column = CURSOR_SORTS[sort]
+
+    statement = card_statement(*where).add_columns(
+        sort_column.label("sort_key")
+    ).order_by(
+        sort_column.desc(), Campaign.id.desc()
+    ).limit(page_size + 1)
+
+    if cursor:
+        value, last_id = decode_cursor(sort, cursor)
+        statement = statement.where(tuple_(sort_column, Campaign.id) < tuple_(value, last_id))
+
+    rows = (await session.exec(statement)).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, last.sort_key, last.id)
+
+    items = []
+    for row in rows:
+        data = dict(row._mapping)
+        data.pop("sort_key")
+        items.append(CampaignPublic(**data))
+
+    return items, next_cursor
@@ -0,0 +1,85 @@
+from datetime import date, datetime
+from typing import List
+from sqlalchemy import update
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.campaign import Campaign
+from app.models.donation import Donation
+from app.services.campaign_rails import invalidate_rails
+from app.services.category_catalog import invalidate_category_catalog
+
+async def expire_campaigns(session: AsyncSession, batch_size: int) -> List[dict]:
+
+    today = date.today()
+    processed = []
+
+    while True:
+        batch = select(Campaign.id).where(
+            Campaign.campaign_state_id == 2,
+            Campaign.expiration_date < today
+        ).order_by(Campaign.id).limit(batch_size).with_for_update(skip_locked=True)
+
+        finish = update(Campaign).where(
+            Campaign.id.in_(batch)
+        ).values(
+            campaign_state_id=4,
+            end_date=today,
+            updated_at=datetime.utcnow()
+        ).returning(
+            Campaign.id,
+            Campaign.tittle,
+            (Campaign.current_amount < Campaign.goal_amount).label("underfunded")
+        ).execution_options(synchronize_session=False)
+
+        campaigns = sorted((await session.execute(finish)).all(), key=lambda row: row.id)
+        if not campaigns:
+            break
+
+        underfunded = [row.id for row in campaigns if row.underfunded]
+        refunded = {}
+
+        if underfunded:
+            # UPDATE ... RETURNING dentro de un CTE solo existe en Postgres: reembolsa y cuenta en un viaje
+            refund = update(Donation).where(
+                Donation.campaign_id.in_(underfunded),
+                Donation.donation_state_id == 2
+            ).values(
+                donation_state_id=4
+            ).returning(Donation.campaign_id).cte("refunded")
+
+            counts = select(refund.c.campaign_id, func.count()).group_by(refund.c.campaign_id)
+            refunded = dict((await session.execute(counts)).all())
+
+        await session.commit()
+
+        for row in campaigns:
+            if row.underfunded:
+                processed.append({
+                    "campaign_id": row.id,
+                    "title": row.tittle,
+                    "donations_refunded": refunded.get(row.id, 0)
+                })
+            else:
+                processed.append({
+                    "campaign_id": row.id,
+                    "title": row.tittle,
+                    "donations_refunded": 0,
+                    "goal_reached": True
+                })
+
+        if len(campaigns) < batch_size:
+            break
+
+    return processed
+
+async def run_expiry_job():
+
+    async with async_session() as session:
+        processed = await expire_campaigns(session, settings.EXPIRY_BATCH_SIZE)
+
+    if processed:
+        invalidate_rails()
+        invalidate_category_catalog()
@@ -0,0 +1,47 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import case, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.campaign import Campaign
+from app.models.donation import Donation
+
+async def add_confirmed_amount(session: AsyncSession, campaign_id: int, amount: Decimal):
+
+    now = datetime.utcnow()
+    new_amount = Campaign.current_amount + amount
+    goal_reached = new_amount >= Campaign.goal_amount
+
+    statement = update(Campaign).where(
+        Campaign.id == campaign_id
+    ).values(
+        current_amount=new_amount,
+        campaign_state_id=case((goal_reached, 4), else_=Campaign.campaign_state_id),
+        end_date=case((goal_reached, now.date()), else_=Campaign.end_date),
+        updated_at=now
+    ).returning(
+        Campaign.id,
+        Campaign.current_amount,
+        Campaign.goal_amount,
+        Campaign.campaign_state_id
+    ).execution_options(synchronize_session=False)
+
+    result = await session.execute(statement)
+    return result.first()
+
+async def confirm_gateway_donation(session: AsyncSession, gateway_payment_id: str) -> Optional[tuple]:
+
+    statement = update(Donation).where(
+        Donation.gateway_payment_id == gateway_payment_id,
+        Donation.donation_state_id == 1
+    ).values(
+        donation_state_id=2
+    ).returning(
+        Donation.id,
+        Donation.amount,
+        Donation.campaign_id
+    ).execution_options(synchronize_session=False)
+
+    result = await session.execute(statement)
+    return result.first()
@@ -0,0 +1,113 @@
+from typing import List, Optional
+from sqlalchemy import and_, exists
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.person import Person
+from app.models.campaign import Campaign, CampaignDetailPublic, CampaignViewerState, TopDonor
+from app.models.category import Category
+from app.models.donation import Donation
+from app.models.favorite import Favorite
+from app.models.reward import Reward, RewardResponse
+from app.models.reward_claim import RewardClaim
+from app.services.campaign_cards import progress_percentage
+
+async def fetch_campaign_detail(session: AsyncSession, campaign_id: int) -> Optional[CampaignDetailPublic]:
+
+    statement = select(
+        Campaign.id,
+        Campaign.tittle,
+        Campaign.description,
+        Campaign.goal_amount,
+        Campaign.current_amount,
+        Campaign.expiration_date,
+        Campaign.main_image_url,
+        Campaign.rich_text,
+        Campaign.start_date,
+        Campaign.end_date,
+        Campaign.view_counting,
+        Campaign.favorites_counting,
+        Campaign.workflow_state_id,
+        Campaign.campaign_state_id,
+        Campaign.category_id,
+        Category.name.label("category_name"),
+        Campaign.user_id,
+        Person.first_name.label("user_first_name"),
+        Person.last_name.label("user_last_name"),
+        Person.profile_image_url.label("user_profile_image_url"),
+        progress_percentage.label("progress_percentage")
+    ).outerjoin(
+        Person, Person.id == Campaign.user_id
+    ).outerjoin(
+        Category, Category.id == Campaign.category_id
+    ).where(Campaign.id == campaign_id)
+
+    row = (await session.exec(statement)).first()
+
+    return CampaignDetailPublic(**row._mapping) if row else None
+
+async def fetch_rewards(session: AsyncSession, campaign_id: int) -> List[RewardResponse]:
+
+    statement = select(Reward).where(Reward.campaign_id == campaign_id).order_by(Reward.amount)
+    rewards = (await session.exec(statement)).all()
+
+    return [RewardResponse.model_validate(reward, from_attributes=True) for reward in rewards]
+
+async def fetch_top_donors(session: AsyncSession, campaign_id: int, limit: int) -> List[TopDonor]:
+
+    statement = select(
+        Donation.amount,
+        Donation.created_at,
+        Person.first_name,
+        Person.last_name,
+        Person.profile_image_url
+    ).outerjoin(
+        Person, Person.id == Donation.user_id
+    ).where(
+        Donation.campaign_id == campaign_id,
+        Donation.donation_state_id == 2
+    ).order_by(Donation.amount.desc()).limit(limit)
+
+    rows = (await session.exec(statement)).all()
+
+    return [
+        TopDonor(
+            user_name=f"{row.first_name} {row.last_name}" if row.first_name is not None else "Anónimo",
+            user_image=row.profile_image_url,
+            amount=float(row.amount),
+            created_at=row.created_at
+        )
+        for row in rows
+    ]
+
+async def fetch_viewer_state(session: AsyncSession, campaign_id: int, user_id: int) -> CampaignViewerState:
+
+    is_favorite = exists().where(
+        Favorite.user_id == user_id,
+        Favorite.campaign_id == campaign_id
+    )
+    total_donated = select(func.coalesce(func.sum(Donation.amount), 0)).where(
+        Donation.campaign_id == campaign_id,
+        Donation.user_id == user_id,
+        Donation.donation_state_id == 2
+    ).scalar_subquery()
+
+    # Una fila por recompensa reclamada (o una sola fila con reward_id nulo)
+    statement = select(
+        is_favorite.label("is_favorite"),
+        total_donated.label("total_donated"),
+        RewardClaim.reward_id
+    ).select_from(Campaign).outerjoin(
+        RewardClaim,
+        and_(RewardClaim.campaign_id == Campaign.id, RewardClaim.user_id == user_id)
+    ).where(Campaign.id == campaign_id)
+
+    rows = (await session.exec(statement)).all()
+    if not rows:
+        return CampaignViewerState()
+
+    return CampaignViewerState(
+        is_favorite=bool(rows[0].is_favorite),
+        total_donated=float(rows[0].total_donated),
+        claimed_reward_ids=[row.reward_id for row in rows if row.reward_id is not None]
+    )
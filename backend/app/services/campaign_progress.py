@@ -0,0 +1,147 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Dict, Optional
+from sqlmodel import select
+
+from app.core import metrics
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.pubsub import PubSub, SubscriptionLimitError, sse_event
+from app.models.campaign import Campaign
+
+def progress_payload(campaign_id: int, current_amount: Decimal, goal_amount: Decimal, campaign_state_id: int) -> dict:
+
+    progress = 0.0
+    if goal_amount and goal_amount > 0:
+        progress = float(current_amount / goal_amount * 100)
+
+    return {
+        "campaign_id": campaign_id,
+        "current_amount": float(current_amount),
+        "goal_amount": float(goal_amount),
+        "progress_percentage": round(progress, 2),
+        "campaign_state_id": campaign_state_id
+    }
+
+class CampaignProgressBroadcaster:
+
+    def __init__(self, min_interval: float, max_subscribers: int):
+        self.min_interval = min_interval
+        self.events = PubSub("campaign_progress", max_subscribers)
+        self.snapshots = TTLCache("campaign_progress", ttl=settings.SSE_HEARTBEAT_SECONDS, max_entries=1024)
+        self.coalesced = 0
+        self._pending: Dict[int, dict] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._last_publish: Dict[int, float] = {}
+        self._loading: Dict[int, asyncio.Future] = {}
+        metrics.register("campaign_progress", self.stats)
+
+    def notify(self, row):
+
+        payload = progress_payload(row.id, row.current_amount, row.goal_amount, row.campaign_state_id)
+        campaign_id = row.id
+        self.snapshots.set(campaign_id, payload)
+
+        if not self.events.has_subscribers(campaign_id):
+            return
+
+        if campaign_id in self._pending:
+            self.coalesced += 1
+        self._pending[campaign_id] = payload
+
+        if campaign_id in self._timers:
+            return
+
+        # Como máximo una publicación por campaña cada min_interval: las donaciones intermedias se agrupan
+        delay = max(0.0, self._last_publish.get(campaign_id, 0.0) + self.min_interval - time.monotonic())
+        self._timers[campaign_id] = asyncio.get_running_loop().call_later(delay, self._flush, campaign_id)
+
+    def _flush(self, campaign_id: int):
+
+        self._timers.pop(campaign_id, None)
+        payload = self._pending.pop(campaign_id, None)
+        if payload is None:
+            return
+
+        self._last_publish[campaign_id] = time.monotonic()
+        self.events.publish(campaign_id, payload)
+
+    async def _load(self, campaign_id: int) -> Optional[dict]:
+
+        async with async_session() as session:
+            statement = select(
+                Campaign.current_amount,
+                Campaign.goal_amount,
+                Campaign.campaign_state_id
+            ).where(Campaign.id == campaign_id, Campaign.workflow_state_id == 5)
+            row = (await session.exec(statement)).first()
+
+        if row is None:
+            return None
+
+        payload = progress_payload(campaign_id, row.current_amount, row.goal_amount, row.campaign_state_id)
+        self.snapshots.set(campaign_id, payload)
+        return payload
+
+    async def snapshot(self, campaign_id: int) -> Optional[dict]:
+
+        payload = self.snapshots.get(campaign_id)
+        if payload is not None:
+            return payload
+
+        # Todos los espectadores de la campaña comparten una sola lectura a la BD
+        loading = self._loading.get(campaign_id)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load(campaign_id))
+            self._loading[campaign_id] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(campaign_id, None))
+
+        return await asyncio.shield(loading)
+
+    async def stream(self, campaign_id: int):
+
+        try:
+            async for chunk in self._events(campaign_id):
+                yield chunk
+        except SubscriptionLimitError:
+            yield "retry: 5000\n\n"
+
+    async def _events(self, campaign_id: int):
+
+        deadline = time.monotonic() + settings.SSE_MAX_STREAM_SECONDS
+
+        async with self.events.subscribe(campaign_id) as queue:
+            last = await self.snapshot(campaign_id)
+            if last is None:
+                return
+
+            yield sse_event("progress", last)
+
+            while time.monotonic() < deadline:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Las donaciones confirmadas en otro worker se detectan al refrescar la instantánea
+                    payload = await self.snapshot(campaign_id)
+                    if payload is None or payload == last:
+                        yield ": ping\n\n"
+                        continue
+
+                if payload != last:
+                    last = payload
+                    yield sse_event("progress", payload)
+
+    def stats(self) -> dict:
+
+        return {
+            "coalesced": self.coalesced,
+            "pending_flushes": len(self._timers),
+            "min_interval_seconds": self.min_interval
+        }
+
+campaign_progress = CampaignProgressBroadcaster(
+    settings.CAMPAIGN_PROGRESS_MIN_INTERVAL_SECONDS,
+    settings.CAMPAIGN_STREAM_MAX_SUBSCRIBERS
+)
@@ -0,0 +1,35 @@
+from typing import List
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.campaign import Campaign, CampaignPublic
+from app.services.campaign_cards import PUBLISHED_IN_PROGRESS, card_statement, fetch_cards
+
+RAIL_ORDERS = {
+    "featured": Campaign.favorites_counting,
+    "popular": Campaign.view_counting
+}
+
+rails_cache = TTLCache(
+    "campaign_rails",
+    ttl=settings.RAILS_CACHE_TTL_SECONDS,
+    max_entries=settings.RAILS_CACHE_MAX_ENTRIES
+)
+
+async def get_rail(session: AsyncSession, rail: str, limit: int) -> List[CampaignPublic]:
+
+    key = (rail, limit)
+    cards = rails_cache.get(key)
+
+    if cards is None:
+        statement = card_statement(*PUBLISHED_IN_PROGRESS).order_by(
+            RAIL_ORDERS[rail].desc()
+        ).limit(limit)
+        cards = await fetch_cards(session, statement)
+        rails_cache.set(key, cards)
+
+    return cards
+
+def invalidate_rails():
+    rails_cache.clear()
@@ -0,0 +1,33 @@
+from sqlalchemy import literal_column
+from sqlmodel import func
+
+from app.models.campaign import Campaign
+
+# Las constantes se renderizan en línea para que la expresión coincida con
+# el índice idx_campaign_search definido en database/add_search.sql.
+SEARCH_CONFIG = literal_column("'es_unaccent'::regconfig")
+
+def _weighted(column, weight: str):
+
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, func.coalesce(column, literal_column("''"))),
+        literal_column(f"'{weight}'::\"char\"")
+    )
+
+search_vector = (
+    _weighted(Campaign.tittle, "A")
+    .op("||")(_weighted(Campaign.description, "B"))
+    .op("||")(_weighted(Campaign.rich_text, "C"))
+)
+
+def search_query(text: str):
+
+    return func.websearch_to_tsquery(SEARCH_CONFIG, text)
+
+def search_condition(text: str):
+
+    return search_vector.op("@@")(search_query(text))
+
+def search_rank(text: str):
+
+    return func.ts_rank_cd(search_vector, search_query(text))
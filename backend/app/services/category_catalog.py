@@ -0,0 +1,59 @@
+from typing import List, Tuple
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.http_cache import json_snapshot
+from app.models.campaign import Campaign
+from app.models.category import Category, CategorySummary
+from app.models.category_requirement import CategoryRequirement
+from app.services.campaign_cards import PUBLISHED_IN_PROGRESS
+
+catalog_cache = TTLCache("category_catalog", ttl=settings.CATEGORY_CACHE_TTL_SECONDS, max_entries=1)
+
+async def get_category_catalog(session: AsyncSession) -> Tuple[List[CategorySummary], bytes, str]:
+
+    catalog = catalog_cache.get("all")
+    if catalog is not None:
+        return catalog
+
+    requirements = select(
+        CategoryRequirement.category_id,
+        func.count(CategoryRequirement.id).label("total")
+    ).group_by(CategoryRequirement.category_id).subquery()
+
+    campaigns = select(
+        Campaign.category_id,
+        func.count(Campaign.id).label("total")
+    ).where(*PUBLISHED_IN_PROGRESS).group_by(Campaign.category_id).subquery()
+
+    statement = select(
+        Category.id,
+        Category.name,
+        Category.image_url,
+        func.coalesce(requirements.c.total, 0).label("requirements_count"),
+        func.coalesce(campaigns.c.total, 0).label("campaigns_count")
+    ).outerjoin(
+        requirements, requirements.c.category_id == Category.id
+    ).outerjoin(
+        campaigns, campaigns.c.category_id == Category.id
+    ).order_by(Category.id)
+
+    rows = (await session.exec(statement)).all()
+    summaries = [CategorySummary(**row._mapping) for row in rows]
+
+    # El ETag se calcula una vez por generación del caché: un 304 no consulta ni serializa
+    body, etag = json_snapshot(summaries)
+    catalog = (summaries, body, etag)
+
+    catalog_cache.set("all", catalog)
+    return catalog
+
+async def get_category_summaries(session: AsyncSession) -> List[CategorySummary]:
+
+    summaries, _, _ = await get_category_catalog(session)
+    return summaries
+
+def invalidate_category_catalog():
+    catalog_cache.clear()
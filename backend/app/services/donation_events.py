@@ -0,0 +1,72 @@
+import asyncio
+import time
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.pubsub import PubSub, SubscriptionLimitError, sse_event
+from app.models.donation import Donation
+from app.services.reference_data import reference_data
+
+donation_events = PubSub("donation_status", settings.DONATION_STREAM_MAX_SUBSCRIBERS)
+
+def donation_status_payload(donation_id: int, amount, state_id: int, gateway_payment_id: Optional[str]) -> dict:
+
+    return {
+        "id": donation_id,
+        "amount": float(amount),
+        "state_id": state_id,
+        "state": reference_data.donation_states.get(state_id, "Pendiente"),
+        "gateway_payment_id": gateway_payment_id
+    }
+
+def publish_donation_status(donation_id: int, amount, state_id: int, gateway_payment_id: Optional[str]):
+    donation_events.publish(donation_id, donation_status_payload(donation_id, amount, state_id, gateway_payment_id))
+
+async def load_donation_status(donation_id: int) -> Optional[dict]:
+
+    async with async_session() as session:
+        donation = await session.get(Donation, donation_id)
+
+    if not donation:
+        return None
+
+    return donation_status_payload(donation.id, donation.amount, donation.donation_state_id, donation.gateway_payment_id)
+
+async def donation_status_stream(donation_id: int):
+
+    try:
+        async for chunk in _donation_status_events(donation_id):
+            yield chunk
+    except SubscriptionLimitError:
+        yield "retry: 5000\n\n"
+
+async def _donation_status_events(donation_id: int):
+
+    deadline = time.monotonic() + settings.SSE_MAX_STREAM_SECONDS
+
+    # Se suscribe antes de leer el estado para no perder una confirmación intermedia
+    async with donation_events.subscribe(donation_id) as queue:
+        payload = await load_donation_status(donation_id)
+        if payload is None:
+            return
+
+        yield sse_event("status", payload)
+
+        while payload["state_id"] == 1:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if time.monotonic() >= deadline:
+                    return
+
+                # La confirmación pudo llegar a otro worker: se revisa la BD en cada heartbeat
+                current = await load_donation_status(donation_id)
+                if current is not None and current["state_id"] != 1:
+                    payload = current
+                    yield sse_event("status", payload)
+                else:
+                    yield ": ping\n\n"
+                continue
+
+            yield sse_event("status", payload)
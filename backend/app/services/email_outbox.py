@@ -0,0 +1,204 @@
+import time
+from datetime import datetime, timedelta
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import List, Optional, Tuple
+import aiosmtplib
+from sqlalchemy import update
+from sqlmodel import select
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.email_outbox import EmailOutbox
+
+def build_message(email: EmailOutbox) -> MIMEMultipart:
+
+    message = MIMEMultipart("alternative")
+    message["From"] = f"{settings.MAIL_FROM_NAME} <{settings.MAIL_FROM}>"
+    message["To"] = email.to_email
+    message["Subject"] = email.subject
+
+    html_part = MIMEText(email.html_content, "html")
+    message.attach(html_part)
+
+    return message
+
+class EmailOutboxWorker:
+
+    def __init__(self):
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dead = 0
+        self.batches = 0
+        self.connections = 0
+        self.last_batch: Optional[dict] = None
+        self.send_time = metrics.LatencyStats()
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        metrics.register("email_outbox", self.stats)
+
+    async def enqueue(self, to_email: str, subject: str, html_content: str) -> int:
+
+        async with async_session() as session:
+            email = EmailOutbox(to_email=to_email, subject=subject, html_content=html_content)
+            session.add(email)
+            await session.commit()
+
+        self.enqueued += 1
+        return email.id
+
+    async def _connection(self) -> aiosmtplib.SMTP:
+
+        if self._smtp is None or not self._smtp.is_connected:
+            smtp = aiosmtplib.SMTP(
+                hostname=settings.MAIL_SERVER,
+                port=settings.MAIL_PORT,
+                start_tls=settings.MAIL_STARTTLS,
+                timeout=settings.MAIL_TIMEOUT_SECONDS
+            )
+            await smtp.connect()
+            if settings.MAIL_USERNAME:
+                try:
+                    await smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+                except Exception:
+                    smtp.close()
+                    raise
+            self._smtp = smtp
+            self.connections += 1
+
+        return self._smtp
+
+    async def _deliver(self, email: EmailOutbox):
+
+        message = build_message(email)
+        try:
+            smtp = await self._connection()
+            await smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # El servidor cerró la conexión inactiva: se reconecta una vez
+            await self.close()
+            smtp = await self._connection()
+            await smtp.send_message(message)
+
+    def _schedule_retry(self, email: EmailOutbox, error: Exception) -> dict:
+
+        last_error = str(error)[:500]
+
+        permanent = isinstance(error, aiosmtplib.SMTPRecipientsRefused)
+        if permanent or email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            self.dead += 1
+            print(f"Error enviando email {email.id}, se descarta tras {email.attempts} intentos: {error}")
+            return {"status": "dead", "last_error": last_error}
+
+        backoff = settings.EMAIL_RETRY_BACKOFF_SECONDS * 2 ** (email.attempts - 1)
+        self.failed += 1
+        return {
+            "status": "pending",
+            "last_error": last_error,
+            "next_attempt_at": datetime.utcnow() + timedelta(seconds=min(backoff, settings.EMAIL_RETRY_MAX_BACKOFF_SECONDS))
+        }
+
+    async def _claim(self, batch_size: int) -> List[EmailOutbox]:
+
+        now = datetime.utcnow()
+        lease_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+
+        async with async_session() as session:
+            # Un "sending" con el lease vencido quedó de un worker que murió a mitad del lote
+            statement = select(EmailOutbox).where(
+                EmailOutbox.status.in_(("pending", "sending")),
+                EmailOutbox.next_attempt_at <= now
+            ).order_by(
+                EmailOutbox.next_attempt_at, EmailOutbox.id
+            ).limit(batch_size).with_for_update(skip_locked=True)
+
+            emails = (await session.exec(statement)).all()
+            for email in emails:
+                # El intento se cuenta al reclamar: un email que tumba al worker también llega a "dead"
+                email.status = "sending"
+                email.attempts += 1
+                email.next_attempt_at = lease_until
+                session.add(email)
+
+            await session.commit()
+
+        return emails
+
+    async def _record(self, results: List[Tuple[EmailOutbox, dict]]):
+
+        async with async_session() as session:
+            for email, values in results:
+                # Si el lease venció y otro worker reclamó el email, su resultado manda
+                statement = update(EmailOutbox).where(
+                    EmailOutbox.id == email.id,
+                    EmailOutbox.status == "sending",
+                    EmailOutbox.next_attempt_at == email.next_attempt_at
+                ).values(**values).execution_options(synchronize_session=False)
+                await session.execute(statement)
+
+            await session.commit()
+
+    async def drain(self, batch_size: Optional[int] = None) -> int:
+
+        batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+
+        emails = await self._claim(batch_size)
+        if not emails:
+            return 0
+
+        # Los envíos SMTP ocurren sin transacción ni bloqueos abiertos en la base
+        results = []
+        delivered = 0
+        started = time.perf_counter()
+        for email in emails:
+            sent_started = time.perf_counter()
+            try:
+                await self._deliver(email)
+            except Exception as e:
+                results.append((email, self._schedule_retry(email, e)))
+            else:
+                results.append((email, {"status": "sent", "sent_at": datetime.utcnow(), "last_error": None}))
+                self.sent += 1
+                delivered += 1
+                self.send_time.record(time.perf_counter() - sent_started)
+        elapsed = time.perf_counter() - started
+
+        await self._record(results)
+
+        self.batches += 1
+        self.last_batch = {
+            "size": len(emails),
+            "sent": delivered,
+            "seconds": round(elapsed, 3),
+            "per_second": round(delivered / elapsed, 2) if elapsed > 0 else None
+        }
+        return delivered
+
+    async def close(self):
+
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None and smtp.is_connected:
+            try:
+                await smtp.quit()
+            except Exception:
+                smtp.close()
+
+    def stats(self) -> dict:
+
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "retries_scheduled": self.failed,
+            "dead_lettered": self.dead,
+            "batches": self.batches,
+            "smtp_connections": self.connections,
+            "last_batch": self.last_batch,
+            "send_time": self.send_time.stats()
+        }
+
+email_outbox = EmailOutboxWorker()
+
+async def run_outbox_job():
+    while await email_outbox.drain() >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+        pass
@@ -1,42 +1,37 @@
-import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import Optional
 from app.core.config import settings
+from app.services.email_outbox import email_outbox
+from app.services.email_templates import email_templates
 
 async def send_email(to_email: str, subject: str, html_content: str):
 
-    message = MIMEMultipart("alternative")
-    message["From"] = f"{settings.MAIL_FROM_NAME} <{settings.MAIL_FROM}>"
-    message["To"] = to_email
-    message["Subject"] = subject
-
-    html_part = MIMEText(html_content, "html")
-    message.attach(html_part)
-
     try:
-        await aiosmtplib.send(
-            message,
-            hostname=settings.MAIL_SERVER,
-            port=settings.MAIL_PORT,
-            username=settings.MAIL_USERNAME,
-            password=settings.MAIL_PASSWORD,
-            start_tls=True,
-        )
+        await email_outbox.enqueue(to_email, subject, html_content)
         return True
     except Exception as e:
-        print(f"Error enviando email: {e}")
+        print(f"Error encolando email: {e}")
         return False
 
-async def send_verification_email(to_email: str, first_name: str, verification_token: str):
+async def send_template_email(to_email: str, template: str, locale: Optional[str] = None, **values):
 
-    verification_link = f"{settings.FRONTEND_URL}/verify.html?token={verification_token}"
+    subject, html_content = email_templates.render(template, locale, **values)
 
-    html_content = f
+    return await send_email(to_email, subject, html_content)
+
+async def send_verification_email(to_email: str, first_name: str, verification_token: str, locale: Optional[str] = None):
+
+    verification_link = f"{settings.FRONTEND_URL}/verify.html?token={verification_token}"
 
-    return await send_email(to_email, "Verifica tu cuenta en RiseUp", html_content)
+    return await send_template_email(
+        to_email,
+        "verification",
+        locale,
+        first_name=first_name,
+        verification_link=verification_link
+    )
 
-async def send_welcome_email(to_email: str, first_name: str):
+async def send_welcome_email(to_email: str, first_name: str, locale: Optional[str] = None):
 
-    html_content = f
+    login_link = f"{settings.FRONTEND_URL}/login.html"
 
-    return await send_email(to_email, "¡Bienvenido a RiseUp!", html_content)
+    return await send_template_email(to_email, "welcome", locale, first_name=first_name, login_link=login_link)
@@ -0,0 +1,92 @@
+import html
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.core import metrics
+from app.core.config import settings
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+class CompiledTemplate:
+
+    def __init__(self, source: str, escape: bool = True):
+        self.escape = escape
+        self.fragments: List[str] = []
+        self.fields: List[str] = []
+
+        position = 0
+        for match in PLACEHOLDER.finditer(source):
+            self.fragments.append(source[position:match.start()])
+            self.fields.append(match.group(1))
+            position = match.end()
+        self.fragments.append(source[position:])
+
+    def render(self, values: dict) -> str:
+
+        parts = [self.fragments[0]]
+        for field, fragment in zip(self.fields, self.fragments[1:]):
+            value = str(values[field])
+            parts.append(html.escape(value) if self.escape else value)
+            parts.append(fragment)
+        return "".join(parts)
+
+class EmailTemplates:
+
+    def __init__(self, directory: Path, default_locale: str):
+        self.directory = directory
+        self.default_locale = default_locale
+        self.renders = 0
+        self.render_time = metrics.LatencyStats()
+        self._templates: Dict[Tuple[str, str], Tuple[CompiledTemplate, CompiledTemplate]] = {}
+        metrics.register("email_templates", self.stats)
+
+    def load(self):
+
+        templates = {}
+        for locale_dir in sorted(p for p in self.directory.iterdir() if p.is_dir()):
+            layout_path = locale_dir / "layout.html"
+            layout = layout_path.read_text(encoding="utf-8") if layout_path.exists() else "{{ content }}"
+
+            for body_path in locale_dir.glob("*.html"):
+                if body_path.name == "layout.html":
+                    continue
+                name = body_path.stem
+                # El cuerpo se incrusta en el layout antes de compilar, así el HTML estático queda en un solo fragmento
+                body = layout.replace("{{ content }}", body_path.read_text(encoding="utf-8"))
+                subject = (locale_dir / f"{name}.subject.txt").read_text(encoding="utf-8").strip()
+                templates[(locale_dir.name, name)] = (
+                    CompiledTemplate(subject, escape=False),
+                    CompiledTemplate(body)
+                )
+
+        self._templates = templates
+
+    def render(self, name: str, locale: str = None, **values) -> Tuple[str, str]:
+
+        if not self._templates:
+            self.load()
+
+        template = self._templates.get((locale or self.default_locale, name))
+        if template is None:
+            template = self._templates[(self.default_locale, name)]
+
+        started = time.perf_counter()
+        subject, body = template
+        rendered = subject.render(values), body.render(values)
+        self.render_time.record(time.perf_counter() - started)
+        self.renders += 1
+        return rendered
+
+    def stats(self) -> dict:
+
+        return {
+            "templates": sorted(f"{locale}/{name}" for locale, name in self._templates),
+            "default_locale": self.default_locale,
+            "renders": self.renders,
+            "render_time": self.render_time.stats()
+        }
+
+email_templates = EmailTemplates(TEMPLATES_DIR, settings.MAIL_DEFAULT_LOCALE)
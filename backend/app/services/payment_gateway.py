@@ -0,0 +1,153 @@
+import asyncio
+import random
+import time
+from decimal import Decimal
+from typing import Optional
+import httpx
+
+from app.core import metrics
+from app.core.config import settings
+
+class GatewayError(Exception):
+    pass
+
+class CircuitOpenError(GatewayError):
+    pass
+
+class CircuitBreaker:
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+
+        if self.state == "closed":
+            return True
+
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            return False
+
+        # Una sola petición de prueba por ventana; si no termina, la siguiente ventana prueba otra
+        self.state = "half_open"
+        self.opened_at = now
+        return True
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+class GatewayClient:
+
+    def __init__(self, url: str):
+        self.url = url
+        self.breaker = CircuitBreaker(
+            settings.GATEWAY_BREAKER_THRESHOLD,
+            settings.GATEWAY_BREAKER_RESET_SECONDS
+        )
+        self.latency = metrics.LatencyStats()
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.rejected = 0
+        self._client: Optional[httpx.AsyncClient] = None
+        metrics.register("payment_gateway", self.stats)
+
+    def _get_client(self) -> httpx.AsyncClient:
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    settings.GATEWAY_TIMEOUT_SECONDS,
+                    connect=settings.GATEWAY_CONNECT_TIMEOUT_SECONDS
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.GATEWAY_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GATEWAY_MAX_KEEPALIVE
+                )
+            )
+        return self._client
+
+    async def start(self):
+        self._get_client()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _backoff(self, attempt: int):
+        base = settings.GATEWAY_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+        await asyncio.sleep(random.uniform(0, base))
+
+    async def create_payment(self, amount: Decimal) -> str:
+
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise CircuitOpenError("El gateway de pagos no está disponible")
+
+        client = self._get_client()
+        attempt = 0
+
+        while True:
+            self.requests += 1
+            started = time.perf_counter()
+            try:
+                response = await client.post(self.url, json={"monto": float(amount)})
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                # La petición no llegó al gateway: reintentar no duplica el cobro
+                self.errors += 1
+                if attempt < settings.GATEWAY_MAX_RETRIES:
+                    attempt += 1
+                    self.retries += 1
+                    await self._backoff(attempt)
+                    continue
+                self.breaker.record_failure()
+                raise GatewayError(f"No se pudo conectar con el gateway de pagos: {e}") from e
+            except httpx.HTTPError as e:
+                self.errors += 1
+                self.breaker.record_failure()
+                raise GatewayError(f"Error llamando al gateway: {e}") from e
+            finally:
+                self.latency.record(time.perf_counter() - started)
+
+            if response.status_code >= 500:
+                self.errors += 1
+                self.breaker.record_failure()
+                raise GatewayError(f"El gateway respondió {response.status_code}")
+
+            self.breaker.record_success()
+
+            payment_id = response.json().get("id") if response.status_code == 201 else None
+            if not payment_id:
+                # El gateway respondió pero no creó el pago: no hay nada que cobrar
+                raise GatewayError(f"El gateway no creó el pago ({response.status_code})")
+            return payment_id
+
+    def stats(self) -> dict:
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "retries": self.retries,
+            "rejected_open_circuit": self.rejected,
+            "circuit_state": self.breaker.state,
+            "circuit_opened": self.breaker.times_opened,
+            "latency": self.latency.stats()
+        }
+
+payment_gateway = GatewayClient(settings.GATEWAY_URL)
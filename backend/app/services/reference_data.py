@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlmodel import select
+
+from app.core import metrics
+from app.core.database import async_session
+from app.core.http_cache import json_snapshot
+from app.models.campaign_state import CampaignState
+from app.models.country import Country
+from app.models.donation_state import DonationState
+from app.models.payment_method import PaymentMethod
+from app.models.requirement_type import RequirementType
+from app.models.role import Role
+from app.models.workflow_state import WorkflowState
+
+class ReferenceData:
+
+    def __init__(self):
+        self.roles: Dict[int, str] = {}
+        self.workflow_states: Dict[int, str] = {}
+        self.campaign_states: Dict[int, str] = {}
+        self.donation_states: Dict[int, str] = {}
+        self.requirement_types: Dict[int, str] = {}
+        self.payment_methods: Dict[int, str] = {}
+        self.countries: Dict[int, Tuple[str, str]] = {}
+        self.loads = 0
+        self.loaded_at: Optional[datetime] = None
+        self._snapshots: Dict[str, Tuple[bytes, str]] = {}
+        metrics.register("reference_data", self.stats)
+
+    async def load(self):
+
+        async with async_session() as session:
+            roles = (await session.exec(select(Role.id, Role.name))).all()
+            workflow_states = (await session.exec(select(WorkflowState.id, WorkflowState.name))).all()
+            campaign_states = (await session.exec(select(CampaignState.id, CampaignState.name))).all()
+            donation_states = (await session.exec(select(DonationState.id, DonationState.name))).all()
+            requirement_types = (await session.exec(select(RequirementType.id, RequirementType.name))).all()
+            payment_methods = (await session.exec(
+                select(PaymentMethod.id, PaymentMethod.name).order_by(PaymentMethod.id)
+            )).all()
+            countries = (await session.exec(
+                select(Country.id, Country.name, Country.code).order_by(Country.name)
+            )).all()
+
+        # Se reemplazan los diccionarios completos: los lectores nunca ven una carga a medias
+        self.roles = dict(roles)
+        self.workflow_states = dict(workflow_states)
+        self.campaign_states = dict(campaign_states)
+        self.donation_states = dict(donation_states)
+        self.requirement_types = dict(requirement_types)
+        self.payment_methods = dict(payment_methods)
+        self.countries = {row.id: (row.name, row.code) for row in countries}
+
+        self._snapshots = {
+            "countries": json_snapshot([
+                {"id": country_id, "name": name, "code": code}
+                for country_id, (name, code) in self.countries.items()
+            ]),
+            "payment_methods": json_snapshot([
+                {"id": method_id, "name": name}
+                for method_id, name in self.payment_methods.items()
+            ])
+        }
+
+        self.loads += 1
+        self.loaded_at = datetime.utcnow()
+
+    def snapshot(self, name: str) -> Tuple[bytes, str]:
+        return self._snapshots[name]
+
+    def stats(self) -> dict:
+
+        return {
+            "loads": self.loads,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "roles": len(self.roles),
+            "workflow_states": len(self.workflow_states),
+            "campaign_states": len(self.campaign_states),
+            "donation_states": len(self.donation_states),
+            "requirement_types": len(self.requirement_types),
+            "payment_methods": len(self.payment_methods),
+            "countries": len(self.countries)
+        }
+
+reference_data = ReferenceData()
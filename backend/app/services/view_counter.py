@@ -0,0 +1,53 @@
+import asyncio
+from typing import Dict
+from sqlalchemy import bindparam, update
+
+from app.core.database import async_engine
+from app.models.campaign import Campaign
+
+class ViewCounter:
+
+    def __init__(self):
+        self._pending: Dict[int, int] = {}
+        self._flushing: Dict[int, int] = {}
+        self._flush_lock = asyncio.Lock()
+
+        table = Campaign.__table__
+        self._statement = update(table).where(
+            table.c.id == bindparam("b_id")
+        ).values(
+            view_counting=table.c.view_counting + bindparam("b_views")
+        )
+
+    def increment(self, campaign_id: int):
+        self._pending[campaign_id] = self._pending.get(campaign_id, 0) + 1
+
+    def pending(self, campaign_id: int) -> int:
+        return self._pending.get(campaign_id, 0) + self._flushing.get(campaign_id, 0)
+
+    async def flush(self) -> int:
+
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            self._flushing, self._pending = self._pending, {}
+            params = [
+                {"b_id": campaign_id, "b_views": views}
+                for campaign_id, views in sorted(self._flushing.items())
+            ]
+
+            try:
+                async with async_engine.begin() as conn:
+                    await conn.execute(self._statement, params)
+            except BaseException:
+                # También ante CancelledError (scheduler.stop al apagar): las vistas vuelven a quedar pendientes
+                for campaign_id, views in self._flushing.items():
+                    self._pending[campaign_id] = self._pending.get(campaign_id, 0) + views
+                raise
+            finally:
+                self._flushing = {}
+
+            return len(params)
+
+view_counter = ViewCounter()
@@ -0,0 +1,41 @@
+import os
+import pytest
+
+# BENCHMARK_SCALE < 1 reduce los volúmenes pedidos para una corrida rápida
+SCALE = float(os.getenv("BENCHMARK_SCALE", "1"))
+
+@pytest.fixture
+def scaled():
+
+    def scale(count: int) -> int:
+        return max(1, int(count * SCALE))
+
+    return scale
+
+@pytest.fixture
+def summarize():
+
+    def stats(samples) -> dict:
+        ordered = sorted(samples)
+        return {
+            "n": len(ordered),
+            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2)
+        }
+
+    return stats
+
+@pytest.fixture
+def report():
+
+    rows = []
+
+    def add(name: str, **values):
+        rows.append((name, values))
+
+    yield add
+
+    print()
+    for name, values in rows:
+        print(f"{name:<48} " + "  ".join(f"{key}={value}" for key, value in values.items()))
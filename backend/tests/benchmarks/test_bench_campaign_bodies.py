@@ -0,0 +1,72 @@
+import time
+import tracemalloc
+from decimal import Decimal
+import pytest
+from sqlmodel import Session, select
+
+from app.core.database import async_session
+from app.models.campaign import Campaign, CampaignResponse
+
+pytestmark = pytest.mark.benchmark
+
+ADMIN = "admin@riseup.com"
+BODY_SIZE = 100_000
+REPEAT = 10
+
+def seed(engine, count: int):
+
+    body = "<p>" + "Contenido enriquecido de la campaña. " * (BODY_SIZE // 37) + "</p>"
+    with Session(engine) as session:
+        session.add_all([
+            Campaign(
+                tittle=f"Campaña {i}",
+                description="Descripción corta",
+                goal_amount=Decimal(1000),
+                rich_text=body,
+                user_id=1,
+                workflow_state_id=2,
+                campaign_state_id=1
+            )
+            for i in range(count)
+        ])
+        session.commit()
+
+async def full_rows():
+    # Lo que hacían los listados antes: filas completas serializadas con rich_text
+    async with async_session() as session:
+        campaigns = (await session.exec(select(Campaign).where(Campaign.user_id == 1))).all()
+        return [CampaignResponse.model_validate(c, from_attributes=True).model_dump_json() for c in campaigns]
+
+def measure(func):
+
+    samples = []
+    peak = 0
+    for _ in range(REPEAT):
+        tracemalloc.start()
+        started = time.perf_counter()
+        size = func()
+        samples.append(time.perf_counter() - started)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return samples, peak, size
+
+def test_list_endpoints_with_large_bodies(client, database, auth_headers, scaled, summarize, report):
+
+    campaigns = scaled(200)
+    seed(database, campaigns)
+    headers = auth_headers(ADMIN)
+
+    workloads = {
+        "filas completas (antes)": lambda: sum(len(body) for body in client.portal.call(full_rows)),
+        "/campaigns/my-campaigns": lambda: len(client.get("/campaigns/my-campaigns", headers=headers).content),
+        "/admin/campaigns": lambda: len(client.get("/admin/campaigns", headers=headers).content)
+    }
+
+    for name, func in workloads.items():
+        samples, peak, size = measure(func)
+        report(
+            f"{name} campañas={campaigns}",
+            body_kib=round(size / 1024, 1),
+            peak_mib=round(peak / 2 ** 20, 2),
+            **summarize(samples)
+        )
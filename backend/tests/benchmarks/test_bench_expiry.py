@@ -0,0 +1,68 @@
+import time
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.database import async_session, engine
+from app.services.campaign_expiry import expire_campaigns
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(
+        engine.dialect.name != "postgresql",
+        reason="El reembolso usa UPDATE ... RETURNING dentro de un CTE, que solo existe en Postgres (TEST_DATABASE_URL)"
+    )
+]
+
+DONATIONS_PER_CAMPAIGN = 100
+
+def seed(engine, campaigns: int):
+
+    # La mitad de las campañas vencidas no alcanzó la meta y reembolsa sus donaciones confirmadas
+    with Session(engine) as session:
+        connection = session.connection()
+        connection.execute(text("""
+            INSERT INTO campaign (
+                tittle, description, goal_amount, current_amount, view_counting, favorites_counting,
+                created_at, updated_at, expiration_date, workflow_state_id, campaign_state_id, user_id, category_id
+            )
+            SELECT 'Campaña ' || g, 'Descripción', 1000, CASE WHEN g % 2 = 0 THEN 1000 ELSE 500 END, 0, 0,
+                now(), now(), current_date - 1, 5, 2, 1, 1 + g % 12
+            FROM generate_series(1, :campaigns) g
+        """), {"campaigns": campaigns})
+        connection.execute(text("""
+            INSERT INTO donation (amount, donation_state_id, user_id, campaign_id, payment_method_id, created_at)
+            SELECT 10, CASE WHEN d % 10 = 0 THEN 1 ELSE 2 END, 1, c, 1, now()
+            FROM generate_series(1, :campaigns) c, generate_series(1, :donations) d
+        """), {"campaigns": campaigns, "donations": DONATIONS_PER_CAMPAIGN})
+        session.commit()
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE campaign, donation"))
+
+async def run(batch_size: int):
+
+    async with async_session() as session:
+        return await expire_campaigns(session, batch_size)
+
+@pytest.mark.parametrize("batch_size", [100, 500, 1000])
+def test_expire_campaigns_at_scale(client, database, scaled, report, batch_size):
+
+    campaigns = scaled(10000)
+    seed(database, campaigns)
+
+    started = time.perf_counter()
+    processed = client.portal.call(run, batch_size)
+    elapsed = time.perf_counter() - started
+
+    refunded = sum(item["donations_refunded"] for item in processed)
+    assert len(processed) == campaigns
+    assert refunded == (campaigns - campaigns // 2) * DONATIONS_PER_CAMPAIGN * 9 // 10
+
+    report(
+        f"expire_campaigns batch_size={batch_size}",
+        campaigns=campaigns,
+        donations_refunded=refunded,
+        seconds=round(elapsed, 2),
+        campaigns_per_s=round(campaigns / elapsed, 1),
+        ms_per_batch=round(elapsed / -(-campaigns // batch_size) * 1000, 2)
+    )
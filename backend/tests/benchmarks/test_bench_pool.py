@@ -0,0 +1,98 @@
+import asyncio
+import time
+from datetime import datetime
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import database
+from app.core.config import settings
+from app.main import app
+from app.models.campaign import Campaign
+
+pytestmark = pytest.mark.benchmark
+
+CONCURRENCY = 50
+REQUESTS = 400
+POOL_SIZES = [1, 5, 10, 20]
+
+def seed(engine, count: int):
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "tittle": f"Campaña {i}",
+            "description": "Descripción de la campaña",
+            "goal_amount": 1000,
+            "current_amount": i % 1000,
+            "view_counting": i,
+            "favorites_counting": i % 50,
+            "created_at": now,
+            "updated_at": now,
+            "workflow_state_id": 5,
+            "campaign_state_id": 2,
+            "user_id": 1,
+            "category_id": 1 + i % 12
+        }
+        for i in range(count)
+    ]
+    with engine.begin() as conn:
+        conn.execute(Campaign.__table__.insert(), rows)
+
+async def run(paths, concurrency: int):
+
+    samples = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def one(path):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await http.get(path)
+                samples.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*[one(path) for path in paths])
+        elapsed = time.perf_counter() - started
+
+    return samples, elapsed
+
+async def with_pool(pool_size: int, paths, concurrency: int):
+
+    # Cada corrida usa un engine propio para que el tamaño del pool sea el único cambio
+    engine = create_async_engine(settings.ASYNC_DATABASE_URL, pool_size=pool_size, max_overflow=0, pool_timeout=60)
+    original = database.async_session
+    database.async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        return await run(paths, concurrency)
+    finally:
+        database.async_session = original
+        await engine.dispose()
+
+def test_listing_and_detail_under_concurrency(client, database, scaled, summarize, report):
+
+    campaigns = scaled(5000)
+    seed(database, campaigns)
+
+    requests = scaled(REQUESTS)
+    workloads = {
+        "listado": [f"/campaigns/public?page={1 + i % 50}&page_size=20" for i in range(requests)],
+        "detalle": [f"/campaigns/public/{1 + (i * 37) % campaigns}" for i in range(requests)]
+    }
+
+    for name, paths in workloads.items():
+        # Sin concurrencia: equivale al worker que atendía una petición a la vez con la sesión síncrona
+        samples, elapsed = client.portal.call(with_pool, 1, paths, 1)
+        report(f"{name} secuencial (antes)", rps=round(len(paths) / elapsed, 1), **summarize(samples))
+
+        for pool_size in POOL_SIZES:
+            samples, elapsed = client.portal.call(with_pool, pool_size, paths, CONCURRENCY)
+            report(
+                f"{name} concurrencia={CONCURRENCY} pool={pool_size}",
+                rps=round(len(paths) / elapsed, 1),
+                **summarize(samples)
+            )
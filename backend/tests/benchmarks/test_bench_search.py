@@ -0,0 +1,71 @@
+from pathlib import Path
+import time
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+
+from app.core.database import engine
+from app.models.campaign import Campaign
+from app.services.campaign_cards import PUBLISHED_IN_PROGRESS, card_statement
+from app.services.campaign_search import search_condition, search_rank
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(
+        engine.dialect.name != "postgresql",
+        reason="La búsqueda de texto completo usa es_unaccent y solo corre contra Postgres (TEST_DATABASE_URL)"
+    )
+]
+
+ADD_SEARCH = Path(__file__).resolve().parents[3] / "database" / "add_search.sql"
+TERMS = ["huerta", "educacion", "biblioteca rural", "agua potable", "zzz sin resultados"]
+REPEAT = 5
+
+SEED = """
+    INSERT INTO campaign (
+        tittle, description, rich_text, goal_amount, current_amount, view_counting, favorites_counting,
+        created_at, updated_at, workflow_state_id, campaign_state_id, user_id, category_id
+    )
+    SELECT
+        'Campaña ' || (ARRAY['huerta', 'educación', 'biblioteca', 'agua', 'salud', 'música', 'deporte', 'arte'])[1 + g % 8] || ' ' || g,
+        'Proyecto ' || (ARRAY['rural', 'urbano', 'escolar', 'potable', 'comunitario'])[1 + g % 5],
+        repeat('Texto descriptivo de la campaña con detalles del proyecto. ', 20) || (ARRAY['huerta', 'agua', 'arte'])[1 + g % 3],
+        1000, 0, 0, 0, now(), now(),
+        CASE WHEN g % 4 = 0 THEN 1 ELSE 5 END, 2, 1, 1 + g % 12
+    FROM generate_series(1, :campaigns) g
+"""
+
+def ilike_condition(term: str):
+    # La búsqueda anterior: subcadena sin índice sobre título y descripción
+    return Campaign.tittle.ilike(f"%{term}%") | Campaign.description.ilike(f"%{term}%")
+
+def statements(term: str, mode: str):
+
+    if mode == "ilike":
+        where = [*PUBLISHED_IN_PROGRESS, ilike_condition(term)]
+        page = card_statement(*where).limit(9)
+    else:
+        where = [*PUBLISHED_IN_PROGRESS, search_condition(term)]
+        page = card_statement(*where).order_by(search_rank(term).desc(), Campaign.id.desc()).limit(9)
+    return select(func.count(Campaign.id)).where(*where), page
+
+def test_full_text_search_against_ilike(database, scaled, summarize, report):
+
+    campaigns = scaled(1000000)
+    with database.begin() as connection:
+        connection.exec_driver_sql(ADD_SEARCH.read_text(encoding="utf-8"))
+        connection.execute(text(SEED), {"campaigns": campaigns})
+    with database.begin() as connection:
+        connection.execute(text("ANALYZE campaign"))
+
+    with Session(database) as session:
+        for mode in ("ilike", "full_text"):
+            samples = []
+            for term in TERMS:
+                count, page = statements(term, mode)
+                for _ in range(REPEAT):
+                    started = time.perf_counter()
+                    session.exec(count).one()
+                    session.exec(page).all()
+                    samples.append(time.perf_counter() - started)
+            report(f"búsqueda {mode} campañas={campaigns}", **summarize(samples))
@@ -0,0 +1,72 @@
+import os
+import tempfile
+
+# Por defecto la suite corre sobre SQLite; TEST_DATABASE_URL puede apuntar a un Postgres desechable
+TEST_DATABASE_URL = os.getenv(
+    "TEST_DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="riseup-tests-"), "test.db")
+)
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ["ASYNC_DATABASE_URL"] = TEST_DATABASE_URL.replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+).replace("sqlite://", "sqlite+aiosqlite://", 1)
+os.environ["DATABASE_ECHO"] = "false"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["EXPIRY_JOB_ENABLED"] = "false"
+# Las tareas programadas no deben ejecutarse (ni emitir SQL) en medio de un test
+for interval in (
+    "VIEW_COUNTER_FLUSH_SECONDS",
+    "EMAIL_OUTBOX_INTERVAL_SECONDS",
+    "RATE_LIMIT_PURGE_SECONDS",
+    "REFERENCE_DATA_REFRESH_SECONDS"
+):
+    os.environ[interval] = "3600"
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel
+from fastapi.testclient import TestClient
+
+from app.core.database import async_engine, engine
+from app.core.security import create_access_token, user_cache
+from app.init_db import init_database
+from app.main import app
+from app.services.campaign_rails import invalidate_rails
+from app.services.category_catalog import invalidate_category_catalog
+
+is_postgres = engine.dialect.name == "postgresql"
+
+@pytest.fixture
+def database():
+    SQLModel.metadata.create_all(engine)
+    init_database()
+    yield engine
+    SQLModel.metadata.drop_all(engine)
+    invalidate_rails()
+    invalidate_category_catalog()
+    user_cache.clear()
+
+@pytest.fixture
+def client(database):
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def query_counter():
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+
+@pytest.fixture
+def auth_headers():
+
+    def headers(email: str) -> dict:
+        return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+    return headers
@@ -0,0 +1,48 @@
+import bcrypt
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.security import user_cache
+from app.models.person import Person
+
+ADMIN = "admin@riseup.com"
+
+def stored_password(engine, email: str) -> str:
+
+    with Session(engine) as session:
+        return session.exec(select(Person.password).where(Person.email == email)).one()
+
+def test_user_cache_does_not_keep_password_hash(client, database, auth_headers):
+
+    headers = auth_headers(ADMIN)
+    stored = stored_password(database, ADMIN)
+
+    assert client.get("/auth/profile", headers=headers).status_code == 200
+    assert "password" not in user_cache.get(ADMIN)
+
+    # Una escritura con el usuario servido desde la caché no toca la contraseña
+    response = client.put("/auth/profile", headers=headers, json={"first_name": "Otra"})
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Otra"
+    assert stored_password(database, ADMIN) == stored
+
+def seed_user_with_cost(engine, email: str, is_active: bool, rounds: int = 5) -> str:
+
+    hashed = bcrypt.hashpw(b"secreto123", bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+    with Session(engine) as session:
+        session.add(Person(first_name="Ana", last_name="Prueba", email=email, password=hashed, is_active=is_active))
+        session.commit()
+    return hashed
+
+def test_login_rehashes_only_active_accounts(client, database):
+
+    inactive = seed_user_with_cost(database, "inactiva@riseup.com", is_active=False)
+    seed_user_with_cost(database, "activa@riseup.com", is_active=True)
+
+    response = client.post("/auth/login", json={"email": "inactiva@riseup.com", "password": "secreto123"})
+    assert response.status_code == 403
+    assert stored_password(database, "inactiva@riseup.com") == inactive
+
+    response = client.post("/auth/login", json={"email": "activa@riseup.com", "password": "secreto123"})
+    assert response.status_code == 200
+    assert stored_password(database, "activa@riseup.com").startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
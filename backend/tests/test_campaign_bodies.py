@@ -0,0 +1,49 @@
+from decimal import Decimal
+from sqlmodel import Session
+
+from app.models.campaign import Campaign
+
+ADMIN = "admin@riseup.com"
+MARKER = "cuerpo-de-la-campaña"
+
+def seed_campaigns(engine, count: int, body_size: int) -> list:
+
+    body = f"<p>{MARKER}</p>" + "x" * body_size
+    with Session(engine) as session:
+        campaigns = [
+            Campaign(
+                tittle=f"Campaña {i}",
+                description="Descripción corta",
+                goal_amount=Decimal(1000),
+                rich_text=body,
+                user_id=1,
+                workflow_state_id=2,
+                campaign_state_id=1
+            )
+            for i in range(count)
+        ]
+        session.add_all(campaigns)
+        session.commit()
+        return [campaign.id for campaign in campaigns]
+
+def test_list_endpoints_neither_load_nor_serialize_rich_text(client, database, query_counter, auth_headers):
+
+    headers = auth_headers(ADMIN)
+    ids = seed_campaigns(database, 20, body_size=200_000)
+    # Calienta la caché de usuarios para medir solo las consultas del listado
+    client.get("/favorites/", headers=headers)
+
+    for url in ("/campaigns/my-campaigns", "/admin/campaigns"):
+        query_counter.clear()
+        response = client.get(url, headers=headers)
+
+        assert response.status_code == 200, response.text
+        assert sorted(item["id"] for item in response.json()) == ids
+        assert all("rich_text" not in item for item in response.json())
+        assert MARKER not in response.text
+        assert len(response.content) < 20_000
+        assert query_counter and not any("rich_text" in statement for statement in query_counter), url
+
+    # El detalle sigue sirviendo el cuerpo completo
+    response = client.get(f"/campaigns/{ids[0]}", headers=headers)
+    assert MARKER in response.json()["rich_text"]
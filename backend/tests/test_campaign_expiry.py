@@ -0,0 +1,108 @@
+from datetime import date, timedelta
+from decimal import Decimal
+import pytest
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.campaign import Campaign
+from app.models.donation import Donation
+from app.models.person import Person
+
+ADMIN = "admin@riseup.com"
+
+def seed_campaign(session: Session, goal: int, current: int, expired: bool = True, donations=()) -> int:
+
+    campaign = Campaign(
+        tittle=f"Campaña {goal}-{current}",
+        description="Campaña con vencimiento",
+        goal_amount=Decimal(goal),
+        current_amount=Decimal(current),
+        expiration_date=date.today() + timedelta(days=-1 if expired else 10),
+        user_id=1,
+        workflow_state_id=5,
+        campaign_state_id=2
+    )
+    session.add(campaign)
+    session.commit()
+
+    for state in donations:
+        session.add(Donation(
+            amount=Decimal(10),
+            donation_state_id=state,
+            user_id=1,
+            campaign_id=campaign.id,
+            payment_method_id=1
+        ))
+    session.commit()
+    return campaign.id
+
+def test_process_expired_is_admin_only(client, database, auth_headers):
+
+    with Session(database) as session:
+        session.add(Person(first_name="Ana", last_name="Donante", email="donante@riseup.com", password="x", is_active=True))
+        session.commit()
+
+    # HTTPBearer responde 403 cuando falta el token
+    assert client.post("/campaigns/process-expired").status_code == 403
+    assert client.post("/campaigns/process-expired", headers=auth_headers("donante@riseup.com")).status_code == 403
+
+    response = client.post("/campaigns/process-expired", params={"batch_size": 5000}, headers=auth_headers(ADMIN))
+    assert response.status_code == 422
+
+def test_expired_campaigns_that_reached_their_goal(client, database, auth_headers):
+
+    with Session(database) as session:
+        funded = [seed_campaign(session, 100, 100 + i) for i in range(3)]
+        running = seed_campaign(session, 100, 150, expired=False)
+
+    response = client.post("/campaigns/process-expired", params={"batch_size": 2}, headers=auth_headers(ADMIN))
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "message": "Procesadas 3 campañas expiradas",
+        "campaigns": [
+            {"campaign_id": campaign_id, "title": f"Campaña 100-{100 + i}", "donations_refunded": 0, "goal_reached": True}
+            for i, campaign_id in enumerate(funded)
+        ]
+    }
+
+    with Session(database) as session:
+        assert all(session.get(Campaign, i).campaign_state_id == 4 for i in funded)
+        assert all(session.get(Campaign, i).end_date == date.today() for i in funded)
+        assert session.get(Campaign, running).campaign_state_id == 2
+
+@pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="El reembolso usa UPDATE ... RETURNING dentro de un CTE, que solo existe en Postgres (TEST_DATABASE_URL)"
+)
+def test_underfunded_campaigns_refund_each_confirmed_donation(client, database, auth_headers):
+
+    with Session(database) as session:
+        # Estados de donación: 1 pendiente, 2 confirmada, 3 cancelada
+        refunds = {
+            seed_campaign(session, 1000, 30, donations=[2, 2, 2, 1]): 3,
+            seed_campaign(session, 1000, 0, donations=[1, 3]): 0,
+            seed_campaign(session, 1000, 10, donations=[2]): 1
+        }
+        funded = seed_campaign(session, 20, 20, donations=[2, 2])
+        running = seed_campaign(session, 1000, 10, expired=False, donations=[2])
+
+    response = client.post("/campaigns/process-expired", params={"batch_size": 2}, headers=auth_headers(ADMIN))
+
+    assert response.status_code == 200
+    summary = {item["campaign_id"]: item for item in response.json()["campaigns"]}
+    assert summary[funded]["donations_refunded"] == 0
+    assert summary[funded]["goal_reached"] is True
+    assert {i: summary[i]["donations_refunded"] for i in refunds} == refunds
+    assert all("goal_reached" not in summary[i] for i in refunds)
+    assert running not in summary
+
+    with Session(database) as session:
+        states = {
+            campaign_id: sorted(session.exec(select(Donation.donation_state_id).where(Donation.campaign_id == campaign_id)).all())
+            for campaign_id in [*refunds, funded, running]
+        }
+    # Solo las confirmadas de campañas sin meta pasan a reembolsadas (4)
+    assert [states[i] for i in refunds] == [[1, 4, 4, 4], [1, 3], [4]]
+    assert states[funded] == [2, 2]
+    assert states[running] == [2]
@@ -0,0 +1,92 @@
+from decimal import Decimal
+import pytest
+from sqlmodel import Session
+
+from app.models.campaign import Campaign
+from app.models.favorite import Favorite
+from app.services.campaign_rails import invalidate_rails
+
+LISTINGS = [
+    ("/campaigns/public", {"page_size": 100}, 2),
+    ("/campaigns/public", {"page_size": 100, "category_id": 1}, 2),
+    ("/campaigns/public", {"page_size": 100, "pagination": "cursor"}, 1),
+    ("/campaigns/featured", {"limit": 20}, 1),
+    ("/campaigns/popular", {"limit": 20}, 1),
+    ("/favorites/", {}, 1)
+]
+
+def seed_campaigns(engine, count: int, start: int = 0):
+
+    with Session(engine) as session:
+        for i in range(start, start + count):
+            session.add(Campaign(
+                tittle=f"Campaña {i}",
+                description="Descripción",
+                goal_amount=Decimal(1000),
+                current_amount=Decimal(i),
+                favorites_counting=i % 7,
+                view_counting=i,
+                user_id=1,
+                category_id=1 + i % 3,
+                workflow_state_id=5,
+                campaign_state_id=2
+            ))
+        session.commit()
+
+        # El administrador sembrado por init_db marca todas como favoritas
+        for i in range(start, start + count):
+            session.add(Favorite(user_id=1, campaign_id=i + 1))
+        session.commit()
+
+@pytest.mark.parametrize("pagination", ["page", "cursor"])
+@pytest.mark.parametrize("page_size", [0, -1])
+def test_public_listing_rejects_non_positive_page_size(client, pagination, page_size):
+
+    response = client.get("/campaigns/public", params={"pagination": pagination, "page_size": page_size})
+
+    assert response.status_code == 422
+
+def test_cursor_pagination_walks_every_campaign_once(client, database):
+
+    seed_campaigns(database, 23)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"pagination": "cursor", "sort": "favorites", "page_size": 5}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/campaigns/public", params=params).json()
+        seen += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(seen) == list(range(1, 24))
+
+def count_listing_queries(client, query_counter, headers) -> dict:
+
+    counts = {}
+    for url, params, _ in LISTINGS:
+        invalidate_rails()
+        query_counter.clear()
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        counts[(url, tuple(params.items()))] = len(query_counter)
+    return counts
+
+def test_listing_query_count_does_not_grow_with_campaigns(client, database, query_counter, auth_headers):
+
+    headers = auth_headers("admin@riseup.com")
+    # Calienta la caché de usuarios para que la autenticación no sume consultas
+    client.get("/favorites/", headers=headers)
+
+    seed_campaigns(database, 3)
+    few = count_listing_queries(client, query_counter, headers)
+
+    seed_campaigns(database, 60, start=3)
+    many = count_listing_queries(client, query_counter, headers)
+
+    expected = {(url, tuple(params.items())): queries for url, params, queries in LISTINGS}
+    assert few == expected
+    assert many == expected
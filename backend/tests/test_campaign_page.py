@@ -0,0 +1,75 @@
+from decimal import Decimal
+from sqlmodel import Session
+
+from app.models.campaign import Campaign
+from app.models.donation import Donation
+from app.models.favorite import Favorite
+from app.models.person import Person
+from app.models.reward import Reward
+from app.models.reward_claim import RewardClaim
+
+ADMIN = "admin@riseup.com"
+
+def seed_campaign(engine, size: int) -> int:
+
+    with Session(engine) as session:
+        owner = Person(first_name="Dueña", last_name=f"Campaña {size}", email=f"duena{size}@riseup.com", password="x", is_active=True)
+        session.add(owner)
+        session.commit()
+
+        campaign = Campaign(
+            tittle=f"Campaña con {size} recompensas",
+            description="Página completa",
+            goal_amount=Decimal(100000),
+            user_id=owner.id,
+            category_id=1,
+            workflow_state_id=5,
+            campaign_state_id=2
+        )
+        session.add(campaign)
+        session.commit()
+
+        rewards = [Reward(tittle=f"Recompensa {i}", amount=Decimal(10 + i), campaign_id=campaign.id) for i in range(size)]
+        session.add_all(rewards)
+        session.add_all([
+            Donation(amount=Decimal(5 + i), donation_state_id=2, user_id=1, campaign_id=campaign.id, payment_method_id=1)
+            for i in range(size)
+        ])
+        session.add(Favorite(user_id=1, campaign_id=campaign.id))
+        session.commit()
+
+        # El administrador sembrado por init_db reclamó todas las recompensas
+        session.add_all([RewardClaim(user_id=1, reward_id=reward.id, campaign_id=campaign.id) for reward in rewards])
+        session.commit()
+
+        return campaign.id
+
+def page_queries(client, query_counter, campaign_id: int, headers: dict) -> tuple:
+
+    query_counter.clear()
+    response = client.get(f"/campaigns/{campaign_id}/page", headers=headers)
+    assert response.status_code == 200, response.text
+    return len(query_counter), response.json()
+
+def test_campaign_page_query_count_does_not_grow(client, database, query_counter, auth_headers):
+
+    headers = auth_headers(ADMIN)
+    # Calienta la caché de usuarios para que la autenticación no sume consultas
+    client.get("/favorites/", headers=headers)
+
+    for size in (2, 40):
+        campaign_id = seed_campaign(database, size)
+
+        # Detalle, recompensas y mejores donantes
+        queries, body = page_queries(client, query_counter, campaign_id, {})
+        assert queries == 3
+        assert len(body["rewards"]) == size
+        assert len(body["top_donors"]) == min(size, 5)
+        assert body["viewer"] is None
+
+        # Más una consulta para el estado del visitante
+        queries, body = page_queries(client, query_counter, campaign_id, headers)
+        assert queries == 4
+        assert body["viewer"]["is_favorite"] is True
+        assert body["viewer"]["total_donated"] == sum(5 + i for i in range(size))
+        assert len(body["viewer"]["claimed_reward_ids"]) == size
@@ -0,0 +1,84 @@
+from pathlib import Path
+from decimal import Decimal
+import pytest
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.campaign import Campaign
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="La búsqueda de texto completo usa es_unaccent y solo corre contra Postgres (TEST_DATABASE_URL)"
+)
+
+ADD_SEARCH = Path(__file__).resolve().parents[2] / "database" / "add_search.sql"
+
+@pytest.fixture
+def searchable(database):
+
+    with database.begin() as connection:
+        connection.exec_driver_sql(ADD_SEARCH.read_text(encoding="utf-8"))
+    return database
+
+def seed(engine, *campaigns) -> list:
+
+    with Session(engine) as session:
+        rows = [
+            Campaign(
+                tittle=tittle,
+                description=description,
+                rich_text=rich_text,
+                goal_amount=Decimal(1000),
+                user_id=1,
+                workflow_state_id=5,
+                campaign_state_id=2
+            )
+            for tittle, description, rich_text in campaigns
+        ]
+        session.add_all(rows)
+        session.commit()
+        return [row.id for row in rows]
+
+def search(client, text: str, **params) -> list:
+
+    response = client.get("/campaigns/public", params={"search": text, "page_size": 50, **params})
+    assert response.status_code == 200, response.text
+    return [item["id"] for item in response.json()["items"]]
+
+def test_title_matches_rank_above_description_and_body(client, searchable):
+
+    in_body, in_description, in_title, unrelated = seed(
+        searchable,
+        ("Proyecto comunitario", "Apoyo al barrio", "Sembraremos una huerta en la plaza"),
+        ("Proyecto vecinal", "Una huerta para la escuela", None),
+        ("Huerta urbana", "Alimentos para el comedor", None),
+        ("Biblioteca popular", "Libros para todos", "Estanterías y lámparas")
+    )
+
+    assert search(client, "huerta") == [in_title, in_description, in_body]
+    assert unrelated not in search(client, "huerta")
+
+def test_search_folds_accents_and_stems(client, searchable):
+
+    accented, plural = seed(
+        searchable,
+        ("Educación rural", "Útiles escolares", None),
+        ("Bibliotecas móviles", "Libros sobre ruedas", None)
+    )
+
+    assert search(client, "educacion") == [accented]
+    assert search(client, "EDUCACIÓN") == [accented]
+    assert search(client, "biblioteca movil") == [plural]
+
+def test_cursor_mode_filters_without_ranking(client, searchable):
+
+    matches = seed(
+        searchable,
+        ("Huerta urbana", "Alimentos", None),
+        ("Proyecto vecinal", "Una huerta", None),
+        ("Huerta escolar", "Huerta y compost", "huerta")
+    )
+    seed(searchable, ("Biblioteca popular", "Libros", None))
+
+    # En modo cursor se respeta el orden de sort (recientes primero), no la relevancia
+    assert search(client, "huerta", pagination="cursor") == sorted(matches, reverse=True)
@@ -0,0 +1,80 @@
+import asyncio
+from decimal import Decimal
+import httpx
+from sqlmodel import Session, select
+
+from app.main import app
+from app.models.campaign import Campaign
+from app.models.donation import Donation
+
+DONATIONS = 200
+
+def seed_campaign(engine) -> int:
+
+    amounts = [Decimal(10 + i % 50) for i in range(DONATIONS)]
+
+    with Session(engine) as session:
+        campaign = Campaign(
+            tittle="Campaña concurrida",
+            description="Prueba de confirmaciones",
+            goal_amount=sum(amounts),
+            user_id=1,
+            workflow_state_id=5,
+            campaign_state_id=2
+        )
+        session.add(campaign)
+        session.commit()
+
+        for i, amount in enumerate(amounts):
+            session.add(Donation(
+                amount=amount,
+                donation_state_id=1,
+                user_id=1,
+                campaign_id=campaign.id,
+                payment_method_id=1,
+                gateway_payment_id=f"pay-{i}"
+            ))
+        session.add(Donation(
+            amount=Decimal(999),
+            donation_state_id=3,
+            user_id=1,
+            campaign_id=campaign.id,
+            payment_method_id=1,
+            gateway_payment_id="pay-cancelled"
+        ))
+        session.commit()
+
+        return campaign.id
+
+async def confirm_all(gateway_ids):
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        return await asyncio.gather(*[
+            http.post("/donations/confirm-payment", json={"id": gateway_id})
+            for gateway_id in gateway_ids
+        ])
+
+def test_parallel_confirmations_add_each_donation_once(client, database):
+
+    campaign_id = seed_campaign(database)
+
+    # Cada pago llega dos veces (webhook repetido) y en orden intercalado
+    gateway_ids = [f"pay-{i}" for i in range(DONATIONS)] * 2 + ["pay-cancelled"]
+    responses = client.portal.call(confirm_all, gateway_ids)
+
+    confirmed = [r for r in responses if r.status_code == 200 and r.json()["message"] == "Pago confirmado"]
+    assert len(confirmed) == DONATIONS
+    assert [r.status_code for r in responses].count(409) == 1
+
+    with Session(database) as session:
+        campaign = session.get(Campaign, campaign_id)
+        donations = session.exec(select(Donation).where(Donation.campaign_id == campaign_id)).all()
+
+        pending_total = sum(d.amount for d in donations if d.gateway_payment_id != "pay-cancelled")
+        assert campaign.current_amount == pending_total
+        assert campaign.campaign_state_id == 4
+        assert all(
+            d.donation_state_id == (3 if d.gateway_payment_id == "pay-cancelled" else 2)
+            for d in donations
+        )
@@ -0,0 +1,172 @@
+import socket
+from datetime import datetime, timedelta
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.core import metrics
+from app.core.config import settings
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox import EmailOutboxWorker, email_outbox
+
+REFUSED = "rechazado@riseup.com"
+
+class RecordingHandler:
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.messages = []
+        self.peers = set()
+        self.statuses_while_sending = []
+        self.fail_data = False
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+
+        if address == REFUSED:
+            return "550 Buzón inexistente"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+
+        # Otra conexión a la base ve el lote ya reclamado mientras dura el envío
+        with Session(self.engine) as db:
+            self.statuses_while_sending.append(set(db.exec(select(EmailOutbox.status)).all()))
+
+        if self.fail_data:
+            return "451 Intenta más tarde"
+        self.peers.add(session.peer)
+        self.messages.append(envelope.rcpt_tos[0])
+        return "250 Message accepted for delivery"
+
+def free_port() -> int:
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture
+def smtp_server(database, monkeypatch):
+
+    handler = RecordingHandler(database)
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+
+    monkeypatch.setattr(settings, "MAIL_SERVER", "127.0.0.1")
+    monkeypatch.setattr(settings, "MAIL_PORT", controller.port)
+    monkeypatch.setattr(settings, "MAIL_STARTTLS", False)
+    monkeypatch.setattr(settings, "MAIL_USERNAME", "")
+    monkeypatch.setattr(settings, "EMAIL_MAX_ATTEMPTS", 4)
+    monkeypatch.setattr(settings, "EMAIL_RETRY_BACKOFF_SECONDS", 30)
+    monkeypatch.setattr(settings, "EMAIL_RETRY_MAX_BACKOFF_SECONDS", 100)
+
+    yield handler
+    controller.stop()
+
+@pytest.fixture
+def worker(client, smtp_server):
+
+    outbox = EmailOutboxWorker()
+    yield outbox
+    client.portal.call(outbox.close)
+    metrics.register("email_outbox", email_outbox.stats)
+
+def enqueue(client, worker, *addresses):
+    return [
+        client.portal.call(worker.enqueue, address, "Asunto", "<p>Hola</p>")
+        for address in addresses
+    ]
+
+def load(engine, email_id: int) -> EmailOutbox:
+
+    with Session(engine) as session:
+        return session.get(EmailOutbox, email_id)
+
+def make_due(engine, email_id: int):
+
+    with Session(engine) as session:
+        session.execute(update(EmailOutbox).where(EmailOutbox.id == email_id).values(
+            next_attempt_at=datetime.utcnow() - timedelta(seconds=1)
+        ))
+        session.commit()
+
+def test_batch_is_sent_over_one_connection(client, database, smtp_server, worker):
+
+    addresses = [f"usuario{i}@riseup.com" for i in range(5)]
+    ids = enqueue(client, worker, *addresses)
+
+    assert client.portal.call(worker.drain) == 5
+
+    assert smtp_server.messages == addresses
+    assert len(smtp_server.peers) == 1
+    assert worker.stats()["smtp_connections"] == 1
+    # Durante el envío las filas ya estaban confirmadas como "sending", sin transacción abierta
+    assert all(statuses == {"sending"} for statuses in smtp_server.statuses_while_sending)
+    assert all(load(database, i).status == "sent" and load(database, i).attempts == 1 for i in ids)
+
+    assert client.portal.call(worker.drain) == 0
+
+def test_failed_sends_back_off_then_dead_letter(client, database, smtp_server, worker):
+
+    smtp_server.fail_data = True
+    email_id = enqueue(client, worker, "usuario@riseup.com")[0]
+
+    schedule = []
+    for attempt in range(1, settings.EMAIL_MAX_ATTEMPTS):
+        before = datetime.utcnow()
+        assert client.portal.call(worker.drain) == 0
+
+        email = load(database, email_id)
+        assert email.status == "pending"
+        assert email.attempts == attempt
+        assert "451" in email.last_error
+        schedule.append(round((email.next_attempt_at - before).total_seconds()))
+
+        # Mientras no venza el backoff el email no se reintenta
+        assert client.portal.call(worker.drain) == 0
+        assert load(database, email_id).attempts == attempt
+        make_due(database, email_id)
+
+    assert schedule == [30, 60, 100]
+
+    client.portal.call(worker.drain)
+    email = load(database, email_id)
+    assert email.status == "dead"
+    assert email.attempts == settings.EMAIL_MAX_ATTEMPTS
+
+    make_due(database, email_id)
+    client.portal.call(worker.drain)
+    assert load(database, email_id).attempts == settings.EMAIL_MAX_ATTEMPTS
+    assert worker.stats()["dead_lettered"] == 1
+
+def test_refused_recipient_is_dead_lettered_at_once(client, database, smtp_server, worker):
+
+    refused, accepted = enqueue(client, worker, REFUSED, "usuario@riseup.com")
+
+    assert client.portal.call(worker.drain) == 1
+
+    email = load(database, refused)
+    assert email.status == "dead"
+    assert email.attempts == 1
+    assert load(database, accepted).status == "sent"
+    assert smtp_server.messages == ["usuario@riseup.com"]
+
+def test_expired_lease_is_claimed_again(client, database, smtp_server, worker):
+
+    stale, leased = enqueue(client, worker, "viejo@riseup.com", "enviando@riseup.com")
+    with Session(database) as session:
+        session.execute(update(EmailOutbox).where(EmailOutbox.id == stale).values(
+            status="sending", attempts=1, next_attempt_at=datetime.utcnow() - timedelta(seconds=1)
+        ))
+        session.execute(update(EmailOutbox).where(EmailOutbox.id == leased).values(
+            status="sending", attempts=1, next_attempt_at=datetime.utcnow() + timedelta(minutes=5)
+        ))
+        session.commit()
+
+    assert client.portal.call(worker.drain) == 1
+
+    assert smtp_server.messages == ["viejo@riseup.com"]
+    assert load(database, stale).status == "sent"
+    assert load(database, stale).attempts == 2
+    assert load(database, leased).status == "sending"
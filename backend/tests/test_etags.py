@@ -0,0 +1,62 @@
+from decimal import Decimal
+from sqlmodel import Session
+
+from app.models.campaign import Campaign
+from app.models.reward import Reward
+
+ADMIN = "admin@riseup.com"
+
+def revalidate(client, query_counter, url: str, etag: str):
+
+    query_counter.clear()
+    response = client.get(url, headers={"If-None-Match": etag})
+    return response, len(query_counter)
+
+def test_category_catalog_revalidates_without_queries(client, database, query_counter, auth_headers):
+
+    first = client.get("/categories/")
+    etag = first.headers["ETag"]
+
+    response, queries = revalidate(client, query_counter, "/categories/", etag)
+    assert response.status_code == 304
+    assert queries == 0
+
+    created = client.post("/categories/", headers=auth_headers(ADMIN), json={"name": "Reciclaje urbano"})
+    assert created.status_code == 200, created.text
+
+    response, _ = revalidate(client, query_counter, "/categories/", etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "Reciclaje urbano" in [category["name"] for category in response.json()]
+
+def test_campaign_rewards_revalidate_from_a_version_query(client, database, query_counter, auth_headers):
+
+    with Session(database) as session:
+        campaign = Campaign(tittle="Con recompensas", description="Prueba", goal_amount=Decimal(100), user_id=1, workflow_state_id=5, campaign_state_id=2)
+        session.add(campaign)
+        session.commit()
+        rewards = [Reward(tittle=f"Recompensa {i}", amount=Decimal(10 * (i + 1)), campaign_id=campaign.id) for i in range(3)]
+        session.add_all(rewards)
+        session.commit()
+        campaign_id, reward_ids = campaign.id, [reward.id for reward in rewards]
+
+    url = f"/rewards/campaign/{campaign_id}"
+    etag = client.get(url).headers["ETag"]
+
+    # Solo la consulta de versión, sin leer las recompensas
+    response, queries = revalidate(client, query_counter, url, etag)
+    assert response.status_code == 304
+    assert queries == 1
+
+    headers = auth_headers(ADMIN)
+    for change in (
+        lambda: client.put(f"/rewards/{reward_ids[0]}", headers=headers, json={"stock": 5}),
+        lambda: client.delete(f"/rewards/{reward_ids[1]}", headers=headers)
+    ):
+        assert change().status_code == 200
+        response, _ = revalidate(client, query_counter, url, etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        etag = response.headers["ETag"]
+
+    assert [reward["stock"] for reward in response.json()] == [5, None]
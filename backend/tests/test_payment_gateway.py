@@ -0,0 +1,200 @@
+import asyncio
+from decimal import Decimal
+import httpx
+import pytest
+from sqlmodel import Session, select
+
+from app.core import metrics
+from app.core.config import settings
+from app.models.campaign import Campaign
+from app.models.donation import Donation
+from app.models.person import Person
+from app.services.payment_gateway import CircuitOpenError, GatewayClient, GatewayError, payment_gateway
+
+class FakeGateway:
+
+    def __init__(self, *outcomes):
+        # Cada resultado es un código HTTP o una excepción de httpx; el último se repite
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.delay = 0.0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("falla simulada", request=request)
+        if outcome == 201:
+            return httpx.Response(201, json={"id": f"pay-{self.calls}"})
+        return httpx.Response(outcome, json={})
+
+@pytest.fixture
+def gateway(monkeypatch):
+
+    monkeypatch.setattr(settings, "GATEWAY_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "GATEWAY_BREAKER_THRESHOLD", 3)
+    monkeypatch.setattr(settings, "GATEWAY_BREAKER_RESET_SECONDS", 30)
+
+    client = GatewayClient("http://gateway.test/payments")
+    client.backoffs = []
+
+    async def no_wait(attempt: int):
+        client.backoffs.append(attempt)
+
+    client._backoff = no_wait
+
+    def use(fake: FakeGateway) -> FakeGateway:
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+        return fake
+
+    client.use = use
+    yield client
+    # GatewayClient se registra con el mismo nombre que el cliente de la aplicación
+    metrics.register("payment_gateway", payment_gateway.stats)
+
+def pay(client: GatewayClient):
+    return asyncio.run(client.create_payment(Decimal("25.50")))
+
+def test_connect_errors_are_retried(gateway):
+
+    fake = gateway.use(FakeGateway(httpx.ConnectError, httpx.PoolTimeout, 201))
+
+    assert pay(gateway) == "pay-3"
+    assert fake.calls == 3
+    assert gateway.backoffs == [1, 2]
+    assert gateway.breaker.state == "closed"
+
+def test_connect_errors_give_up_after_max_retries(gateway):
+
+    fake = gateway.use(FakeGateway(httpx.ConnectError))
+
+    with pytest.raises(GatewayError):
+        pay(gateway)
+    assert fake.calls == settings.GATEWAY_MAX_RETRIES + 1
+
+@pytest.mark.parametrize("outcome", [httpx.ReadTimeout, httpx.RemoteProtocolError, 502])
+def test_errors_after_the_request_was_sent_are_not_retried(gateway, outcome):
+
+    fake = gateway.use(FakeGateway(outcome, 201))
+
+    with pytest.raises(GatewayError):
+        pay(gateway)
+    assert fake.calls == 1
+    assert gateway.backoffs == []
+
+def test_response_without_payment_is_an_error(gateway):
+
+    gateway.use(FakeGateway(400))
+
+    with pytest.raises(GatewayError):
+        pay(gateway)
+    # El gateway respondió: no cuenta como caída para el circuito
+    assert gateway.breaker.state == "closed"
+
+def test_breaker_opens_and_fails_fast(gateway):
+
+    fake = gateway.use(FakeGateway(503))
+
+    for _ in range(settings.GATEWAY_BREAKER_THRESHOLD):
+        with pytest.raises(GatewayError):
+            pay(gateway)
+    assert gateway.breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        pay(gateway)
+    assert fake.calls == settings.GATEWAY_BREAKER_THRESHOLD
+    assert gateway.stats()["rejected_open_circuit"] == 1
+    assert gateway.stats()["circuit_opened"] == 1
+
+def test_half_open_lets_a_single_trial_through(gateway):
+
+    gateway.use(FakeGateway(503))
+    for _ in range(settings.GATEWAY_BREAKER_THRESHOLD):
+        with pytest.raises(GatewayError):
+            pay(gateway)
+
+    fake = gateway.use(FakeGateway(201))
+    fake.delay = 0.05
+    gateway.breaker.opened_at -= settings.GATEWAY_BREAKER_RESET_SECONDS
+
+    async def concurrent():
+        return await asyncio.gather(*[gateway.create_payment(Decimal(10)) for _ in range(5)], return_exceptions=True)
+
+    results = asyncio.run(concurrent())
+
+    assert fake.calls == 1
+    assert sum(isinstance(r, str) for r in results) == 1
+    assert sum(isinstance(r, CircuitOpenError) for r in results) == 4
+    assert gateway.breaker.state == "closed"
+    assert pay(gateway) == "pay-2"
+
+def test_failed_trial_reopens_the_breaker(gateway):
+
+    fake = gateway.use(FakeGateway(503))
+    for _ in range(settings.GATEWAY_BREAKER_THRESHOLD):
+        with pytest.raises(GatewayError):
+            pay(gateway)
+
+    gateway.breaker.opened_at -= settings.GATEWAY_BREAKER_RESET_SECONDS
+    with pytest.raises(GatewayError):
+        pay(gateway)
+
+    assert gateway.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        pay(gateway)
+    assert fake.calls == settings.GATEWAY_BREAKER_THRESHOLD + 1
+
+def test_latency_and_errors_are_recorded(gateway):
+
+    gateway.use(FakeGateway(httpx.ConnectError, 201, 500, 201))
+
+    assert pay(gateway) == "pay-2"
+    with pytest.raises(GatewayError):
+        pay(gateway)
+    assert pay(gateway) == "pay-4"
+
+    stats = gateway.stats()
+    assert stats["requests"] == 4
+    assert stats["errors"] == 2
+    assert stats["error_rate"] == 0.5
+    assert stats["retries"] == 1
+    assert stats["latency"]["count"] == 4
+    assert metrics.snapshot()["payment_gateway"] == stats
+
+@pytest.mark.parametrize("error", [CircuitOpenError, GatewayError])
+def test_donation_is_not_recorded_when_the_gateway_fails(client, database, auth_headers, monkeypatch, error):
+
+    with Session(database) as session:
+        owner = Person(first_name="Dueña", last_name="Campaña", email="duena@riseup.com", password="x", is_active=True)
+        session.add(owner)
+        session.commit()
+        campaign = Campaign(
+            tittle="Campaña abierta",
+            description="Recibe donaciones",
+            goal_amount=Decimal(1000),
+            user_id=owner.id,
+            workflow_state_id=5,
+            campaign_state_id=2
+        )
+        session.add(campaign)
+        session.commit()
+        campaign_id = campaign.id
+
+    async def failing(amount):
+        raise error("gateway caído")
+
+    monkeypatch.setattr(payment_gateway, "create_payment", failing)
+
+    response = client.post(
+        "/donations/",
+        headers=auth_headers("admin@riseup.com"),
+        json={"campaign_id": campaign_id, "amount": 50, "payment_method_id": 1}
+    )
+
+    assert response.status_code == 503
+    with Session(database) as session:
+        assert session.exec(select(Donation)).all() == []
+        assert session.get(Campaign, campaign_id).current_amount == 0
@@ -0,0 +1,150 @@
+from datetime import date
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.campaign import Campaign
+from app.models.category_requirement import CategoryRequirement
+from app.models.donation import Donation
+from app.models.favorite import Favorite
+from app.models.reward import Reward
+from app.models.reward_claim import RewardClaim
+from app.services.campaign_cards import PUBLISHED_IN_PROGRESS, card_statement
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="Los planes de ejecución solo se verifican contra Postgres (TEST_DATABASE_URL)"
+)
+
+# Volumen parecido al de producción: las campañas publicadas y en curso son una minoría
+SEED = [
+    """
+    INSERT INTO person (first_name, last_name, email, password, is_active, role_id, created_at, updated_at)
+    SELECT 'Nombre', 'Apellido', 'usuario' || g || '@riseup.test', 'x', true, 2, now(), now()
+    FROM generate_series(1, 5000) g
+    """,
+    """
+    INSERT INTO category (name)
+    SELECT 'Categoría ' || g FROM generate_series(1, 500) g
+    """,
+    """
+    INSERT INTO category_requirements (requirement_name, is_required, order_index, requirements_type_id, category_id)
+    SELECT 'Requisito ' || g, true, g % 6, 1, 1 + g % 500
+    FROM generate_series(1, 3000) g
+    """,
+    """
+    INSERT INTO campaign (
+        tittle, description, goal_amount, current_amount, view_counting, favorites_counting,
+        created_at, updated_at, expiration_date, workflow_state_id, campaign_state_id, user_id, category_id
+    )
+    SELECT
+        'Campaña ' || g, 'Descripción', 10000, g % 9000, (g * 7) % 10000, (g * 13) % 5000,
+        now() - g * interval '1 minute', now(),
+        CASE WHEN g % 100 = 1 THEN current_date - 1 ELSE current_date + g % 365 END,
+        CASE WHEN g % 20 = 0 THEN 5 ELSE 1 + g % 4 END,
+        CASE WHEN g % 20 = 0 THEN 2 ELSE 1 + (g / 7) % 4 END,
+        1 + g % 5000,
+        1 + g % 500
+    FROM generate_series(1, 50000) g
+    """,
+    """
+    INSERT INTO donation (amount, donation_state_id, user_id, campaign_id, payment_method_id, gateway_payment_id, created_at)
+    SELECT
+        1 + g % 500, 1 + g % 4, 1 + g % 5000, 1 + g % 50000, 1,
+        CASE WHEN g % 2 = 0 THEN 'pay-' || g END,
+        now() - g * interval '1 second'
+    FROM generate_series(1, 200000) g
+    """,
+    """
+    INSERT INTO favorite (user_id, campaign_id, created_at)
+    SELECT 1 + g % 5000, 1 + (g * 7) % 50000, now()
+    FROM generate_series(1, 100000) g
+    """,
+    """
+    INSERT INTO reward (tittle, amount, campaign_id, created_ad)
+    SELECT 'Recompensa ' || g, 10 + g % 100, 1 + g % 50000, now()
+    FROM generate_series(1, 100000) g
+    """,
+    """
+    INSERT INTO reward_claim (user_id, reward_id, campaign_id, claimed_at)
+    SELECT 1 + g % 5000, 1 + g % 100000, 1 + g % 50000, now()
+    FROM generate_series(1, 50000) g
+    """
+]
+
+def hot_queries():
+
+    return [
+        ("rieles destacados", "idx_campaign_published_favorites", card_statement(*PUBLISHED_IN_PROGRESS).order_by(
+            Campaign.favorites_counting.desc()
+        ).limit(6)),
+        ("rieles populares", "idx_campaign_published_views", card_statement(*PUBLISHED_IN_PROGRESS).order_by(
+            Campaign.view_counting.desc()
+        ).limit(6)),
+        ("listado reciente", "idx_campaign_published_recent", card_statement(*PUBLISHED_IN_PROGRESS).order_by(
+            Campaign.created_at.desc(), Campaign.id.desc()
+        ).limit(9)),
+        ("listado por categoría", "idx_campaign_published_category", card_statement(
+            *PUBLISHED_IN_PROGRESS, Campaign.category_id == 1
+        ).order_by(Campaign.id.desc()).limit(9)),
+        ("mis campañas", "idx_campaign_user", select(Campaign).where(Campaign.user_id == 1)),
+        ("campañas vencidas", "idx_campaign_expiring", select(Campaign.id).where(
+            Campaign.campaign_state_id == 2,
+            Campaign.expiration_date < date.today()
+        ).order_by(Campaign.id).limit(500)),
+        ("mejores donantes", "idx_donation_campaign_state_amount", select(Donation.amount).where(
+            Donation.campaign_id == 20,
+            Donation.donation_state_id == 2
+        ).order_by(Donation.amount.desc()).limit(5)),
+        ("confirmación del gateway", "idx_donation_gateway_payment", select(Donation.id).where(
+            Donation.gateway_payment_id == "pay-100"
+        )),
+        ("mis donaciones", "idx_donation_user_created", select(Donation).where(
+            Donation.user_id == 1
+        ).order_by(Donation.created_at.desc())),
+        ("estado de favoritos", "idx_favorite_user_campaign", select(Favorite.campaign_id).where(
+            Favorite.user_id == 1,
+            Favorite.campaign_id.in_([1, 2, 3])
+        )),
+        ("recompensas de campaña", "idx_reward_campaign_amount", select(Reward).where(
+            Reward.campaign_id == 20
+        ).order_by(Reward.amount)),
+        ("recompensas reclamadas", "idx_reward_claim_campaign_user", select(RewardClaim.reward_id).where(
+            RewardClaim.campaign_id == 20,
+            RewardClaim.user_id == 1
+        )),
+        ("requisitos de categoría", "idx_category_requirements_category", select(CategoryRequirement).where(
+            CategoryRequirement.category_id == 1
+        ))
+    ]
+
+def plan_nodes(plan: dict):
+
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+def test_hot_queries_use_their_indexes(database):
+
+    with Session(database) as session:
+        connection = session.connection()
+        for statement in SEED:
+            connection.execute(text(statement))
+        session.commit()
+
+        connection = session.connection()
+        connection.execute(text("ANALYZE"))
+
+        failures = []
+        for name, index, statement in hot_queries():
+            compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+            result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+            nodes = list(plan_nodes(result.scalar()[0]["Plan"]))
+
+            used = {node.get("Index Name") for node in nodes}
+            seq_scans = {node.get("Relation Name") for node in nodes if node["Node Type"] == "Seq Scan"}
+            if index not in used:
+                failures.append(f"{name}: no usa {index} (índices: {sorted(filter(None, used))}, seq scans: {sorted(seq_scans)})")
+
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,34 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from app.services import view_counter as view_counter_module
+from app.services.view_counter import ViewCounter
+
+def test_cancelled_flush_keeps_pending_views(monkeypatch):
+
+    started = asyncio.Event()
+
+    class HangingEngine:
+
+        @asynccontextmanager
+        async def begin(self):
+            started.set()
+            await asyncio.sleep(3600)
+            yield
+
+    monkeypatch.setattr(view_counter_module, "async_engine", HangingEngine())
+
+    async def scenario():
+        counter = ViewCounter()
+        counter.increment(1)
+        counter.increment(1)
+        counter.increment(2)
+
+        flush = asyncio.create_task(counter.flush())
+        await started.wait()
+        flush.cancel()
+        await asyncio.gather(flush, return_exceptions=True)
+
+        return counter.pending(1), counter.pending(2)
+
+    assert asyncio.run(scenario()) == (2, 1)
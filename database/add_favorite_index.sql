@@ -0,0 +1,4 @@
+-- Índice compuesto para consultar el estado de favorito de varias campañas a la vez
+-- (POST /favorites/check e include_favorite_state en los listados públicos)
+
+CREATE INDEX IF NOT EXISTS idx_favorite_user_campaign ON favorite (user_id, campaign_id);
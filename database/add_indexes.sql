@@ -0,0 +1,19 @@
+-- Índices de las consultas frecuentes
+-- Deben coincidir con los __table_args__ de los modelos en backend/app/models
+-- Los parciales cubren solo campañas publicadas y en curso (workflow 5, estado 2)
+-- CONCURRENTLY no bloquea escrituras; ejecutar con psql fuera de una transacción (sin -1)
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_published_favorites ON campaign (favorites_counting, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_published_views ON campaign (view_counting, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_published_recent ON campaign (created_at, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_published_category ON campaign (category_id, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_user ON campaign (user_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_expiring ON campaign (expiration_date) WHERE campaign_state_id = 2;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_observations_campaign ON campaign_observations (campaign_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_requirement_response_campaign ON campaign_requirement_response (campaign_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_category_requirements_category ON category_requirements (category_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_donation_campaign_state_amount ON donation (campaign_id, donation_state_id, amount);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_donation_gateway_payment ON donation (gateway_payment_id) WHERE gateway_payment_id IS NOT NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_donation_user_created ON donation (user_id, created_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reward_campaign_amount ON reward (campaign_id, amount);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reward_claim_campaign_user ON reward_claim (campaign_id, user_id);
@@ -0,0 +1,10 @@
+-- Registro de intentos para el limitador de peticiones (RATE_LIMIT_BACKEND=postgres)
+-- Permite que varios workers compartan las ventanas de login, registro y reenvío de verificación
+
+CREATE TABLE IF NOT EXISTS rate_limit_event (
+    id SERIAL PRIMARY KEY,
+    key VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_event_key_created ON rate_limit_event (key, created_at);
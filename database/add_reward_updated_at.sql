@@ -0,0 +1,4 @@
+-- Marca de versión de las recompensas: GET /rewards/campaign/{id} arma su ETag
+-- con count(id) y max(updated_at) sin leer ni serializar las filas
+
+ALTER TABLE reward ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
@@ -0,0 +1,22 @@
+-- Búsqueda de texto completo para campañas
+-- Configuración en español que además ignora acentos (unaccent)
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'es_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION es_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+
+-- Índice GIN sobre título (A), descripción (B) y contenido enriquecido (C).
+-- La expresión debe coincidir con app/services/campaign_search.py
+CREATE INDEX IF NOT EXISTS idx_campaign_search ON campaign USING GIN ((
+    setweight(to_tsvector('es_unaccent'::regconfig, coalesce(tittle, '')), 'A'::"char") ||
+    setweight(to_tsvector('es_unaccent'::regconfig, coalesce(description, '')), 'B'::"char") ||
+    setweight(to_tsvector('es_unaccent'::regconfig, coalesce(rich_text, '')), 'C'::"char")
+));
@@ -93,6 +93,8 @@ CREATE TABLE IF NOT EXISTS favorite (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_favorite_user_campaign ON favorite (user_id, campaign_id);
+
 CREATE TABLE IF NOT EXISTS donation_state (
     id SERIAL PRIMARY KEY,
     name VARCHAR(100)
@@ -122,7 +124,8 @@ CREATE TABLE IF NOT EXISTS reward (
     stock INT,
     campaign_id INT REFERENCES campaign(id),
     image_url VARCHAR(500),
-    created_ad TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_ad TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE IF NOT EXISTS campaign_requirement_response (
@@ -144,6 +147,71 @@ CREATE TABLE IF NOT EXISTS reward_claim (
     UNIQUE(user_id, reward_id)
 );
 
+-- Registro de intentos para el limitador de peticiones (RATE_LIMIT_BACKEND=postgres)
+CREATE TABLE IF NOT EXISTS rate_limit_event (
+    id SERIAL PRIMARY KEY,
+    key VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_event_key_created ON rate_limit_event (key, created_at);
+
+-- Cola persistente de correos salientes (ver app/services/email_outbox.py)
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id SERIAL PRIMARY KEY,
+    to_email VARCHAR(255) NOT NULL,
+    subject VARCHAR(255) NOT NULL,
+    html_content TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    last_error VARCHAR(500),
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_email_outbox_pending ON email_outbox (status, next_attempt_at);
+
+-- Índices de las consultas frecuentes (ver add_indexes.sql)
+-- Los parciales cubren solo campañas publicadas y en curso (workflow 5, estado 2)
+CREATE INDEX IF NOT EXISTS idx_campaign_published_favorites ON campaign (favorites_counting, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX IF NOT EXISTS idx_campaign_published_views ON campaign (view_counting, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX IF NOT EXISTS idx_campaign_published_recent ON campaign (created_at, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX IF NOT EXISTS idx_campaign_published_category ON campaign (category_id, id) WHERE workflow_state_id = 5 AND campaign_state_id = 2;
+CREATE INDEX IF NOT EXISTS idx_campaign_user ON campaign (user_id);
+CREATE INDEX IF NOT EXISTS idx_campaign_expiring ON campaign (expiration_date) WHERE campaign_state_id = 2;
+CREATE INDEX IF NOT EXISTS idx_campaign_observations_campaign ON campaign_observations (campaign_id);
+CREATE INDEX IF NOT EXISTS idx_campaign_requirement_response_campaign ON campaign_requirement_response (campaign_id);
+CREATE INDEX IF NOT EXISTS idx_category_requirements_category ON category_requirements (category_id);
+CREATE INDEX IF NOT EXISTS idx_donation_campaign_state_amount ON donation (campaign_id, donation_state_id, amount);
+CREATE INDEX IF NOT EXISTS idx_donation_gateway_payment ON donation (gateway_payment_id) WHERE gateway_payment_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_donation_user_created ON donation (user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_reward_campaign_amount ON reward (campaign_id, amount);
+CREATE INDEX IF NOT EXISTS idx_reward_claim_campaign_user ON reward_claim (campaign_id, user_id);
+
+-- Búsqueda de texto completo para campañas (ver add_search.sql)
+-- Configuración en español que además ignora acentos (unaccent)
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'es_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION es_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+
+-- Índice GIN sobre título (A), descripción (B) y contenido enriquecido (C).
+-- La expresión debe coincidir con app/services/campaign_search.py
+CREATE INDEX IF NOT EXISTS idx_campaign_search ON campaign USING GIN ((
+    setweight(to_tsvector('es_unaccent'::regconfig, coalesce(tittle, '')), 'A'::"char") ||
+    setweight(to_tsvector('es_unaccent'::regconfig, coalesce(description, '')), 'B'::"char") ||
+    setweight(to_tsvector('es_unaccent'::regconfig, coalesce(rich_text, '')), 'C'::"char")
+));
+
 -- Insertar datos iniciales
 
 -- Roles